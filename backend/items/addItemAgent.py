@@ -1,28 +1,34 @@
 import os
 from dotenv import load_dotenv
 
-load_dotenv()  # Loads .env before any langchain/langgraph import
-from typing import Annotated
+load_dotenv()  # Loads .env before any langchain import
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
-from typing_extensions import TypedDict
-from langchain_core.tools import tool
-
-from langgraph.prebuilt import ToolNode
-from langgraph.graph import StateGraph, START, END
-from langgraph.graph.message import add_messages
-from langgraph.checkpoint.memory import MemorySaver
 from langchain_openai import ChatOpenAI
 
-from typing import Dict, Any
+from typing import Dict, Any, List
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextvars import copy_context
 import httpx
+import time
+from openai import DefaultHttpxClient
 import logging
 import logging.config
 from django.middleware.csrf import get_token
 from django.http import HttpRequest
+from django.core.exceptions import ValidationError
+from .models import OwnedItem, ItemType, ItemStatus
 from .services import ItemService
+from .schemas import OwnedItemCreateSchema
+from .fast_path import try_fast_path
+from .agent_cache import prompt_cache
+from . import agent_metrics
+from .agent_metrics import AgentRunMetrics
 from django.contrib.auth import get_user_model
 import jwt
 import json
+from datetime import date, datetime
+from pydantic import BaseModel, ValidationError as PydanticValidationError
 
 
 prod = os.getenv("PROD", "false").lower() == "true"
@@ -87,351 +93,553 @@ SYSTEM_INSTRUCTIONS_PATH = os.path.join(
     os.path.dirname(__file__), "add_item_system_instructions.txt"
 )
 
-GRAPH_PATH = os.path.join(os.path.dirname(__file__), "graph_output.png")
+DEFAULT_SYSTEM_INSTRUCTIONS = "You are an AI agent that helps create items. Extract item information from user prompts and create JSON objects."
+
+
+def load_system_instructions() -> str:
+    """Read the agent system prompt from disk, falling back to a default prompt."""
+    try:
+        with open(SYSTEM_INSTRUCTIONS_PATH, "r", encoding="utf-8") as f:
+            system_instructions = f.read()
+        log.info(
+            f"System instructions loaded successfully ({len(system_instructions)} characters)"
+        )
+        return system_instructions
+    except FileNotFoundError:
+        log.warning("System instructions file not found, using default instructions")
+        return DEFAULT_SYSTEM_INSTRUCTIONS
+
+
+# Loaded once at startup and shared by every agent run
+SYSTEM_INSTRUCTIONS = load_system_instructions()
+
+BATCH_STRATEGIES = ("sequential", "concurrent", "combined")
 
+# Upper bound on parallel LLM calls for one concurrent batch
+MAX_CONCURRENCY = int(os.getenv("AGENT_MAX_CONCURRENCY", "4"))
 
-class State(TypedDict):
-    messages: Annotated[list, add_messages]
-    item_json: Dict[str, Any]
-    batch_prompts: Dict[str, str]  # key: identifier, value: prompt
-    current_key: str  # current key being processed
-    processed_keys: list[str]  # optional: track processed keys
+# Completion budget for a single request that returns a whole batch of items
+COMBINED_MAX_COMPLETION_TOKENS = 2000
 
 
-# Tool node: Create item directly in database without HTTP requests
-def create_item_directly(user_id: str, item_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Create item directly in database using Django service layer"""
-    log.info(f"Creating item directly in database for user: {user_id}")
-    log.debug(f"Item data: {item_data}")
+def item_fields_from_json(item_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map the item JSON produced by the LLM to OwnedItem fields, with defaults."""
+    return {
+        "name": item_data.get("name"),
+        "picture_url": item_data.get("picture_url", "📦"),  # Default emoji
+        "item_type": item_data.get("item_type", "Other"),
+        "status": item_data.get("status", "Keep"),
+        "item_received_date": item_data.get("item_received_date"),
+        "last_used": item_data.get("last_used"),
+        "ownership_duration_goal_months": item_data.get(
+            "ownership_duration_goal_months", 12
+        ),
+    }
+
+
+def user_id_from_token(auth_token: str) -> str:
+    """Extract the Clerk user id ('sub' claim) from a request JWT."""
+    if not auth_token:
+        log.error("No authentication token provided")
+        raise ValueError("Authentication token is required for item creation")
 
     try:
-        # Get the user model
-        User = get_user_model()
-        user = User.objects.get(clerk_id=user_id)
-        log.debug(f"Found user: {user.email}")
-
-        # Create the item using the service layer
-        item = ItemService.create_item(
-            user=user,
-            name=item_data.get("name"),
-            picture_url=item_data.get(
-                "picture_url", "📦"
-            ),  # Default emoji if not provided
-            item_type=item_data.get("item_type", "Other"),
-            status=item_data.get("status", "Keep"),
-            item_received_date=item_data.get("item_received_date"),
-            last_used=item_data.get("last_used"),
-            ownership_duration_goal_months=item_data.get(
-                "ownership_duration_goal_months", 12
-            ),
-        )
+        # Decode the JWT token without verification (since we trust it from the calling context)
+        # In production, you might want to verify the token properly
+        decoded_token = jwt.decode(auth_token, options={"verify_signature": False})
+    except jwt.DecodeError as e:
+        log.error(f"JWT decode error: {str(e)}")
+        raise ValueError(f"Invalid authentication token: {str(e)}")
 
-        log.info(f"Item created successfully with ID: {item.id}")
-        log.debug(
-            f"Created item: {item.name} (Type: {item.item_type}, Status: {item.status})"
-        )
+    user_id = decoded_token.get("sub")  # 'sub' typically contains the user ID in JWT
+    if not user_id:
+        log.error("No user ID found in JWT token")
+        raise ValueError("Invalid authentication token: no user ID found")
+
+    log.info(f"Extracted user ID from JWT: {user_id}")
+    return user_id
 
-        # Return the item data in the same format as the API would
-        return {
-            "result": {
-                "id": str(item.id),
-                "name": item.name,
-                "picture_url": item.picture_url,
-                "item_type": item.item_type,
-                "status": item.status,
-                "item_received_date": (item.item_received_date),
-                "last_used": item.last_used,
-                "user": str(item.user.id),
-            }
-        }
 
+def resolve_agent_user(jwt_token: str = None, user=None):
+    """
+    Return the user an agent run acts for. Callers that already authenticated
+    the request pass the user; otherwise it is looked up from the JWT once.
+    """
+    if user is not None:
+        return user
+
+    user_id = user_id_from_token(jwt_token)
+    User = get_user_model()
+    try:
+        return User.objects.get(clerk_id=user_id)
     except User.DoesNotExist:
         log.error(f"User with clerk_id {user_id} not found")
         raise ValueError(f"User with clerk_id {user_id} not found")
-    except Exception as e:
-        log.error(f"Error creating item directly: {type(e).__name__} - {str(e)}")
-        raise
 
 
-def route_tools(state: State):
+def validate_item_json(item_json: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Route to the ToolNode if there are more prompts to process, else END.
+    Validate item JSON produced by the LLM against OwnedItemCreateSchema
+    before it reaches the database. Returns typed OwnedItem field values;
+    raises ValueError with a short description of every invalid field.
     """
-    batch_prompts = state.get("batch_prompts", {})
-    current_key = state.get("current_key")
-    processed_keys = state.get("processed_keys", [])
-    keys = list(batch_prompts.keys())
-
-    log.debug(
-        f"Routing tools - Current key: {current_key}, Processed: {processed_keys}, Total keys: {keys}"
-    )
+    if not isinstance(item_json, dict):
+        raise ValueError("Invalid item: expected a JSON object")
 
-    # If all keys processed, end
-    if not keys or set(keys) == set(processed_keys):
-        log.info("All keys processed, routing to END")
-        return END
-    # If last message has tool calls, go to tool node
-    messages = state.get("messages", [])
-    ai_message = messages[-1] if messages else None
-    if hasattr(ai_message, "tool_calls") and len(ai_message.tool_calls) > 0:
-        log.info(
-            f"Tool calls detected, routing to tools. Tool calls: {len(ai_message.tool_calls)}"
+    try:
+        data = OwnedItemCreateSchema.model_validate(item_fields_from_json(item_json))
+    except PydanticValidationError as e:
+        problems = "; ".join(
+            f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            for error in e.errors()
         )
-        return "tools"
-    log.info("No tool calls detected, routing to END")
-    return END
+        raise ValueError(f"Invalid item: {problems}")
+    return data.model_dump()
+
+
+# The chat model is bound to this tool schema, but the tool is never executed:
+# its calls are read as item plans and inserted by insert_planned_items
+CREATE_ITEM_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "create_item",
+        "description": "Create a new item",
+        "parameters": {
+            "type": "object",
+            "properties": {"item_json": {"type": "object"}},
+            "required": ["item_json"],
+        },
+    },
+}
+
 
+def metered_http_client():
+    """HTTP client that counts every OpenAI request attempt, retries included."""
+    return DefaultHttpxClient(
+        event_hooks={"request": [agent_metrics.count_http_request]}
+    )
 
-def create_item_tool(api_url: str, auth_token: str = None):
-    """Tool to create an item via direct database access"""
 
-    @tool
-    def create_item(item_json: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a new item by directly accessing the database"""
-        log.info("Creating item via direct database access")
-        log.debug(f"Item JSON data: {item_json}")
-        log.debug(f"Auth token provided: {'Yes' if auth_token else 'No'}")
+@lru_cache(maxsize=1)
+def get_llm_with_tools():
+    """Build the tool-bound chat model once per process."""
+    log.info("Initializing LLM with tools...")
+    llm_with_tools = ChatOpenAI(
+        model="gpt-4.1",
+        temperature=1,
+        request_timeout=120,
+        max_completion_tokens=200,
+        max_retries=3,
+        http_client=metered_http_client(),
+    ).bind_tools([CREATE_ITEM_TOOL])
+    log.info("LLM with tools initialized successfully")
+    return llm_with_tools
 
-        if not auth_token:
-            log.error("No authentication token provided")
-            raise ValueError("Authentication token is required for item creation")
 
-        try:
-            # Extract user ID from JWT token
-            log.debug("Decoding JWT token to extract user ID...")
-            # Decode the JWT token without verification (since we trust it from the calling context)
-            # In production, you might want to verify the token properly
-            decoded_token = jwt.decode(auth_token, options={"verify_signature": False})
-            user_id = decoded_token.get(
-                "sub"
-            )  # 'sub' typically contains the user ID in JWT
-
-            if not user_id:
-                log.error("No user ID found in JWT token")
-                raise ValueError("Invalid authentication token: no user ID found")
-
-            log.info(f"Extracted user ID from JWT: {user_id}")
-
-            # Create item directly in database
-            result = create_item_directly(user_id, item_json)
-            log.info("Item created successfully via direct database access")
-
-            return result
-
-        except jwt.DecodeError as e:
-            log.error(f"JWT decode error: {str(e)}")
-            raise ValueError(f"Invalid authentication token: {str(e)}")
-        except Exception as e:
-            log.error(
-                f"Error creating item via direct access: {type(e).__name__} - {str(e)}"
-            )
-            raise
+def plan_items_for_prompt(
+    prompt: str, llm=None, fast_path: bool = True, today: date = None
+) -> List[Dict[str, Any]]:
+    """
+    Ask the LLM for the create_item tool calls of one prompt without running them.
+    Returns the item_json argument of each tool call. Simple prompts are
+    answered by the rule-based fast path without an LLM call. With today, the
+    model is told the reference date, so relative dates ("2 years ago")
+    resolve against it.
+    """
+    if fast_path:
+        item_json = try_fast_path(prompt)
+        if item_json is not None:
+            agent_metrics.record(fast_path_hits=1)
+            return [item_json]
+
+    system_instructions = SYSTEM_INSTRUCTIONS
+    if today is not None:
+        system_instructions += f"\nToday's date is {today.isoformat()}."
+    messages = [SystemMessage(content=system_instructions), HumanMessage(content=prompt)]
+    start = time.perf_counter()
+    response = (llm or get_llm_with_tools()).invoke(messages)
+    agent_metrics.record_llm_call(time.perf_counter() - start, response)
+
+    tool_calls = [
+        call
+        for call in (getattr(response, "tool_calls", None) or [])
+        if call["name"] == CREATE_ITEM_TOOL["function"]["name"]
+    ]
+    if not tool_calls:
+        raise ValueError("The model did not return a create_item tool call")
+    return [call["args"].get("item_json", {}) for call in tool_calls]
+
+
+COMBINED_BATCH_INSTRUCTIONS = """
+You will receive several item prompts at once as a JSON object mapping a key to a prompt.
+Return exactly one item per key in "items", copying each key into the item's "key" field.
+Do not call create_item; return the items directly.
+"""
+
+
+class AgentItem(BaseModel):
+    key: str
+    name: str
+    picture_url: str = "🤔"
+    item_type: ItemType
+    status: ItemStatus = ItemStatus.KEEP
+    item_received_date: datetime
+    last_used: datetime
+    ownership_duration_goal_months: int = 12
+
+
+class AgentItemBatch(BaseModel):
+    items: List[AgentItem]
+
+
+@lru_cache(maxsize=1)
+def get_structured_llm():
+    """Build the chat model used for single-request (combined) batches once per process."""
+    return ChatOpenAI(
+        model="gpt-4.1",
+        temperature=1,
+        request_timeout=120,
+        max_completion_tokens=COMBINED_MAX_COMPLETION_TOKENS,
+        max_retries=3,
+        http_client=metered_http_client(),
+    )
 
-    return create_item
 
+def plan_concurrent(
+    batch_prompts: dict,
+    llm=None,
+    max_concurrency: int = None,
+    progress_callback=None,
+    fast_path: bool = True,
+):
+    """
+    Send every prompt to the LLM in parallel, bounded by max_concurrency.
+    Returns (planned, errors): {key: [item_json, ...]} and {key: error message}.
+    progress_callback(completed, total) is called on this thread as prompts finish.
+    """
+    keys = list(batch_prompts.keys())
+    max_workers = max(1, min(max_concurrency or MAX_CONCURRENCY, len(keys)))
+    log.info(f"Planning {len(keys)} prompts concurrently with {max_workers} workers")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Each task runs in a copy of this context so it records into the run's metrics
+        keys_by_future = {
+            executor.submit(
+                copy_context().run,
+                plan_items_for_prompt,
+                batch_prompts[key],
+                llm,
+                fast_path,
+            ): key
+            for key in keys
+        }
 
-global llm_with_tools
+        planned, errors = {}, {}
+        for completed, future in enumerate(as_completed(keys_by_future), start=1):
+            key = keys_by_future[future]
+            try:
+                planned[key] = future.result()
+            except Exception as e:
+                log.error(f"Error planning key {key}: {type(e).__name__} - {str(e)}")
+                errors[key] = str(e)
+            if progress_callback:
+                progress_callback(completed, len(keys))
 
+    return planned, errors
 
-def chatbot(state: State):
-    # Only use the prompt for the current key
-    batch_prompts = state.get("batch_prompts", {})
-    current_key = state.get("current_key")
-    system_message = state["messages"][0]  # assume system message is first
-    prompt = batch_prompts.get(current_key, "")
 
-    log.info(f"Chatbot processing key: {current_key}")
-    log.debug(f"Prompt length: {len(prompt)} characters")
-    log.debug(
-        f"Prompt preview: {prompt[:100]}..."
-        if len(prompt) > 100
-        else f"Full prompt: {prompt}"
+def plan_combined(batch_prompts: dict, llm=None):
+    """
+    Ask for every item in a single structured-output request, so the system
+    prompt is paid for once per batch instead of once per prompt.
+    Returns (planned, invalid_keys); invalid_keys holds the keys whose item was
+    missing, duplicated or unusable, or every key when the response as a whole
+    failed validation.
+    """
+    keys = list(batch_prompts.keys())
+    messages = [
+        SystemMessage(content=SYSTEM_INSTRUCTIONS + COMBINED_BATCH_INSTRUCTIONS),
+        HumanMessage(content=json.dumps(batch_prompts, ensure_ascii=False)),
+    ]
+    structured_llm = (llm or get_structured_llm()).with_structured_output(
+        AgentItemBatch, method="function_calling", include_raw=True
     )
 
-    # Replace user message with only the current prompt
-    messages = [system_message, HumanMessage(content=prompt)]
+    try:
+        start = time.perf_counter()
+        output = structured_llm.invoke(messages)
+        agent_metrics.record_llm_call(time.perf_counter() - start, output.get("raw"))
+        if output.get("parsing_error"):
+            raise output["parsing_error"]
+        response = output.get("parsed")
+        if not isinstance(response, AgentItemBatch):
+            response = AgentItemBatch.model_validate(response)
+    except Exception as e:
+        log.warning(f"Combined batch response failed validation: {e}")
+        return {}, keys
+
+    items_by_key = {}
+    for item in response.items:
+        items_by_key.setdefault(item.key, []).append(item)
+
+    planned, invalid_keys = {}, []
+    for key in keys:
+        items = items_by_key.get(key, [])
+        if len(items) != 1:
+            invalid_keys.append(key)
+            continue
+        planned[key] = [items[0].model_dump(exclude={"key"})]
+
+    if invalid_keys:
+        log.warning(f"Combined batch response invalid for keys: {invalid_keys}")
+    return planned, invalid_keys
+
+
+def insert_planned_items(user, planned: dict, results: dict):
+    """
+    Validate every planned item and insert the valid ones in one bulk insert.
+    Writes a per-key entry into results for created and failed keys.
+    """
+    items_to_create = []  # (key, OwnedItem) pairs ready for insertion
+    for key, item_jsons in planned.items():
+        try:
+            items = []
+            for item_json in item_jsons:
+                item = OwnedItem(user=user, **validate_item_json(item_json))
+                item.full_clean(exclude=["user"], validate_unique=False)
+                items.append(item)
+            items_to_create.extend((key, item) for item in items)
+        except ValueError as e:
+            log.warning(f"Invalid item for key {key}: {e}")
+            results[key] = {"status": "failed", "error": str(e)}
+        except ValidationError as e:
+            log.warning(f"Invalid item for key {key}: {e}")
+            results[key] = {"status": "failed", "error": f"Invalid item: {e}"}
+
+    if not items_to_create:
+        return
 
-    log.info("Invoking LLM with tools...")
     try:
-        response = llm_with_tools.invoke(messages)
-        log.info("LLM response received successfully")
-        log.debug(f"Response type: {type(response).__name__}")
-        if hasattr(response, "tool_calls"):
-            log.debug(
-                f"Tool calls in response: {len(response.tool_calls) if response.tool_calls else 0}"
+        with agent_metrics.timed_db():
+            created = ItemService.bulk_create_items(
+                user, [item for _, item in items_to_create]
             )
-        return {"messages": [response]}
-    except Exception as e:
-        log.error(f"Error invoking LLM: {type(e).__name__} - {str(e)}")
-        raise
+    except ValidationError as e:
+        log.warning(f"Batch insert rejected: {e}")
+        for key, _ in items_to_create:
+            results[key] = {"status": "failed", "error": " ".join(e.messages)}
+        return
+
+    for (key, _), item in zip(items_to_create, created):
+        entry = results.setdefault(key, {"status": "created", "item_ids": []})
+        entry["item_ids"].append(str(item.id))
+
+
+def run_planned_batch(
+    batch_prompts: dict,
+    jwt_token: str,
+    strategy: str,
+    llm=None,
+    max_concurrency: int = None,
+    progress_callback=None,
+    fast_path: bool = True,
+    user=None,
+):
+    """
+    Process a batch by planning all items up front, then validating and
+    inserting them together. Only the LLM calls run in worker threads; all
+    database work stays on the calling thread. Failures are reported per key
+    instead of aborting the batch.
+
+    strategy="concurrent" sends one LLM request per prompt in parallel.
+    strategy="combined" sends a single request for the whole batch and falls
+    back to per-prompt requests for any key whose combined item was invalid.
+    Prompts found in the prompt cache or understood by the fast path never
+    reach the LLM.
+    """
+    keys = list(batch_prompts.keys())
+    log.info(f"Running {strategy} batch with {len(keys)} prompts")
+
+    user = resolve_agent_user(jwt_token, user)
+    user_id = user.clerk_id
+
+    # Prompts already answered today reuse their cached items
+    planned = {}
+    for key, prompt in batch_prompts.items():
+        cached = prompt_cache.get(prompt, user_id)
+        if cached is not None:
+            planned[key] = cached
+    pending_prompts = {
+        key: prompt for key, prompt in batch_prompts.items() if key not in planned
+    }
+    if planned:
+        log.info(f"Prompt cache answered {len(planned)} of {len(keys)} prompts")
+        agent_metrics.record(cache_hits=len(planned))
+
+    errors = {}
+    if strategy == "combined" and pending_prompts:
+        llm_prompts = {}
+        for key, prompt in pending_prompts.items():
+            item_json = try_fast_path(prompt) if fast_path else None
+            if item_json is not None:
+                agent_metrics.record(fast_path_hits=1)
+                planned[key] = [item_json]
+            else:
+                llm_prompts[key] = prompt
+
+        if llm_prompts:
+            combined_planned, invalid_keys = plan_combined(llm_prompts, llm)
+            planned.update(combined_planned)
+            if invalid_keys:
+                log.info(
+                    f"Falling back to per-prompt requests for {len(invalid_keys)} keys"
+                )
+                # These prompts already missed the fast path
+                fallback_planned, errors = plan_concurrent(
+                    {key: batch_prompts[key] for key in invalid_keys},
+                    llm,
+                    max_concurrency,
+                    fast_path=False,
+                )
+                planned.update(fallback_planned)
+    elif pending_prompts:
+        concurrent_planned, errors = plan_concurrent(
+            pending_prompts, llm, max_concurrency, progress_callback, fast_path
+        )
+        planned.update(concurrent_planned)
+
+    results = {key: {"status": "failed", "error": error} for key, error in errors.items()}
+    insert_planned_items(user, planned, results)
+    for key, prompt in pending_prompts.items():
+        if results.get(key, {}).get("status") == "created":
+            prompt_cache.set(prompt, planned[key], user_id)
+    log.info(f"Prompt cache stats: {prompt_cache.stats()}")
+    if progress_callback:
+        progress_callback(len(keys), len(keys))
+
+    result = {
+        "message": "batch agent graph executed",
+        "processed_keys": keys,
+        "results": {key: results[key] for key in keys},
+    }
+    log.info(f"Final result: {result}")
+    return result
 
 
-# For demonstration, run the agent with a sample prompt
-def run_agent(batch_prompts: dict, jwt_token: str = None):
-    import datetime
+def run_agent(
+    batch_prompts: dict,
+    jwt_token: str = None,
+    strategy: str = "sequential",
+    max_concurrency: int = None,
+    llm=None,
+    progress_callback=None,
+    fast_path: bool = True,
+    user=None,
+    metrics: AgentRunMetrics = None,
+):
+    """
+    Run the add-item agent over a batch of {key: prompt}.
+
+    strategy="sequential" processes one prompt at a time, inserting its items
+    on the calling thread before the next prompt; strategy="concurrent" and
+    strategy="combined" plan all items first and insert them together (see
+    run_planned_batch). llm overrides the shared
+    chat models, e.g. with a fake model in tests. progress_callback(completed,
+    total) is called as prompts are processed. With fast_path, prompts the
+    rule-based parser understands with high confidence skip the LLM, as do
+    prompts already answered today (see agent_cache). user is the
+    authenticated user when the caller has one; otherwise it is resolved from
+    jwt_token once for the whole run.
+
+    Timings, token usage and call counts are collected into metrics (a new
+    AgentRunMetrics unless one is passed in) and exported when the run ends.
+    """
+    metrics = metrics or AgentRunMetrics()
+    metrics.strategy = strategy
+    metrics.prompts = len(batch_prompts)
+    with agent_metrics.track_agent_run(metrics):
+        return _run_agent(
+            batch_prompts,
+            jwt_token,
+            strategy,
+            max_concurrency,
+            llm,
+            progress_callback,
+            fast_path,
+            user,
+        )
 
+
+def _run_agent(
+    batch_prompts: dict,
+    jwt_token: str,
+    strategy: str,
+    max_concurrency: int,
+    llm,
+    progress_callback,
+    fast_path: bool,
+    user,
+):
     log.info("Starting agent run")
     log.info(f"Batch prompts count: {len(batch_prompts)}")
     log.debug(f"Batch prompts keys: {list(batch_prompts.keys())}")
     log.debug(f"JWT token provided: {'Yes' if jwt_token else 'No'}")
 
-    today_iso = datetime.date.today().isoformat()
     # batch_prompts: dict of {key: prompt}
     keys = list(batch_prompts.keys())
     if not keys:
         log.error("No prompts provided for batch add")
         raise ValueError("No prompts provided for batch add.")
-    first_key = keys[0]
-    log.info(f"First key to process: {first_key}")
-
-    if prod:
-        api_url = "https://min-nowweb-app-production.up.railway.app"
-        log.info(f"Using production API URL: {api_url}")
-        tool = create_item_tool(
-            api_url=api_url,
-            auth_token=jwt_token,
+    if strategy not in BATCH_STRATEGIES:
+        raise ValueError(f"Unknown batch strategy: {strategy}")
+    if strategy in ("concurrent", "combined"):
+        return run_planned_batch(
+            batch_prompts,
+            jwt_token,
+            strategy,
+            llm,
+            max_concurrency,
+            progress_callback,
+            fast_path,
+            user,
         )
-    else:
-        api_url = "http://localhost:8000"
-        log.info(f"Using development API URL: {api_url}")
-        tool = create_item_tool(api_url=api_url, auth_token=jwt_token)
-
-    global llm_with_tools
-    log.info("Initializing LLM with tools...")
-    llm_with_tools = ChatOpenAI(
-        model="gpt-4.1",
-        temperature=1,
-        request_timeout=120,
-        max_completion_tokens=200,
-        max_retries=3,
-    ).bind_tools([tool])
-    log.info("LLM with tools initialized successfully")
 
-    graph_builder = StateGraph(State)
-    graph_builder.add_node("chatbot", chatbot)
-    tool_node = ToolNode(tools=[tool])
-    graph_builder.add_node("tools", tool_node)
-    # how relevant is the graph with more programmatic approach shown in while loop?
-    # can same functionality be accomplished with graph approach?
-    graph_builder.add_conditional_edges("chatbot", route_tools)
-    graph_builder.add_edge("chatbot", "tools")
-    graph_builder.add_edge("tools", "chatbot")
-    graph_builder.add_edge(START, "chatbot")
-    graph_builder.add_edge("tools", END)
-
-    log.info("Reading system instructions...")
-    try:
-        with open(SYSTEM_INSTRUCTIONS_PATH, "r", encoding="utf-8") as f:
-            system_instructions = f.read()
-        log.info(
-            f"System instructions loaded successfully ({len(system_instructions)} characters)"
-        )
-    except FileNotFoundError:
-        system_instructions = "You are an AI agent that helps create items. Extract item information from user prompts and create JSON objects."
-        log.warning("System instructions file not found, using default instructions")
+    user = resolve_agent_user(jwt_token, user)
 
-    # Initialize state
-    state = {
-        "messages": [SystemMessage(content=system_instructions)],
-        "item_json": {},
-        "batch_prompts": batch_prompts,
-        "current_key": first_key,
-        "processed_keys": [],
-    }
-    log.info("Initial state created")
-
-    # pretty print context given to chatbot
-    # import pprint
-
-    # print("\nState (as roles and content):")
-    # pprint.pprint(
-    #     {
-    #         "messages": [
-    #             {"role": "system", "content": system_instructions},
-    #             {"role": "user", "content": prompt_with_date},
-    #         ]
-    #     },
-    #     indent=2,
-    #     width=80,
-    #     compact=False,
-    # )
-
-    # not right for prod
-    memory = MemorySaver()
-    graph = graph_builder.compile(checkpointer=memory)
-    log.info("Graph compiled successfully")
-
-    config = {"configurable": {"thread_id": "1"}}
-    # Main batch loop
+    results = {}
     log.info("Starting main batch processing loop")
-    loop_iteration = 0
-    while True:
-        loop_iteration += 1
-        log.info(f"Batch loop iteration {loop_iteration}")
-
-        # Only use the prompt for the current key
-        current_key = state["current_key"]
-        prompt = batch_prompts[current_key]
+    for completed, (current_key, prompt) in enumerate(batch_prompts.items(), start=1):
         log.info(f"Processing key: {current_key}")
 
-        state["messages"] = [
-            SystemMessage(content=system_instructions),
-            HumanMessage(content=prompt),
-        ]
-        # Run chatbot node
-        log.info("Running chatbot node...")
-        chatbot_result = chatbot(state)
-        state["messages"].extend(chatbot_result["messages"])
-        log.info("Chatbot node completed")
-
-        # Check if tool call is needed
-        route_decision = route_tools(state)
-        log.info(f"Route decision: {route_decision}")
-
-        if route_decision == "tools":
-            # Run tool node
-            log.info("Running tool node...")
+        item_jsons = prompt_cache.get(prompt, user.clerk_id)
+        cache_hit = item_jsons is not None
+        if cache_hit:
+            log.info(f"Key {current_key} answered from the prompt cache")
+            agent_metrics.record(cache_hits=1)
+        else:
             try:
-                tool_result = tool_node.invoke(state)
-                log.info("Tool node completed successfully")
-                # Optionally, collect result
-                # state["item_json"][current_key] = tool_result.get("result")
-                state["messages"].extend(tool_result.get("messages", []))
-            except Exception as e:
-                log.error(f"Error in tool node: {type(e).__name__} - {str(e)}")
-                raise
+                item_jsons = plan_items_for_prompt(prompt, llm, fast_path)
+            except ValueError as e:
+                log.warning(f"No item planned for key {current_key}: {e}")
+                results[current_key] = {"status": "failed", "error": str(e)}
+
+        if current_key not in results:
+            # Inserted on this thread before the next prompt, so a failed
+            # insert is reported for its key only
+            insert_planned_items(user, {current_key: item_jsons}, results)
+            if not cache_hit and results[current_key]["status"] == "created":
+                prompt_cache.set(prompt, item_jsons, user.clerk_id)
 
-        # Mark as processed
-        state["processed_keys"].append(current_key)
         log.info(f"Key {current_key} marked as processed")
-
-        # Find next key
-        remaining = [
-            k for k in batch_prompts.keys() if k not in state["processed_keys"]
-        ]
-        log.debug(f"Remaining keys: {remaining}")
-
-        if not remaining:
-            log.info("No remaining keys, breaking loop")
-            break
-        state["current_key"] = remaining[0]
-        log.info(f"Next key to process: {state['current_key']}")
-
-        try:
-            png_data = graph.get_graph().draw_mermaid_png()
-            with open(GRAPH_PATH, "wb") as f:
-                f.write(png_data)
-            log.debug("Graph visualization saved successfully")
-        except Exception as e:
-            # This requires some extra dependencies and is optional
-            log.debug(f"Could not save graph visualization: {e}")
-            pass
+        if progress_callback:
+            progress_callback(completed, len(keys))
 
     log.info("Batch processing completed successfully")
-    # Optionally, return all results
+    log.info(f"Prompt cache stats: {prompt_cache.stats()}")
     result = {
         "message": "batch agent graph executed",
-        "processed_keys": state["processed_keys"],
+        "processed_keys": keys,
+        "results": {key: results[key] for key in keys},
     }
     log.info(f"Final result: {result}")
     return result
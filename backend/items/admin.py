@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import OwnedItem, Checkup, ItemType, ItemStatus
+from .models import OwnedItem, Checkup, ItemType, ItemStatus, AgentJob
 
 
 @admin.register(OwnedItem)
@@ -19,3 +19,10 @@ class CheckupAdmin(admin.ModelAdmin):
         "is_checkup_due",
     )
     readonly_fields = ("is_checkup_due",)
+
+
+@admin.register(AgentJob)
+class AgentJobAdmin(admin.ModelAdmin):
+    list_display = ("id", "user", "status", "completed_prompts", "created_at")
+    list_filter = ("status",)
+    readonly_fields = ("created_at", "updated_at")
@@ -0,0 +1,138 @@
+"""
+In-process cache of add-item agent results.
+
+Users often re-add the same kind of item with nearly identical prompts. The
+cache maps a normalized prompt to the validated item JSON the agent created for
+it, so a repeated prompt skips the LLM. Entries are keyed by the current date
+as well, because prompts with relative dates ("2 years ago") resolve to a
+different item every day.
+
+The cache is bounded (least recently used entries are evicted), entries expire
+after a TTL, and it is scoped per user or shared by all users
+(AGENT_CACHE_SCOPE=user|global). Each web process has its own cache.
+"""
+
+import copy
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+log = logging.getLogger(__name__)
+
+AGENT_CACHE_ENABLED = os.getenv("AGENT_CACHE_ENABLED", "true").lower() == "true"
+AGENT_CACHE_MAX_ENTRIES = int(os.getenv("AGENT_CACHE_MAX_ENTRIES", "1000"))
+AGENT_CACHE_TTL_SECONDS = int(os.getenv("AGENT_CACHE_TTL_SECONDS", "86400"))
+AGENT_CACHE_SCOPE = os.getenv("AGENT_CACHE_SCOPE", "user").lower()
+
+CACHE_SCOPES = ("user", "global")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Lowercase a prompt and collapse whitespace and trailing punctuation."""
+    prompt = re.sub(r"\s+", " ", prompt.strip().lower())
+    prompt = re.sub(r"\s*,\s*", ", ", prompt)
+    return prompt.strip(" .!?")
+
+
+class PromptResultCache:
+    """Bounded, thread-safe LRU cache with per-entry TTL and hit/miss counters."""
+
+    def __init__(
+        self,
+        max_entries: int = AGENT_CACHE_MAX_ENTRIES,
+        ttl_seconds: int = AGENT_CACHE_TTL_SECONDS,
+        scope: str = AGENT_CACHE_SCOPE,
+        enabled: bool = AGENT_CACHE_ENABLED,
+    ):
+        if scope not in CACHE_SCOPES:
+            raise ValueError(f"Unknown agent cache scope: {scope}")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.scope = scope
+        self.enabled = enabled and max_entries > 0
+        self._entries = OrderedDict()  # key -> (expires_at, items)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _key(self, prompt: str, user_id: Optional[str], today: Optional[date]):
+        if self.scope == "user":
+            if not user_id:
+                return None
+            owner = user_id
+        else:
+            owner = "*"
+        bucket = (today or date.today()).isoformat()
+        return (owner, bucket, normalize_prompt(prompt))
+
+    def get(
+        self, prompt: str, user_id: Optional[str] = None, today: Optional[date] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return a copy of the cached items for a prompt, or None on a miss."""
+        if not self.enabled:
+            return None
+        key = self._key(prompt, user_id, today)
+        if key is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def set(
+        self,
+        prompt: str,
+        items: List[Dict[str, Any]],
+        user_id: Optional[str] = None,
+        today: Optional[date] = None,
+    ):
+        """Store the validated items created for a prompt."""
+        if not self.enabled or not items:
+            return
+        key = self._key(prompt, user_id, today)
+        if key is None:
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, copy.deepcopy(items))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "scope": self.scope,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+prompt_cache = PromptResultCache()
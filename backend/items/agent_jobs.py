@@ -0,0 +1,87 @@
+"""
+Background execution of add-item agent runs.
+
+Agent requests can take minutes (LLM timeouts and retries), so instead of
+holding a web worker for the whole run the API can enqueue an AgentJob and
+return its id immediately. Jobs run on a small in-process thread pool; their
+state lives in the database so any web worker can answer status and stream
+requests for them.
+
+Jobs do not survive a process restart: a job left "queued" or "running" by a
+restarted worker will never finish and should be resubmitted.
+"""
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import AgentJob, AgentJobStatus
+
+log = logging.getLogger(__name__)
+
+# Number of agent jobs a single web process runs at the same time
+AGENT_JOB_WORKERS = int(os.getenv("AGENT_JOB_WORKERS", "2"))
+
+_executor = ThreadPoolExecutor(
+    max_workers=AGENT_JOB_WORKERS, thread_name_prefix="agent-job"
+)
+
+
+def submit_agent_job(user, batch_prompts: dict, jwt_token: str, strategy="sequential"):
+    """
+    Create an AgentJob for the prompts and schedule it on the job pool.
+    With settings.AGENT_JOBS_EAGER the job runs inline (useful in tests).
+    """
+    job = AgentJob.objects.create(user=user, total_prompts=len(batch_prompts))
+    log.info(f"Queued agent job {job.id} with {len(batch_prompts)} prompts")
+
+    if getattr(settings, "AGENT_JOBS_EAGER", False):
+        run_agent_job(job.id, batch_prompts, jwt_token, strategy, user)
+        job.refresh_from_db()
+    else:
+        _executor.submit(
+            run_agent_job, job.id, batch_prompts, jwt_token, strategy, user
+        )
+    return job
+
+
+def _update_job(job_id, **fields):
+    AgentJob.objects.filter(id=job_id).update(updated_at=timezone.now(), **fields)
+
+
+def run_agent_job(
+    job_id, batch_prompts: dict, jwt_token: str, strategy: str, user=None
+):
+    """Run the agent for a job, recording progress and the final result."""
+    from .addItemAgent import run_agent
+
+    def record_progress(completed, total):
+        _update_job(job_id, completed_prompts=completed)
+
+    try:
+        _update_job(job_id, status=AgentJobStatus.RUNNING)
+        result = run_agent(
+            batch_prompts,
+            jwt_token,
+            strategy=strategy,
+            progress_callback=record_progress,
+            user=user,
+        )
+        _update_job(
+            job_id,
+            status=AgentJobStatus.SUCCEEDED,
+            completed_prompts=len(batch_prompts),
+            result=result,
+        )
+        log.info(f"Agent job {job_id} succeeded")
+    except Exception as e:
+        log.error(f"Agent job {job_id} failed: {type(e).__name__} - {str(e)}")
+        _update_job(job_id, status=AgentJobStatus.FAILED, error=str(e))
+    finally:
+        if not getattr(settings, "AGENT_JOBS_EAGER", False):
+            # Worker threads open their own connections; release them per job
+            close_old_connections()
@@ -0,0 +1,178 @@
+"""
+Per-run metrics for the add-item agent.
+
+An AgentRunMetrics object is bound to the current run with a context variable,
+so the LLM, HTTP and database call sites record into it without threading it
+through every function. Worker threads started by the agent copy the context.
+When the run ends the metrics are exported to the configured sink
+(settings.AGENT_METRICS_SINK, a dotted path to a MetricsSink class) and, with
+settings.AGENT_DEBUG_HEADERS, attached to the API response as X-Agent-* headers.
+"""
+
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+log = logging.getLogger(__name__)
+# Child of the agent logger, so metrics lines use its console handler
+metrics_log = logging.getLogger("addItemAgent.metrics")
+
+DEFAULT_METRICS_SINK = "items.agent_metrics.LoggingMetricsSink"
+
+_current_metrics: ContextVar[Optional["AgentRunMetrics"]] = ContextVar(
+    "agent_run_metrics", default=None
+)
+
+
+@dataclass
+class AgentRunMetrics:
+    strategy: str = "sequential"
+    prompts: int = 0
+    llm_calls: int = 0
+    llm_seconds: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    tool_calls: int = 0
+    http_requests: int = 0
+    db_seconds: float = 0.0
+    fast_path_hits: int = 0
+    cache_hits: int = 0
+    total_seconds: float = 0.0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def retries(self) -> int:
+        """HTTP attempts beyond one per LLM call are client retries."""
+        return max(0, self.http_requests - self.llm_calls)
+
+    def add(self, **increments):
+        with self._lock:
+            for name, value in increments.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def record_llm_call(self, seconds: float, response=None):
+        """Record one LLM round trip, reading token usage from the AI message."""
+        usage = getattr(response, "usage_metadata", None) or {}
+        if not usage:
+            token_usage = (getattr(response, "response_metadata", None) or {}).get(
+                "token_usage", {}
+            )
+            usage = {
+                "input_tokens": token_usage.get("prompt_tokens", 0),
+                "output_tokens": token_usage.get("completion_tokens", 0),
+            }
+        self.add(
+            llm_calls=1,
+            llm_seconds=seconds,
+            prompt_tokens=usage.get("input_tokens", 0) or 0,
+            completion_tokens=usage.get("output_tokens", 0) or 0,
+            tool_calls=len(getattr(response, "tool_calls", None) or []),
+        )
+
+    def as_dict(self) -> Dict:
+        with self._lock:
+            data = {
+                f.name: getattr(self, f.name) for f in fields(self) if f.name != "_lock"
+            }
+        data["retries"] = self.retries
+        for name in ("llm_seconds", "db_seconds", "total_seconds"):
+            data[name] = round(data[name], 4)
+        return data
+
+    def as_headers(self) -> Dict[str, str]:
+        data = self.as_dict()
+        return {
+            "X-Agent-Total-Ms": f"{data['total_seconds'] * 1000:.1f}",
+            "X-Agent-LLM-Ms": f"{data['llm_seconds'] * 1000:.1f}",
+            "X-Agent-LLM-Calls": str(data["llm_calls"]),
+            "X-Agent-Prompt-Tokens": str(data["prompt_tokens"]),
+            "X-Agent-Completion-Tokens": str(data["completion_tokens"]),
+            "X-Agent-Tool-Calls": str(data["tool_calls"]),
+            "X-Agent-DB-Ms": f"{data['db_seconds'] * 1000:.1f}",
+            "X-Agent-Retries": str(data["retries"]),
+        }
+
+
+class MetricsSink:
+    """Receives the metrics of every finished agent run."""
+
+    def emit(self, metrics: AgentRunMetrics):
+        raise NotImplementedError
+
+
+class LoggingMetricsSink(MetricsSink):
+    """Logs one structured (JSON) line per agent run."""
+
+    def emit(self, metrics: AgentRunMetrics):
+        metrics_log.info(
+            f"agent_run_metrics {json.dumps(metrics.as_dict(), sort_keys=True)}"
+        )
+
+
+@lru_cache(maxsize=1)
+def get_metrics_sink() -> MetricsSink:
+    sink_path = getattr(settings, "AGENT_METRICS_SINK", DEFAULT_METRICS_SINK)
+    return import_string(sink_path)()
+
+
+@contextmanager
+def track_agent_run(metrics: AgentRunMetrics):
+    """Bind metrics to the current run, then time and export it."""
+    token = _current_metrics.set(metrics)
+    start = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.total_seconds = time.perf_counter() - start
+        _current_metrics.reset(token)
+        try:
+            get_metrics_sink().emit(metrics)
+        except Exception as e:
+            log.warning(f"Could not export agent metrics: {e}")
+
+
+def record(**increments):
+    """Add to the current run's counters; a no-op outside a tracked run."""
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.add(**increments)
+
+
+def record_llm_call(seconds: float, response=None):
+    """Record a finished LLM call on the current run, if any."""
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.record_llm_call(seconds, response)
+
+
+@contextmanager
+def timed_db():
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(db_seconds=time.perf_counter() - start)
+
+
+def count_http_request(request):
+    """httpx request event hook: counts every attempt, including retries."""
+    record(http_requests=1)
+
+
+def attach_debug_headers(response, metrics: AgentRunMetrics):
+    """Copy run metrics onto a response when settings.AGENT_DEBUG_HEADERS is on."""
+    if not getattr(settings, "AGENT_DEBUG_HEADERS", False):
+        return
+    for header, value in metrics.as_headers().items():
+        response[header] = value
@@ -10,6 +10,7 @@ Items:
   GET    /items                      - List items with optional status/item_type filters
   POST   /items                      - Create a new item
   GET    /items/stats                - Get user item statistics (count, limit, remaining)
+  GET    /items/changes              - Items changed or deleted since a cursor (delta sync)
   GET    /items/{item_id}            - Get specific item by UUID
   PUT    /items/{item_id}            - Update specific item
   DELETE /items/{item_id}            - Delete specific item
@@ -28,8 +29,10 @@ Email & Notifications:
   POST   /send-test-email            - Send test checkup email
 
 AI Agent:
-  POST   /agent-add-item             - AI agent item creation
-  POST   /agent-add-item-batch       - Batch AI agent item creation
+  POST   /agent-add-item             - AI agent item creation (background=true to enqueue)
+  POST   /agent-add-item-batch       - Batch AI agent item creation (background=true to enqueue)
+  GET    /agent-jobs/{job_id}        - Get background agent job status and result
+  GET    /agent-jobs/{job_id}/events - Stream background agent job progress (SSE)
 
 User Preferences:
   POST   /sync-preferences           - Sync user email preferences and checkup intervals
@@ -47,22 +50,35 @@ Rate Limiting:
 
 from ninja import Router, Schema
 from ninja.errors import HttpError
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Literal
 from pydantic import RootModel
-from .models import ItemType, ItemStatus, TimeSpan, OwnedItem
+from .models import ItemType, ItemStatus, TimeSpan, OwnedItem, AgentJob
 from .services import ItemService, CheckupService
+from .schemas import OwnedItemCreateSchema
+from .agent_jobs import submit_agent_job
+from .agent_metrics import AgentRunMetrics, attach_debug_headers
 from datetime import datetime
 from uuid import UUID
 from dotenv import load_dotenv
+import asyncio
 import os
+import time
 import logging
-from .addItemAgent import run_agent
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
 from django.core.exceptions import ValidationError
 import jwt
 from django.conf import settings
 from datetime import datetime
 from upstash_ratelimit import Ratelimit, FixedWindow
 from upstash_redis import Redis
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.utils import timezone
+from django.utils.http import parse_etags
+from . import item_cache
+from minNow.renderers import dumps as render_json
+from minNow.middleware import timed_phase
 
 
 log = logging.getLogger(__name__)
@@ -86,13 +102,18 @@ except Exception as e:
     )
     rate_limiter = None
 
+# Server-Sent Events polling for background agent jobs
+AGENT_JOB_STREAM_POLL_INTERVAL = 0.5  # seconds between job status checks
+AGENT_JOB_STREAM_TIMEOUT = 300  # seconds before the stream gives up
+AGENT_JOB_STREAM_RETRY_MS = 2000  # EventSource reconnect delay when not streaming
+
 # Use when testing swagger docs in dev. Allows authenticating in swagger
 # Uses HS256 dev token
 # from minNow.auth import DevClerkAuth as ClerkAuth
 
 # Use this for production with real Clerk JWTs
 # Uses RS256 Clerk tokens
-from minNow.auth import ClerkAuth
+from minNow.auth import ClerkAuth, AsyncClerkAuth
 
 
 # ============================================================================
@@ -116,6 +137,30 @@ def check_rate_limit(request):
     if rate_limiter is None:
         return True, None
 
+    user_id = rate_limit_identifier(request)
+    try:
+        with timed_phase("ratelimit"):
+            response = rate_limiter.limit(user_id)
+        return rate_limit_result(response)
+    except Exception as e:
+        log.warning(f"Rate limiting check failed: {e}. Allowing request to proceed.")
+        return True, None
+
+
+async def acheck_rate_limit(request):
+    """
+    Async version of check_rate_limit for async views. The sync limiter runs
+    in a worker thread: an async Upstash client keeps one HTTP connection
+    pool for its lifetime, which breaks under WSGI where every async view
+    gets a fresh event loop, and errors here fail open.
+    """
+    if rate_limiter is None:
+        return True, None
+    return await sync_to_async(check_rate_limit, thread_sensitive=False)(request)
+
+
+def rate_limit_identifier(request):
+    """Identify the caller for rate limiting: the user id, else the client IP."""
     # Get user ID from request
     user_id = None
     if hasattr(request, "user") and request.user:
@@ -131,18 +176,76 @@ def check_rate_limit(request):
         )
         if "," in user_id:
             user_id = user_id.split(",")[0].strip()
+    return user_id
 
-    try:
-        response = rate_limiter.limit(user_id)
-        if not response.allowed:
-            reset_time = response.reset
-            return False, {
-                "detail": f"Rate limit exceeded. Try again after {reset_time} seconds."
-            }
-        return True, None
-    except Exception as e:
-        log.warning(f"Rate limiting check failed: {e}. Allowing request to proceed.")
-        return True, None
+
+def rate_limit_result(response):
+    if not response.allowed:
+        reset_time = response.reset
+        return False, {
+            "detail": f"Rate limit exceeded. Try again after {reset_time} seconds."
+        }
+    return True, None
+
+
+def conditional_get(request, response, scope):
+    """
+    Conditional GET for a user's data: sets a weak ETag from the per-user
+    version of `scope` and returns a 304 response when the client's
+    If-None-Match still matches, before anything is queried or serialized.
+    Returns None when the view should build the full response.
+    """
+    if not getattr(settings, "ETAGS_ENABLED", False):
+        return None
+
+    etag = item_cache.user_etag(request.user.id, scope)
+    # Responses differ per user; browsers keep them but revalidate every time
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache", "Vary": "Authorization"}
+    for header, value in headers.items():
+        response[header] = value
+
+    # Weak comparison: W/"x" matches "x"
+    client_etags = parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+    if "*" in client_etags or etag.removeprefix("W/") in {
+        e.removeprefix("W/") for e in client_etags
+    }:
+        not_modified = HttpResponse(status=304)
+        for header, value in headers.items():
+            not_modified[header] = value
+        return not_modified
+    return None
+
+
+def trusted_json_response(data, response):
+    """
+    Render already-serialized server data straight to JSON, skipping Ninja's
+    response validation. Headers set on the temporal `response` are kept.
+    """
+    json_response = HttpResponse(
+        render_json(data), content_type="application/json; charset=utf-8"
+    )
+    for header, value in response.items():
+        if header.lower() != "content-type":
+            json_response[header] = value
+    return json_response
+
+
+async def run_in_thread(func, *args, **kwargs):
+    """
+    Run blocking work (ORM, Clerk, MailerSend, the LangChain agent) from an
+    async view without blocking the event loop or other requests. The worker
+    thread's database connections are closed afterwards: executor threads are
+    not request threads, so CONN_MAX_AGE would otherwise keep one open per
+    thread.
+    """
+
+    def call():
+        try:
+            return func(*args, **kwargs)
+        finally:
+            connections.close_all()
+
+    return await sync_to_async(call, thread_sensitive=False)()
 
 
 # convert django models to pydantic schemas
@@ -163,6 +266,15 @@ class TimeSpanSchema(Schema):
             description=obj.description,
         )
 
+    @staticmethod
+    def dict_from_orm(obj: TimeSpan) -> dict:
+        return {
+            "years": obj.years,
+            "months": obj.months,
+            "days": obj.days,
+            "description": obj.description,
+        }
+
 
 class CheckupSchema(Schema):
     id: int
@@ -212,15 +324,55 @@ class OwnedItemSchema(Schema):
             ownership_duration_goal_progress=obj.ownership_duration_goal_progress,
         )
 
+    @staticmethod
+    def dict_from_orm(obj, ownership_duration=None, last_used_duration=None) -> dict:
+        """
+        Fast path: the same data as from_orm(obj).model_dump(), built as a plain
+        dict without pydantic validation. Only for trusted data from our own
+        models; keep in step with the fields above (tests check parity).
+        """
+        if ownership_duration is None:
+            ownership_duration = obj.ownership_duration
+        if last_used_duration is None:
+            last_used_duration = obj.last_used_duration
+        return {
+            "id": obj.id,
+            "name": obj.name,
+            "picture_url": obj.picture_url,
+            "item_type": obj.item_type,
+            "status": obj.status,
+            "item_received_date": obj.item_received_date,
+            "last_used": obj.last_used,
+            "ownership_duration": TimeSpanSchema.dict_from_orm(ownership_duration),
+            "last_used_duration": TimeSpanSchema.dict_from_orm(last_used_duration),
+            "keep_badge_progress": obj.keep_badge_progress,
+            "ownership_duration_goal_months": obj.ownership_duration_goal_months,
+            "ownership_duration_goal_progress": float(
+                obj.ownership_duration_goal_progress
+            ),
+        }
+
+    @staticmethod
+    def dicts_from_orm(objs) -> List[dict]:
+        """dict_from_orm for a list, with every duration measured from one `now`."""
+        now = timezone.now()
+        return [
+            OwnedItemSchema.dict_from_orm(
+                obj,
+                TimeSpan.from_dates(obj.item_received_date, now),
+                TimeSpan.from_dates(obj.last_used, now),
+            )
+            for obj in objs
+        ]
 
-class OwnedItemCreateSchema(Schema):
-    name: str
-    picture_url: str
-    item_type: ItemType
-    status: ItemStatus = ItemStatus.KEEP
-    item_received_date: datetime
-    last_used: datetime
-    ownership_duration_goal_months: int = 12
+
+class ItemChangesSchema(Schema):
+    # Pass back as `since` on the next call
+    cursor: datetime
+    # True when `updated` holds every item and local state should be replaced
+    reset: bool
+    updated: List[OwnedItemSchema]
+    deleted: List[UUID]
 
 
 class OwnedItemUpdateSchema(Schema):
@@ -249,6 +401,12 @@ class DonatedBadgesResponseSchema(RootModel[Dict[str, List[BadgeProgressSchema]]
 # Schema for batch agent add item
 class AgentBatchPromptsSchema(Schema):
     prompts: Dict[str, str]
+    # Run in the background and return a job id instead of waiting for the LLM
+    background: bool = False
+    # "sequential" runs one prompt at a time; "concurrent" calls the LLM for all
+    # prompts in parallel; "combined" asks for all items in one LLM request.
+    # Both non-sequential strategies report success/failure per key
+    strategy: Literal["sequential", "concurrent", "combined"] = "sequential"
 
 
 class EmailResponseSchema(Schema):
@@ -534,10 +692,16 @@ if not prod:
 
 # Items Endpoints
 @router.get("/items", response=List[OwnedItemSchema], auth=ClerkAuth(), tags=["Items"])
-def list_items(request, status: Optional[str] = None, item_type: Optional[str] = None):
+def list_items(
+    request,
+    response: HttpResponse,
+    status: Optional[str] = None,
+    item_type: Optional[str] = None,
+):
     """
     Get all items for the authenticated user with optional filters.
     Rate limit: 100 requests per 60 seconds
+    Supports If-None-Match (304 Not Modified) with the returned ETag
 
     Query parameters:
     - status: Optional filter by item status (keep, give, donate)
@@ -563,13 +727,19 @@ def list_items(request, status: Optional[str] = None, item_type: Optional[str] =
         except ValueError:
             raise HttpError(400, "Invalid item_type value")
 
+    not_modified = conditional_get(request, response, item_cache.ITEMS)
+    if not_modified:
+        return not_modified
+
     # Get items for the authenticated user
     user = request.user
-    items = ItemService.get_items_for_user(
+    items = ItemService.get_cached_items_for_user(
         user, status=status_enum, item_type=item_type_enum
     )
 
-    return [OwnedItemSchema.from_orm(item) for item in items]
+    with timed_phase("serialize"):
+        data = OwnedItemSchema.dicts_from_orm(items)
+    return trusted_json_response(data, response)
 
 
 @router.post("/items", response=OwnedItemSchema, auth=ClerkAuth(), tags=["Items"])
@@ -616,6 +786,39 @@ def get_user_item_stats(request):
     return stats
 
 
+@router.get(
+    "/items/changes", response=ItemChangesSchema, auth=ClerkAuth(), tags=["Items"]
+)
+def get_item_changes(
+    request, response: HttpResponse, since: Optional[datetime] = None
+):
+    """
+    Get items created or updated and ids of items deleted since a cursor.
+    Rate limit: 100 requests per 60 seconds
+
+    Query parameters:
+    - since: Optional cursor from a previous response. Omit for a full sync
+    """
+    # Check rate limit
+    is_allowed, error_response = check_rate_limit(request)
+    if not is_allowed:
+        raise HttpError(429, error_response["detail"])
+
+    updated, deleted, cursor, reset = ItemService.get_item_changes(
+        request.user, since=since
+    )
+
+    return trusted_json_response(
+        {
+            "cursor": cursor,
+            "reset": reset,
+            "updated": OwnedItemSchema.dicts_from_orm(updated),
+            "deleted": deleted,
+        },
+        response,
+    )
+
+
 @router.get(
     "/items/{item_id}", response=OwnedItemSchema, auth=ClerkAuth(), tags=["Items"]
 )
@@ -684,16 +887,22 @@ def delete_item(request, item_id: UUID):
     auth=ClerkAuth(),
     tags=["Badges"],
 )
-def get_donated_badges(request):
+def get_donated_badges(request, response: HttpResponse):
     """
     Get donated badge progress for the authenticated user.
     Rate limit: 100 requests per 60 seconds
+    Supports If-None-Match (304 Not Modified) with the returned ETag
     """
     # Check rate limit
     is_allowed, error_response = check_rate_limit(request)
     if not is_allowed:
         raise HttpError(429, error_response["detail"])
 
+    # Badges are derived from item statuses, so they share the items version
+    not_modified = conditional_get(request, response, item_cache.ITEMS)
+    if not_modified:
+        return not_modified
+
     user = request.user
     donated_badges = OwnedItem.donated_badge_progress(user)
     return donated_badges
@@ -703,10 +912,11 @@ def get_donated_badges(request):
 @router.get(
     "/checkups", response=List[CheckupSchema], auth=ClerkAuth(), tags=["Checkups"]
 )
-def list_checkups(request, type: Optional[str] = None):
+def list_checkups(request, response: HttpResponse, type: Optional[str] = None):
     """
     Get checkups for the authenticated user with optional type filter.
     Rate limit: 100 requests per 60 seconds
+    Supports If-None-Match (304 Not Modified) with the returned ETag
 
     Query parameters:
     - type: Optional filter by checkup type (keep, give)
@@ -716,6 +926,10 @@ def list_checkups(request, type: Optional[str] = None):
     if not is_allowed:
         raise HttpError(429, error_response["detail"])
 
+    not_modified = conditional_get(request, response, item_cache.CHECKUPS)
+    if not_modified:
+        return not_modified
+
     user = request.user
 
     if type:
@@ -864,21 +1078,21 @@ def complete_checkup(request, checkup_id: int):
 @router.post(
     "/send-test-email",
     response=List[EmailResponseSchema],
-    auth=ClerkAuth(),
+    auth=AsyncClerkAuth(),
     tags=["Email & Notifications"],
 )
-def send_test_checkup_email(request):
+async def send_test_checkup_email(request):
     """
     Send test checkup email to the authenticated user.
     Rate limit: 100 requests per 60 seconds
     """
     # Check rate limit
-    is_allowed, error_response = check_rate_limit(request)
+    is_allowed, error_response = await acheck_rate_limit(request)
     if not is_allowed:
         raise HttpError(429, error_response["detail"])
 
     user = request.user
-    results = CheckupService.check_and_send_due_emails(user)
+    results = await run_in_thread(CheckupService.check_and_send_due_emails, user)
 
     return [
         EmailResponseSchema(
@@ -894,41 +1108,100 @@ def send_test_checkup_email(request):
 # AI Agent Endpoints
 class AgentAddItemRequest(Schema):
     prompt: str
+    # Run in the background and return a job id instead of waiting for the LLM
+    background: bool = False
+
+
+class AgentJobSchema(Schema):
+    id: UUID
+    status: str
+    total_prompts: int
+    completed_prompts: int
+    result: Optional[dict] = None
+    error: str = ""
+    created_at: datetime
+    updated_at: datetime
+
+
+def run_agent_lazily(*args, **kwargs):
+    # Loaded on first use: the agent pulls in LangChain, which most
+    # workers never need
+    from .addItemAgent import run_agent
 
+    with timed_phase("agent"):
+        return run_agent(*args, **kwargs)
 
-@router.post("/agent-add-item", auth=ClerkAuth(), tags=["AI Agent"])
-def agent_add_item(request, data: AgentAddItemRequest):
+
+def get_bearer_token(request):
+    """Return the raw JWT from the Authorization header, if present."""
+    auth_header = request.META.get("HTTP_AUTHORIZATION")
+    if auth_header and auth_header.startswith("Bearer "):
+        return auth_header.split(" ")[1]
+    return None
+
+
+@router.post(
+    "/agent-add-item",
+    response={200: dict, 202: AgentJobSchema},
+    auth=AsyncClerkAuth(),
+    tags=["AI Agent"],
+)
+async def agent_add_item(
+    request, data: AgentAddItemRequest, response: HttpResponse
+):
     """
     Add an item using AI agent.
     Rate limit: 100 requests per 60 seconds
+
+    Set background=true to enqueue the run and get a job back immediately (202);
+    follow it with GET /agent-jobs/{job_id} or /agent-jobs/{job_id}/events.
+    With AGENT_DEBUG_HEADERS enabled, run metrics are returned as X-Agent-* headers.
     """
     # Check rate limit
-    is_allowed, error_response = check_rate_limit(request)
+    is_allowed, error_response = await acheck_rate_limit(request)
     if not is_allowed:
         raise HttpError(429, error_response["detail"])
 
     # Get JWT token from Authorization header
-    auth_header = request.META.get("HTTP_AUTHORIZATION")
-    jwt_token = None
-    if auth_header and auth_header.startswith("Bearer "):
-        jwt_token = auth_header.split(" ")[1]
+    jwt_token = get_bearer_token(request)
 
     # Convert prompt to expected format
     prompt_data = {"prompt": data.prompt}
 
+    if data.background:
+        job = await run_in_thread(submit_agent_job, request.user, prompt_data, jwt_token)
+        return 202, job
+
     # Run the agent
-    result = run_agent(prompt_data, jwt_token)
+    metrics = AgentRunMetrics()
+    result = await run_in_thread(
+        run_agent_lazily, prompt_data, jwt_token, user=request.user, metrics=metrics
+    )
+    attach_debug_headers(response, metrics)
     return result
 
 
-@router.post("/agent-add-item-batch", auth=ClerkAuth(), tags=["AI Agent"])
-def agent_add_item_batch(request, data: AgentBatchPromptsSchema):
+@router.post(
+    "/agent-add-item-batch",
+    response={200: dict, 202: AgentJobSchema},
+    auth=AsyncClerkAuth(),
+    tags=["AI Agent"],
+)
+async def agent_add_item_batch(
+    request, data: AgentBatchPromptsSchema, response: HttpResponse
+):
     """
     Add multiple items in batch using AI agent.
     Rate limit: 100 requests per 60 seconds
+
+    Set strategy="concurrent" to process prompts in parallel, or "combined" to
+    request every item in a single LLM call (with per-prompt fallback); the
+    response then includes a per-key "results" map of created item ids or errors.
+    Set background=true to enqueue the batch and get a job back immediately (202).
+    With AGENT_DEBUG_HEADERS enabled, run metrics are returned as X-Agent-* headers.
     """
     # Check rate limit
-    is_allowed, error_response = check_rate_limit(request)
+    is_allowed, error_response = await acheck_rate_limit(request)
     if not is_allowed:
         raise HttpError(429, error_response["detail"])
 
@@ -937,21 +1210,120 @@ def agent_add_item_batch(request, data: AgentBatchPromptsSchema):
     num_items_to_add = len(data.prompts)
 
     try:
-        OwnedItem.validate_item_limit(user, count=num_items_to_add)
+        await run_in_thread(OwnedItem.validate_item_limit, user, count=num_items_to_add)
     except ValidationError as e:
         raise HttpError(400, str(e))
 
     # Get JWT token from Authorization header
-    auth_header = request.META.get("HTTP_AUTHORIZATION")
-    jwt_token = None
-    if auth_header and auth_header.startswith("Bearer "):
-        jwt_token = auth_header.split(" ")[1]
+    jwt_token = get_bearer_token(request)
+
+    if data.background:
+        job = await run_in_thread(
+            submit_agent_job, user, data.prompts, jwt_token, data.strategy
+        )
+        return 202, job
 
     # Run the agent with batch prompts
-    result = run_agent(data.prompts, jwt_token)
+    metrics = AgentRunMetrics()
+    result = await run_in_thread(
+        run_agent_lazily,
+        data.prompts,
+        jwt_token,
+        strategy=data.strategy,
+        user=user,
+        metrics=metrics,
+    )
+    attach_debug_headers(response, metrics)
     return result
 
 
+def get_user_agent_job(request, job_id):
+    """Fetch an agent job owned by the requesting user, or raise 404."""
+    job = AgentJob.objects.filter(id=job_id, user=request.user).first()
+    if not job:
+        raise HttpError(404, "Agent job not found")
+    return job
+
+
+@router.get(
+    "/agent-jobs/{job_id}",
+    response=AgentJobSchema,
+    auth=ClerkAuth(),
+    tags=["AI Agent"],
+)
+def get_agent_job(request, job_id: UUID):
+    """
+    Get the status, progress and result of a background agent job.
+    Rate limit: 100 requests per 60 seconds
+    """
+    # Check rate limit
+    is_allowed, error_response = check_rate_limit(request)
+    if not is_allowed:
+        raise HttpError(429, error_response["detail"])
+
+    return get_user_agent_job(request, job_id)
+
+
+def agent_job_event(job):
+    """Format a job as one Server-Sent Event: "done" when finished, else "progress"."""
+    payload = AgentJobSchema.model_validate(job).model_dump_json()
+    event = "done" if job.is_finished else "progress"
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+@router.get("/agent-jobs/{job_id}/events", auth=AsyncClerkAuth(), tags=["AI Agent"])
+async def stream_agent_job(request, job_id: UUID):
+    """
+    Stream progress of a background agent job as Server-Sent Events.
+    Sends a "progress" event whenever the job changes and a final "done" event
+    when it succeeds or fails.
+    Rate limit: 100 requests per 60 seconds
+
+    Under ASGI the stream waits on the event loop between status checks. A
+    WSGI worker cannot do that without being held for the whole stream, so
+    there each request sends the current state once with a retry hint and
+    EventSource reconnects to poll.
+    """
+    # Check rate limit
+    is_allowed, error_response = await acheck_rate_limit(request)
+    if not is_allowed:
+        raise HttpError(429, error_response["detail"])
+
+    job = await AgentJob.objects.filter(id=job_id, user=request.user).afirst()
+    if not job:
+        raise HttpError(404, "Agent job not found")
+
+    if not isinstance(request, ASGIRequest):
+        response = HttpResponse(
+            f"retry: {AGENT_JOB_STREAM_RETRY_MS}\n{agent_job_event(job)}",
+            content_type="text/event-stream",
+        )
+    else:
+
+        async def events():
+            last_state = None
+            deadline = time.monotonic() + AGENT_JOB_STREAM_TIMEOUT
+            current = job
+            while True:
+                state = (current.status, current.completed_prompts)
+                if current.is_finished:
+                    yield agent_job_event(current)
+                    return
+                if state != last_state:
+                    yield agent_job_event(current)
+                    last_state = state
+                if time.monotonic() > deadline:
+                    yield "event: timeout\ndata: {}\n\n"
+                    return
+                await asyncio.sleep(AGENT_JOB_STREAM_POLL_INTERVAL)
+                current = await AgentJob.objects.aget(id=current.id)
+
+        response = StreamingHttpResponse(events(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
 # User Preferences Endpoints
 class SyncPreferencesRequest(Schema):
     checkupInterval: int
@@ -980,7 +1352,8 @@ class ClerkJwtTestResponse(Schema):
 )
 def sync_user_preferences(request, data: SyncPreferencesRequest):
     """
-    Sync user preferences from Clerk metadata to Django checkup intervals.
+    Sync user preferences from Clerk metadata to Django checkup intervals
+    and the stored email notification preference.
     Rate limit: 100 requests per 60 seconds
 
     This endpoint should be called when user saves email preferences in the frontend.
@@ -996,40 +1369,25 @@ def sync_user_preferences(request, data: SyncPreferencesRequest):
 
     user = request.user
 
-    # Get all checkups for the user (both 'keep' and 'give')
-    all_checkups = CheckupService.get_all_checkups(user=user)
+    # Persist the email preference so the notification job can filter in SQL
+    if user.email_notifications != data.emailNotifications:
+        user.email_notifications = data.emailNotifications
+        user.save(update_fields=["email_notifications"])
 
-    updated_checkups = []
+    # Update the interval of all the user's checkups (both 'keep' and 'give') at once
+    checkups = CheckupService.update_user_checkup_intervals(
+        user, data.checkupInterval
+    )
 
-    # Update interval for all existing checkups
-    for checkup in all_checkups:
-        updated_checkup = CheckupService.update_checkup_interval(
-            checkup.id, data.checkupInterval
-        )
-        updated_checkups.append(
-            CheckupSchema(
-                id=updated_checkup.id,
-                last_checkup_date=updated_checkup.last_checkup_date,
-                checkup_interval_months=updated_checkup.checkup_interval_months,
-                is_checkup_due=updated_checkup.is_checkup_due,
-            )
+    updated_checkups = [
+        CheckupSchema(
+            id=checkup.id,
+            last_checkup_date=checkup.last_checkup_date,
+            checkup_interval_months=checkup.checkup_interval_months,
+            is_checkup_due=checkup.is_checkup_due,
         )
-
-    # If no checkups exist, try to get them again in case they were just created
-    if not updated_checkups:
-        all_checkups = CheckupService.get_all_checkups(user=user)
-        for checkup in all_checkups:
-            updated_checkup = CheckupService.update_checkup_interval(
-                checkup.id, data.checkupInterval
-            )
-            updated_checkups.append(
-                CheckupSchema(
-                    id=updated_checkup.id,
-                    last_checkup_date=updated_checkup.last_checkup_date,
-                    checkup_interval_months=updated_checkup.checkup_interval_months,
-                    is_checkup_due=updated_checkup.is_checkup_due,
-                )
-            )
+        for checkup in checkups
+    ]
 
     return SyncPreferencesResponse(
         message="User preferences synced successfully",
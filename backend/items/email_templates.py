@@ -0,0 +1,102 @@
+"""
+Checkup reminder email templates.
+
+Templates are compiled once per process for every (checkup_type, due) variant,
+so sending a reminder only fills in the personalized slots. Sender settings are
+read from the environment once and reused for every email.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Template
+
+from .models import CheckupType
+
+SITE_URL = "https://min-now.store"
+LINK_STYLE = "color: #007bff; text-decoration: underline;"
+
+
+@dataclass(frozen=True)
+class SenderConfig:
+    api_key: str
+    from_name: str
+    from_email: str
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    subject: str
+    text: str
+    html: str
+
+
+@dataclass(frozen=True)
+class CheckupEmailTemplate:
+    subject: str
+    text: Template
+    html: Template
+
+    def render(self, **context) -> RenderedEmail:
+        """Fill the personalized slots (e.g. time_left) of the compiled template."""
+        text = self.text.substitute(**context)
+        return RenderedEmail(
+            subject=self.subject,
+            text=text,
+            html=self.html.substitute(text=text),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_sender_config() -> SenderConfig:
+    """Load MailerSend sender settings from the environment once per process."""
+    return SenderConfig(
+        api_key=os.getenv("MAILERSEND_API_TOKEN"),
+        from_name=os.getenv("DEFAULT_FROM_NAME", "Min-Now"),
+        from_email=os.getenv("MAILERSEND_SMTP_USERNAME", "MS_cGIzxA@min-now.store"),
+    )
+
+
+def _compile_template(checkup_type: str, due: bool) -> CheckupEmailTemplate:
+    if due:
+        text = f"Hi, your {checkup_type} checkup is due!"
+        link_text = "Log in to complete your checkup"
+    else:
+        text = (
+            f"Hi, your {checkup_type} checkup is not due yet. "
+            "Time left: $time_left months."
+        )
+        link_text = "Visit Min-Now"
+
+    html = (
+        "<p>$text</p><br><br>"
+        f"<p><a href='{SITE_URL}' style='{LINK_STYLE}'>{link_text}</a></p>"
+    )
+    return CheckupEmailTemplate(
+        subject=f"Your {checkup_type.capitalize()} Checkup Reminder",
+        text=Template(text),
+        html=Template(html),
+    )
+
+
+# Pre-compiled variants for the known checkup types
+CHECKUP_EMAIL_TEMPLATES = {
+    (checkup_type, due): _compile_template(checkup_type, due)
+    for checkup_type in CheckupType.values
+    for due in (True, False)
+}
+
+
+def get_checkup_email_template(checkup_type: str, due: bool) -> CheckupEmailTemplate:
+    """Return the compiled template for a checkup type, compiling unknown types on demand."""
+    template = CHECKUP_EMAIL_TEMPLATES.get((checkup_type, due))
+    if template is None:
+        template = _compile_template(checkup_type, due)
+        CHECKUP_EMAIL_TEMPLATES[(checkup_type, due)] = template
+    return template
+
+
+def render_checkup_email(checkup_type: str, due: bool = True, time_left=None):
+    """Render a checkup reminder email, returning a RenderedEmail."""
+    template = get_checkup_email_template(checkup_type, due)
+    return template.render(time_left=time_left)
@@ -0,0 +1,139 @@
+"""
+Deterministic fake chat model for exercising the add-item agent offline.
+
+FakeItemChatModel answers every prompt with a create_item tool call, using a
+canned item_json when one is registered for the prompt and a predictable item
+derived from the prompt text otherwise. Structured output (used by the combined
+batch strategy) returns the same items in one response. Responses carry
+approximate token usage (word counts) so metrics can be exercised. No network
+access is needed.
+"""
+
+import hashlib
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+
+
+def fake_usage(messages: List[BaseMessage], output: str) -> Dict[str, int]:
+    """Approximate token usage by counting words."""
+    input_tokens = sum(len(str(message.content).split()) for message in messages)
+    output_tokens = len(output.split())
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": input_tokens + output_tokens,
+    }
+
+
+def default_item_json(prompt: str) -> Dict[str, Any]:
+    """Build a predictable item for a prompt that has no canned response."""
+    return {
+        "name": prompt.split(",")[0].strip()[:255] or "Item",
+        "picture_url": "📦",
+        "item_type": "Other",
+        "status": "Keep",
+        "item_received_date": "2024-01-01T00:00:00Z",
+        "last_used": "2024-06-01T00:00:00Z",
+    }
+
+
+class FakeItemChatModel(BaseChatModel):
+    # prompt -> item_json to return; None means "answer without a tool call"
+    responses: Dict[str, Optional[Dict[str, Any]]] = {}
+    # Simulated round-trip latency in seconds per invocation
+    latency: float = 0.0
+    # Raw structured-output payload to return instead of the derived one
+    combined_response: Optional[Dict[str, Any]] = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-item-chat-model"
+
+    def bind_tools(self, tools, **kwargs):
+        # Tool calls are synthesized directly, so binding is a no-op
+        return self
+
+    def with_structured_output(self, schema, include_raw: bool = False, **kwargs):
+        """Answer a combined batch ({key: prompt} JSON) with one item per key."""
+
+        def respond(messages):
+            if self.latency:
+                time.sleep(self.latency)
+            if self.combined_response is not None:
+                payload = self.combined_response
+            else:
+                batch_prompts = json.loads(self._last_prompt(messages))
+                items = []
+                for key, prompt in batch_prompts.items():
+                    item_json = self._item_json_for(prompt)
+                    if item_json is not None:
+                        items.append({"key": key, **item_json})
+                payload = {"items": items}
+
+            if not include_raw:
+                return schema.model_validate(payload)
+
+            raw = AIMessage(
+                content="",
+                usage_metadata=fake_usage(messages, json.dumps(payload)),
+            )
+            try:
+                return {
+                    "raw": raw,
+                    "parsed": schema.model_validate(payload),
+                    "parsing_error": None,
+                }
+            except Exception as e:
+                return {"raw": raw, "parsed": None, "parsing_error": e}
+
+        return RunnableLambda(respond)
+
+    def _item_json_for(self, prompt: str) -> Optional[Dict[str, Any]]:
+        if prompt in self.responses:
+            return self.responses[prompt]
+        return default_item_json(prompt)
+
+    def _last_prompt(self, messages: List[BaseMessage]) -> str:
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                return message.content
+        return ""
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager=None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+
+        prompt = self._last_prompt(messages)
+        item_json = self._item_json_for(prompt)
+
+        if item_json is None:
+            content = "I could not find an item in that prompt."
+            message = AIMessage(
+                content=content, usage_metadata=fake_usage(messages, content)
+            )
+        else:
+            call_id = hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:12]
+            message = AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": "create_item",
+                        "args": {"item_json": item_json},
+                        "id": f"call_{call_id}",
+                    }
+                ],
+                usage_metadata=fake_usage(messages, json.dumps(item_json)),
+            )
+        return ChatResult(generations=[ChatGeneration(message=message)])
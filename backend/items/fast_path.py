@@ -0,0 +1,529 @@
+"""
+Rule-based fast path for the add-item agent.
+
+Many prompts follow a simple pattern such as "blue jacket, clothing, got it 2
+years ago". parse_item_prompt extracts the item name, ItemType, received date,
+status and ownership goal from those prompts locally and reports a confidence
+score; the agent only calls the LLM when the confidence is below the threshold.
+"""
+
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timezone as dt_timezone
+from typing import Any, Dict, Optional
+
+from dateutil.relativedelta import relativedelta
+
+from .models import ItemStatus, ItemType
+
+log = logging.getLogger(__name__)
+
+# Off by default: a confident wrong parse is saved without the LLM ever seeing it
+FAST_PATH_ENABLED = os.getenv("AGENT_FAST_PATH_ENABLED", "false").lower() == "true"
+
+# Prompts scoring below this are sent to the LLM
+FAST_PATH_MIN_CONFIDENCE = float(os.getenv("AGENT_FAST_PATH_MIN_CONFIDENCE", "0.8"))
+
+DEFAULT_EMOJI = "🤔"
+
+# Category words a user may type explicitly, e.g. "clothing" or "tech"
+CATEGORY_ALIASES = {
+    ItemType.CLOTHING_ACCESSORIES: ["clothing", "clothes", "accessory", "accessories", "apparel"],
+    ItemType.PERSONAL_CARE_ITEMS: ["personal care", "toiletries", "hygiene", "beauty"],
+    ItemType.FURNITURE_APPLIANCES: ["furniture", "appliance", "appliances"],
+    ItemType.DECOR_ART: ["decor", "decoration", "art", "artwork"],
+    ItemType.SUBSCRIPTIONS_LICENSES: ["subscription", "subscriptions", "license", "licence"],
+    ItemType.TECHNOLOGY: ["technology", "tech", "electronics", "electronic", "gadget"],
+    ItemType.VEHICLES: ["vehicle", "vehicles"],
+    ItemType.TOOLS_EQUIPMENT: ["tool", "tools", "equipment", "hardware"],
+    ItemType.OUTDOOR_GEAR: ["outdoor", "outdoors", "camping gear", "outdoor gear"],
+    ItemType.FITNESS_EQUIPMENT: ["fitness", "exercise", "gym", "workout"],
+    ItemType.TOYS_GAMES: ["toy", "toys", "game", "games"],
+    ItemType.PET_SUPPLIES: ["pet", "pets", "pet supplies"],
+    ItemType.BOOKS_MEDIA: ["book", "books", "media"],
+    ItemType.MISCELLANEOUS: ["misc", "miscellaneous"],
+    ItemType.OTHER: ["other"],
+}
+
+# Common nouns that identify the category (and an emoji) from the item name
+ITEM_KEYWORDS = {
+    ItemType.CLOTHING_ACCESSORIES: {
+        "jacket": "🧥", "coat": "🧥", "shirt": "👕", "t-shirt": "👕", "tshirt": "👕",
+        "jeans": "👖", "pants": "👖", "trousers": "👖", "dress": "👗", "skirt": "👗",
+        "shoes": "👟", "sneakers": "👟", "boots": "🥾", "hat": "🧢", "cap": "🧢",
+        "scarf": "🧣", "gloves": "🧤", "socks": "🧦", "hoodie": "👕", "sweater": "👕",
+        "watch": "⌚", "sunglasses": "🕶️", "glasses": "👓", "backpack": "🎒",
+        "bag": "👜", "purse": "👛", "wallet": "👛", "belt": "👖", "tie": "👔",
+        "necklace": "📿", "ring": "💍",
+    },
+    ItemType.PERSONAL_CARE_ITEMS: {
+        "toothbrush": "🪥", "razor": "🪒", "shampoo": "🧴", "lotion": "🧴",
+        "perfume": "🧴", "cologne": "🧴", "hairdryer": "💨", "comb": "💇",
+        "brush": "💇", "towel": "🧻",
+    },
+    ItemType.FURNITURE_APPLIANCES: {
+        "chair": "🪑", "desk": "🪑", "table": "🪑", "sofa": "🛋️", "couch": "🛋️",
+        "bed": "🛏️", "mattress": "🛏️", "lamp": "💡", "fridge": "🧊",
+        "refrigerator": "🧊", "microwave": "🍽️", "oven": "🍽️", "toaster": "🍞",
+        "blender": "🍹", "kettle": "🫖", "vacuum": "🧹", "dresser": "🗄️",
+        "shelf": "🗄️", "bookshelf": "📚", "fan": "🌀", "washer": "🧺", "dryer": "🧺",
+    },
+    ItemType.DECOR_ART: {
+        "painting": "🖼️", "poster": "🖼️", "print": "🖼️", "vase": "🏺",
+        "rug": "🧶", "candle": "🕯️", "mirror": "🪞", "plant": "🪴", "sculpture": "🗿",
+    },
+    ItemType.SUBSCRIPTIONS_LICENSES: {
+        "netflix": "📺", "spotify": "🎵", "membership": "🎫", "software": "💾",
+    },
+    ItemType.TECHNOLOGY: {
+        "laptop": "💻", "computer": "💻", "macbook": "💻", "pc": "💻",
+        "phone": "📱", "iphone": "📱", "smartphone": "📱", "tablet": "📱",
+        "ipad": "📱", "keyboard": "⌨️", "mouse": "🖱️", "monitor": "🖥️",
+        "headphones": "🎧", "earbuds": "🎧", "airpods": "🎧", "speaker": "🔊",
+        "camera": "📷", "tv": "📺", "television": "📺", "console": "🎮",
+        "charger": "🔌", "router": "📡", "printer": "🖨️", "kindle": "📱",
+    },
+    ItemType.VEHICLES: {
+        "car": "🚗", "truck": "🛻", "bike": "🚲", "bicycle": "🚲",
+        "motorcycle": "🏍️", "scooter": "🛴", "skateboard": "🛹",
+    },
+    ItemType.TOOLS_EQUIPMENT: {
+        "drill": "🛠️", "hammer": "🔨", "screwdriver": "🪛", "wrench": "🔧",
+        "saw": "🪚", "ladder": "🪜", "toolbox": "🧰",
+    },
+    ItemType.OUTDOOR_GEAR: {
+        "tent": "⛺", "sleeping bag": "🏕️", "hammock": "🏕️", "kayak": "🛶",
+        "grill": "🍖", "cooler": "🧊", "umbrella": "☂️",
+    },
+    ItemType.FITNESS_EQUIPMENT: {
+        "dumbbells": "🏋️", "dumbbell": "🏋️", "weights": "🏋️", "treadmill": "🏃",
+        "yoga mat": "🧘", "kettlebell": "🏋️", "racket": "🎾", "ball": "⚽",
+    },
+    ItemType.TOYS_GAMES: {
+        "lego": "🧱", "puzzle": "🧩", "doll": "🪆", "teddy": "🧸",
+        "board game": "🎲", "cards": "🃏", "switch": "🎮", "playstation": "🎮",
+        "xbox": "🎮",
+    },
+    ItemType.PET_SUPPLIES: {
+        "leash": "🐕", "collar": "🐕", "litter box": "🐈", "cat tree": "🐈",
+        "dog bed": "🐕", "aquarium": "🐠",
+    },
+    ItemType.BOOKS_MEDIA: {
+        "book": "📚", "novel": "📖", "magazine": "📰", "vinyl": "💿",
+        "record": "💿", "cd": "💿", "dvd": "📀", "comic": "📚",
+    },
+}
+
+CATEGORY_EMOJI = {
+    ItemType.CLOTHING_ACCESSORIES: "👕",
+    ItemType.PERSONAL_CARE_ITEMS: "🧴",
+    ItemType.FURNITURE_APPLIANCES: "🪑",
+    ItemType.DECOR_ART: "🖼️",
+    ItemType.SUBSCRIPTIONS_LICENSES: "🎫",
+    ItemType.TECHNOLOGY: "💻",
+    ItemType.VEHICLES: "🚗",
+    ItemType.TOOLS_EQUIPMENT: "🧰",
+    ItemType.OUTDOOR_GEAR: "⛺",
+    ItemType.FITNESS_EQUIPMENT: "🏋️",
+    ItemType.TOYS_GAMES: "🧸",
+    ItemType.PET_SUPPLIES: "🐾",
+    ItemType.BOOKS_MEDIA: "📚",
+}
+
+NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10, "eleven": 11,
+    "twelve": 12, "a couple of": 2, "a couple": 2, "couple of": 2, "few": 3,
+    "a few": 3,
+}
+
+MONTHS = {
+    name: index
+    for index, names in enumerate(
+        [
+            ("january", "jan"), ("february", "feb"), ("march", "mar"),
+            ("april", "apr"), ("may",), ("june", "jun"), ("july", "jul"),
+            ("august", "aug"), ("september", "sep", "sept"), ("october", "oct"),
+            ("november", "nov"), ("december", "dec"),
+        ],
+        start=1,
+    )
+    for name in names
+}
+
+_NUMBER = r"(\d+|" + "|".join(sorted(map(re.escape, NUMBER_WORDS), key=len, reverse=True)) + r")"
+_UNIT = r"(day|week|month|year)s?"
+_MONTH = r"(" + "|".join(sorted(MONTHS, key=len, reverse=True)) + r")\.?"
+
+RELATIVE_DATE_RE = re.compile(rf"\b{_NUMBER}\s+{_UNIT}\s+ago\b")
+LAST_UNIT_RE = re.compile(r"\blast\s+(week|month|year)\b")
+MONTH_YEAR_RE = re.compile(rf"\b{_MONTH}\s+(\d{{4}})\b")
+YEAR_RE = re.compile(r"\b(?:in|since|from)\s+(\d{4})\b")
+YESTERDAY_RE = re.compile(r"\byesterday\b")
+TODAY_RE = re.compile(r"\b(today|just now)\b")
+
+GOAL_RE = re.compile(
+    rf"\b(?:ownership goal:?\s*|keep (?:it |them )?for\s+){_NUMBER}\s+(month|year)s?\b"
+)
+
+DONATE_RE = re.compile(r"\b(donate|donated|donating|to donate)\b")
+GIVE_RE = re.compile(r"\b(give away|giving away|gave away|give|gave|giving)\b")
+
+# Prompts the rules would misread: negations ("I don't want to donate ...")
+# and items received from someone ("my sister gave me ...")
+NEGATION_RE = re.compile(r"\b(?:not|no|never|cannot)\b|n['’]t\b")
+RECIPIENT_RE = re.compile(
+    r"\b(?:gave|given|gifted|sent|lent|left)\s+(?:it\s+|them\s+)?(?:to\s+)?(?:me|us)\b"
+    r"|\b(?:gift|present)\s+from\b"
+    r"|\bfrom\s+(?:my|his|her|their|our|a|an|the)\b"
+)
+
+# Words that mean the name is leftover sentence text, not a noun phrase
+NON_NAME_WORDS = {
+    "i", "me", "my", "we", "us", "our", "you", "your", "he", "she", "him", "her",
+    "his", "they", "them", "their", "it", "its", "this", "that", "these", "those",
+    "a", "an", "the", "is", "am", "are", "was", "were", "be", "been", "have",
+    "has", "had", "want", "need", "would", "will", "like", "get", "got", "bought",
+    "to", "at", "of", "for", "with", "when", "which", "who",
+}
+
+# Leading phrases that carry no item information
+LEADING_PHRASE_RE = re.compile(
+    r"^(?:please\s+)?(?:add|create|track|log|record|new)?\s*"
+    r"(?:an?\s+|my\s+|the\s+|new\s+|some\s+)*"
+)
+# Filler around a date, e.g. "got it", "bought", "received"
+DATE_FILLER_RE = re.compile(
+    r"\b(i\s+)?(got|bought|purchased|received|acquired|had|have had|owned)"
+    r"(\s+(it|them|this|these))?\b|\b(since|on|in|from|about|around)\b"
+)
+
+
+@dataclass
+class FastPathResult:
+    item_json: Optional[Dict[str, Any]]
+    confidence: float
+    matched: Dict[str, bool] = field(default_factory=dict)
+
+
+class FastPathStats:
+    """Thread-safe hit/miss counters for the fast path."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+fast_path_stats = FastPathStats()
+
+
+def _to_number(token: str) -> int:
+    token = token.strip()
+    return int(token) if token.isdigit() else NUMBER_WORDS[token]
+
+
+def _start_of_day(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
+
+
+def _extract_date(text: str, today: date):
+    """Return (received_date, matched_span) for the first date phrase in text."""
+    match = RELATIVE_DATE_RE.search(text)
+    if match:
+        amount, unit = _to_number(match.group(1)), match.group(2)
+        delta = {
+            "day": relativedelta(days=amount),
+            "week": relativedelta(weeks=amount),
+            "month": relativedelta(months=amount),
+            "year": relativedelta(years=amount),
+        }[unit]
+        return today - delta, match.span()
+
+    match = MONTH_YEAR_RE.search(text)
+    if match:
+        received = date(int(match.group(2)), MONTHS[match.group(1)], 1)
+        return received, match.span()
+
+    match = LAST_UNIT_RE.search(text)
+    if match:
+        delta = {
+            "week": relativedelta(weeks=1),
+            "month": relativedelta(months=1),
+            "year": relativedelta(years=1),
+        }[match.group(1)]
+        return today - delta, match.span()
+
+    match = YEAR_RE.search(text)
+    if match:
+        return date(int(match.group(1)), 1, 1), match.span()
+
+    match = YESTERDAY_RE.search(text)
+    if match:
+        return today - relativedelta(days=1), match.span()
+
+    match = TODAY_RE.search(text)
+    if match:
+        return today, match.span()
+
+    return None, None
+
+
+def _match_category(text: str):
+    """Match an explicit category word such as "clothing" or "tech"."""
+    for item_type, aliases in CATEGORY_ALIASES.items():
+        for alias in aliases:
+            if re.search(rf"\b{re.escape(alias)}\b", text):
+                return item_type
+    return None
+
+
+def _match_keyword(name: str):
+    """
+    Match a common noun in the item name, returning (item_type, emoji).
+    The rightmost keyword wins, since it is usually the head noun
+    ("desk lamp" is a lamp).
+    """
+    best = (-1, None, None)
+    for item_type, keywords in ITEM_KEYWORDS.items():
+        for keyword, emoji in keywords.items():
+            for match in re.finditer(rf"\b{re.escape(keyword)}s?\b", name):
+                if match.start() > best[0]:
+                    best = (match.start(), item_type, emoji)
+    return best[1], best[2]
+
+
+def _clean_name(text: str) -> str:
+    text = LEADING_PHRASE_RE.sub("", text.strip(), count=1)
+    text = DATE_FILLER_RE.sub(" ", text)
+    text = re.sub(r"\s+", " ", text).strip(" .,-:;")
+    return text
+
+
+def _is_noun_phrase(name: str) -> bool:
+    return not any(word in NON_NAME_WORDS for word in re.findall(r"[a-z']+", name))
+
+
+def _title(name: str) -> str:
+    return " ".join(
+        word if any(c.isupper() for c in word) else word.capitalize()
+        for word in name.split()
+    )
+
+
+def parse_item_prompt(prompt: str, today: Optional[date] = None) -> FastPathResult:
+    """
+    Extract an item from a simple prompt without calling the LLM.
+
+    The confidence is the sum of what was understood: the item name (0.4),
+    its category (0.3 when named explicitly, 0.2 from a keyword in the name)
+    and the received date (0.3), minus 0.2 for every part that could not be
+    interpreted. Prompts that mention several items, negate something or
+    describe an item received from someone are rejected, as are names that
+    are not a plain noun phrase.
+    """
+    today = today or date.today()
+    original = prompt.strip()
+    lowered = original.lower()
+    matched = {"name": False, "category": False, "date": False}
+
+    if not lowered or " and " in lowered or ";" in lowered or "\n" in lowered:
+        return FastPathResult(None, 0.0, matched)
+    if NEGATION_RE.search(lowered) or RECIPIENT_RE.search(lowered):
+        return FastPathResult(None, 0.0, matched)
+
+    # Status and ownership goal can appear anywhere in the prompt
+    status = ItemStatus.KEEP
+    if DONATE_RE.search(lowered):
+        status = ItemStatus.DONATE
+    elif GIVE_RE.search(lowered):
+        status = ItemStatus.GIVE
+
+    goal_months = 12
+    goal_match = GOAL_RE.search(lowered)
+    if goal_match:
+        amount = _to_number(goal_match.group(1))
+        goal_months = amount * 12 if goal_match.group(2) == "year" else amount
+
+    remainder = GOAL_RE.sub(" ", lowered)
+    remainder = DONATE_RE.sub(" ", remainder)
+    remainder = GIVE_RE.sub(" ", remainder)
+
+    segments = [segment.strip() for segment in remainder.split(",") if segment.strip()]
+    if not segments:
+        return FastPathResult(None, 0.0, matched)
+
+    confidence = 0.0
+    received = None
+    item_type = None
+    unparsed = 0
+
+    name_segment = segments[0]
+    received, span = _extract_date(name_segment, today)
+    if span:
+        name_segment = name_segment[: span[0]] + name_segment[span[1] :]
+
+    for segment in segments[1:]:
+        segment_date, segment_span = (None, None) if received else _extract_date(segment, today)
+        if segment_date:
+            received = segment_date
+            leftover = _clean_name(segment[: segment_span[0]] + segment[segment_span[1] :])
+            if leftover and not _match_category(leftover):
+                unparsed += 1
+            continue
+
+        category = _match_category(segment)
+        if category and item_type is None:
+            item_type = category
+            continue
+        if _clean_name(segment):
+            unparsed += 1
+
+    name = _clean_name(name_segment)
+    if name and len(name.split()) <= 6 and _is_noun_phrase(name):
+        confidence += 0.4
+        matched["name"] = True
+    else:
+        return FastPathResult(None, 0.0, matched)
+
+    keyword_type, emoji = _match_keyword(name)
+    if item_type is not None:
+        confidence += 0.3
+        matched["category"] = True
+    elif keyword_type is not None:
+        item_type = keyword_type
+        confidence += 0.2
+        matched["category"] = True
+
+    if received is not None:
+        confidence += 0.3
+        matched["date"] = True
+
+    confidence = max(0.0, round(confidence - 0.2 * unparsed, 2))
+
+    if item_type is None:
+        item_type = ItemType.OTHER
+    if keyword_type != item_type:
+        emoji = None
+
+    # Keep the user's casing for names they capitalised themselves
+    original_name = re.search(re.escape(name), original, re.IGNORECASE)
+    display_name = original_name.group(0) if original_name else name
+
+    item_json = {
+        "name": _title(display_name),
+        "picture_url": emoji or CATEGORY_EMOJI.get(item_type, DEFAULT_EMOJI),
+        "item_type": item_type.value,
+        "status": status.value,
+        "item_received_date": _start_of_day(received or today).isoformat(),
+        "last_used": _start_of_day(today).isoformat(),
+        "ownership_duration_goal_months": goal_months,
+    }
+    return FastPathResult(item_json, confidence, matched)
+
+
+def try_fast_path(prompt: str, today: Optional[date] = None) -> Optional[Dict[str, Any]]:
+    """
+    Return the item for a prompt when the fast path is confident enough,
+    otherwise None (the caller should ask the LLM). Records hit/miss stats.
+    """
+    if not FAST_PATH_ENABLED:
+        return None
+
+    result = parse_item_prompt(prompt, today)
+    hit = result.item_json is not None and result.confidence >= FAST_PATH_MIN_CONFIDENCE
+    fast_path_stats.record(hit)
+    log.debug(
+        f"Fast path {'hit' if hit else 'miss'} (confidence {result.confidence}): {prompt[:100]}"
+    )
+    return result.item_json if hit else None
+
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "fast_path_corpus.json")
+
+# Fields compared when measuring agreement with the LLM
+AGREEMENT_FIELDS = ("name", "item_type", "status", "item_received_date")
+
+
+def _comparable(field_name: str, value):
+    if value is None:
+        return None
+    if field_name == "name":
+        return str(value).strip().lower()
+    if field_name == "item_received_date":
+        # Dates agree when they fall in the same month
+        return str(value)[:7]
+    return str(value)
+
+
+def evaluate_fast_path(cases, today: date, threshold: float = None) -> Dict[str, Any]:
+    """
+    Measure the fast path on labeled cases of {"prompt", "expected"}, where
+    expected holds the LLM's item for the prompt. Returns the hit rate and,
+    for the hits, the share of items (and of each field) that agree.
+    """
+    threshold = FAST_PATH_MIN_CONFIDENCE if threshold is None else threshold
+    hits = 0
+    agreed_items = 0
+    field_agreement = {field_name: 0 for field_name in AGREEMENT_FIELDS}
+    disagreements = []
+
+    for case in cases:
+        result = parse_item_prompt(case["prompt"], today)
+        if result.item_json is None or result.confidence < threshold:
+            continue
+        hits += 1
+
+        expected = case["expected"]
+        mismatched = [
+            field_name
+            for field_name in AGREEMENT_FIELDS
+            if _comparable(field_name, result.item_json.get(field_name))
+            != _comparable(field_name, expected.get(field_name))
+        ]
+        for field_name in AGREEMENT_FIELDS:
+            if field_name not in mismatched:
+                field_agreement[field_name] += 1
+        if mismatched:
+            disagreements.append(
+                {"prompt": case["prompt"], "fields": mismatched, "item": result.item_json}
+            )
+        else:
+            agreed_items += 1
+
+    total = len(cases)
+    return {
+        "total": total,
+        "hits": hits,
+        "hit_rate": round(hits / total, 4) if total else 0.0,
+        "agreement": round(agreed_items / hits, 4) if hits else 0.0,
+        "field_agreement": {
+            field_name: round(count / hits, 4) if hits else 0.0
+            for field_name, count in field_agreement.items()
+        },
+        "disagreements": disagreements,
+    }
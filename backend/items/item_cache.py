@@ -0,0 +1,109 @@
+"""
+Per-user cache of the item rows behind GET /items, in Django's cache framework
+(locmem by default, Redis when REDIS_URL is set), and the per-user version
+counters the ETags of GET /items, /checkups and /badges/donated are built from.
+
+Each user has a version counter per scope ("items", "checkups") that
+ItemService and CheckupService bump on every write. Cached rows are keyed by
+that version, so a write makes the old entry unreachable instead of deleting
+it, and it simply expires. Only raw column values are cached: durations and
+badge/goal progress depend on the current time and are recomputed on read by
+building unsaved OwnedItem instances from the rows, which needs no database
+access.
+
+With the locmem backend every web process has its own cache and counters, so
+a write in one worker is not seen by another. Production only enables the
+cache (ITEM_CACHE_ENABLED) and ETags (ETAGS_ENABLED) by default when a shared
+Redis cache is configured.
+"""
+
+import logging
+import time
+from typing import Dict, List
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import OwnedItem
+
+log = logging.getLogger(__name__)
+
+ITEMS = "items"
+CHECKUPS = "checkups"
+
+
+def item_cache_enabled() -> bool:
+    return getattr(settings, "ITEM_CACHE_ENABLED", False)
+
+
+def _version_key(user_id, scope: str) -> str:
+    return f"user:{user_id}:{scope}:version"
+
+
+def _initial_version() -> int:
+    # Start from the clock rather than 1, so a counter that was evicted does not
+    # restart at a version whose cached rows may still be around
+    return int(time.time() * 1000)
+
+
+def get_version(user_id, scope: str = ITEMS) -> int:
+    """Current version of a user's data in the given scope."""
+    key = _version_key(user_id, scope)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _initial_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(user_id, scope: str = ITEMS):
+    """Invalidate everything cached for a user's data in the given scope."""
+    key = _version_key(user_id, scope)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # No counter yet (or it was evicted): any new start is a new version
+        cache.add(key, _initial_version(), timeout=None)
+    except Exception as e:
+        log.warning(f"Could not bump {scope} cache version for user {user_id}: {e}")
+
+
+def user_etag(user_id, scope: str, today=None) -> str:
+    """
+    Weak ETag for a user's data in a scope. The date is part of it because
+    durations, progress and due checkups change with time, not only on writes.
+    """
+    today = today or timezone.now().date()
+    return f'W/"{scope}-{user_id}-{get_version(user_id, scope)}-{today.isoformat()}"'
+
+
+def _item_fields() -> List[str]:
+    return [field.attname for field in OwnedItem._meta.concrete_fields]
+
+
+def get_item_rows(user) -> List[Dict]:
+    """Raw column values of all of a user's items, from the cache when possible."""
+    queryset = OwnedItem.objects.filter(user=user)
+    if not item_cache_enabled():
+        return list(queryset.values(*_item_fields()))
+
+    try:
+        key = f"user:{user.id}:{ITEMS}:v{get_version(user.id)}:rows"
+        rows = cache.get(key)
+    except Exception as e:
+        log.warning(f"Item cache unavailable, reading from the database: {e}")
+        return list(queryset.values(*_item_fields()))
+
+    if rows is None:
+        rows = list(queryset.values(*_item_fields()))
+        try:
+            cache.set(key, rows, getattr(settings, "ITEM_CACHE_TTL_SECONDS", 300))
+        except Exception as e:
+            log.warning(f"Could not cache items for user {user.id}: {e}")
+    return rows
+
+
+def items_from_rows(rows: List[Dict]) -> List[OwnedItem]:
+    """Unsaved OwnedItem instances whose time-dependent properties are current."""
+    return [OwnedItem(**row) for row in rows]
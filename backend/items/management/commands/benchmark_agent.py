@@ -0,0 +1,224 @@
+"""
+Django management command to benchmark the add-item agent offline.
+
+The agent runs against FakeItemChatModel with a configurable per-call latency,
+so no OpenAI (or Clerk) requests are made and it can run in CI. Every scenario
+runs inside a transaction that is rolled back, including the benchmark user.
+"""
+
+import json
+import time
+import uuid
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+
+class QueryTimer:
+    """Accumulates the time spent in database queries (execute_wrapper hook)."""
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.queries += 1
+
+
+@contextmanager
+def offline_agent():
+    # Treat the benchmark user as an admin: no item limit and no Clerk lookup
+    with patch("items.models.is_user_admin", return_value=True):
+        yield
+
+
+class Command(BaseCommand):
+    help = "Benchmark the add-item agent against a fake chat model (no network)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--prompts",
+            type=int,
+            default=8,
+            help="Number of generated prompts per scenario (default: 8)",
+        )
+        parser.add_argument(
+            "--prompts-file",
+            type=str,
+            help="JSON file with a {key: prompt} object to use instead of generated prompts",
+        )
+        parser.add_argument(
+            "--responses-file",
+            type=str,
+            help="JSON file of recorded {prompt: item_json} responses to replay",
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.2,
+            help="Simulated LLM latency in seconds per call (default: 0.2)",
+        )
+        parser.add_argument(
+            "--strategies",
+            type=str,
+            default="sequential,concurrent,combined",
+            help="Comma-separated batch strategies to run",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=str,
+            default="1,4,8",
+            help="Comma-separated max concurrency values for the concurrent strategy",
+        )
+        parser.add_argument(
+            "--fast-path",
+            action="store_true",
+            help="Let the rule-based fast path answer prompts (off by default)",
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Print the results as JSON"
+        )
+
+    def handle(self, *args, **options):
+        from items.addItemAgent import BATCH_STRATEGIES
+        from items.fake_chat_model import FakeItemChatModel
+
+        strategies = [s.strip() for s in options["strategies"].split(",") if s.strip()]
+        unknown = [s for s in strategies if s not in BATCH_STRATEGIES]
+        if unknown:
+            raise CommandError(f"Unknown strategies: {', '.join(unknown)}")
+        try:
+            concurrency_values = [int(c) for c in options["concurrency"].split(",")]
+        except ValueError:
+            raise CommandError("--concurrency must be a comma-separated list of integers")
+
+        batch_prompts = self._load_prompts(options)
+        responses = self._load_json(options.get("responses_file")) or {}
+        llm = FakeItemChatModel(responses=responses, latency=options["latency"])
+
+        report = {
+            "prompts": len(batch_prompts),
+            "latency_seconds": options["latency"],
+            "scenarios": [],
+        }
+
+        scenarios = []
+        for strategy in strategies:
+            if strategy == "concurrent":
+                scenarios.extend((strategy, c) for c in concurrency_values)
+            else:
+                scenarios.append((strategy, None))
+
+        for strategy, max_concurrency in scenarios:
+            report["scenarios"].append(
+                self._run_scenario(
+                    batch_prompts, llm, strategy, max_concurrency, options["fast_path"]
+                )
+            )
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        self._print_report(report)
+
+    def _load_json(self, path):
+        if not path:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise CommandError(f"Could not read {path}: {e}")
+
+    def _load_prompts(self, options):
+        prompts = self._load_json(options.get("prompts_file"))
+        if prompts is not None:
+            if not isinstance(prompts, dict) or not prompts:
+                raise CommandError("--prompts-file must contain a non-empty JSON object")
+            return prompts
+
+        count = options["prompts"]
+        if count < 1:
+            raise CommandError("--prompts must be at least 1")
+        return {
+            f"item{i}": f"benchmark item {i}, got it {i % 5 + 1} years ago"
+            for i in range(count)
+        }
+
+    def _run_scenario(self, batch_prompts, llm, strategy, max_concurrency, fast_path):
+        from items.addItemAgent import run_agent
+        from items.agent_cache import prompt_cache
+        from items.models import OwnedItem
+
+        prompt_cache.clear()
+        timer = QueryTimer()
+
+        # --fast-path turns the parser on even though it is off by default
+        with offline_agent(), patch(
+            "items.fast_path.FAST_PATH_ENABLED", fast_path
+        ), transaction.atomic():
+            suffix = uuid.uuid4().hex[:12]
+            user = get_user_model().objects.create_user(
+                username=f"benchmark_{suffix}",
+                clerk_id=f"benchmark_{suffix}",
+                email=f"benchmark_{suffix}@example.com",
+            )
+
+            start = time.perf_counter()
+            # Every strategy inserts on this thread, so the wrapper sees all
+            # agent queries and the uncommitted benchmark user
+            with connection.execute_wrapper(timer):
+                result = run_agent(
+                    batch_prompts,
+                    strategy=strategy,
+                    max_concurrency=max_concurrency,
+                    llm=llm,
+                    fast_path=fast_path,
+                    user=user,
+                )
+            elapsed = time.perf_counter() - start
+            created = OwnedItem.objects.filter(user=user).count()
+            failed = sum(
+                1 for r in result["results"].values() if r["status"] == "failed"
+            )
+
+            # Leave no benchmark data behind
+            transaction.set_rollback(True)
+
+        return {
+            "strategy": strategy,
+            "max_concurrency": max_concurrency,
+            "total_ms": round(elapsed * 1000, 2),
+            "per_prompt_ms": round(elapsed * 1000 / len(batch_prompts), 2),
+            "db_ms": round(timer.seconds * 1000, 2),
+            "db_queries": timer.queries,
+            "items_created": created,
+            "prompts_failed": failed,
+        }
+
+    def _print_report(self, report):
+        self.stdout.write(
+            f"🤖 Agent benchmark: {report['prompts']} prompts, "
+            f"{report['latency_seconds']}s simulated LLM latency"
+        )
+        self.stdout.write("")
+        self.stdout.write(
+            f"{'strategy':<12}{'concurrency':>12}{'total ms':>12}{'ms/prompt':>12}"
+            f"{'db ms':>10}{'queries':>9}{'items':>7}{'failed':>8}"
+        )
+        for s in report["scenarios"]:
+            concurrency = "-" if s["max_concurrency"] is None else s["max_concurrency"]
+            self.stdout.write(
+                f"{s['strategy']:<12}{concurrency:>12}{s['total_ms']:>12}"
+                f"{s['per_prompt_ms']:>12}{s['db_ms']:>10}{s['db_queries']:>9}"
+                f"{s['items_created']:>7}{s['prompts_failed']:>8}"
+            )
+        self.stdout.write(self.style.SUCCESS("✅ Benchmark complete (all data rolled back)"))
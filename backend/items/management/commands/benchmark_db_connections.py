@@ -0,0 +1,138 @@
+"""
+Django management command to measure what database connection reuse saves.
+
+Simulates the request cycle Django runs for every API request (obsolete
+connections are closed when a request starts and finishes, and the first query
+opens or health checks a connection) against two private connections to the
+default database:
+
+  - "per-request": a new connection every request (CONN_MAX_AGE = 0, no pool),
+    the behaviour before connection reuse was configured
+  - "configured":  the current settings (persistent connections or DB_POOL)
+
+The difference in per-request latency is what each request saves on the
+connection (and, in production, TLS) handshake.
+"""
+
+import copy
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.utils import load_backend
+
+
+def per_request_settings(settings_dict):
+    settings_dict = copy.deepcopy(settings_dict)
+    settings_dict["CONN_MAX_AGE"] = 0
+    settings_dict["CONN_HEALTH_CHECKS"] = False
+    settings_dict.get("OPTIONS", {}).pop("pool", None)
+    return settings_dict
+
+
+class Command(BaseCommand):
+    help = "Compare per-request latency with a new database connection per request vs. the configured reuse"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=50,
+            help="Simulated requests per scenario (default: 50)",
+        )
+        parser.add_argument(
+            "--queries",
+            type=int,
+            default=3,
+            help="Queries per simulated request (default: 3)",
+        )
+        parser.add_argument(
+            "--database",
+            type=str,
+            default="default",
+            help="Database alias to benchmark (default: default)",
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Print the results as JSON"
+        )
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1 or options["queries"] < 1:
+            raise CommandError("--requests and --queries must be at least 1")
+        if options["database"] not in connections:
+            raise CommandError(f"Unknown database alias: {options['database']}")
+
+        settings_dict = connections[options["database"]].settings_dict
+        scenarios = {
+            "per-request": per_request_settings(settings_dict),
+            "configured": copy.deepcopy(settings_dict),
+        }
+        report = {
+            "requests": options["requests"],
+            "queries_per_request": options["queries"],
+            "conn_max_age": settings_dict.get("CONN_MAX_AGE", 0),
+            "health_checks": settings_dict.get("CONN_HEALTH_CHECKS", False),
+            "pool": bool(settings_dict.get("OPTIONS", {}).get("pool")),
+            "scenarios": {
+                name: self._run_scenario(name, scenario_settings, options)
+                for name, scenario_settings in scenarios.items()
+            },
+        }
+        report["saved_ms_per_request"] = round(
+            report["scenarios"]["per-request"]["mean_ms"]
+            - report["scenarios"]["configured"]["mean_ms"],
+            3,
+        )
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        self._print_report(report)
+
+    def _run_scenario(self, name, settings_dict, options):
+        backend = load_backend(settings_dict["ENGINE"])
+        # A private alias, so a pool is never shared with the app's connections
+        connection = backend.DatabaseWrapper(settings_dict, f"benchmark-{name}")
+
+        timings = []
+        try:
+            for _ in range(options["requests"]):
+                start = time.perf_counter()
+                # request_started / request_finished both call this
+                connection.close_if_unusable_or_obsolete()
+                with connection.cursor() as cursor:
+                    for _ in range(options["queries"]):
+                        cursor.execute("SELECT 1")
+                        cursor.fetchone()
+                connection.close_if_unusable_or_obsolete()
+                timings.append(time.perf_counter() - start)
+        finally:
+            connection.close()
+            if hasattr(connection, "close_pool"):
+                connection.close_pool()
+
+        timings.sort()
+        return {
+            "mean_ms": round(sum(timings) / len(timings) * 1000, 3),
+            "p50_ms": round(timings[len(timings) // 2] * 1000, 3),
+            "max_ms": round(timings[-1] * 1000, 3),
+        }
+
+    def _print_report(self, report):
+        mode = "pool" if report["pool"] else f"CONN_MAX_AGE={report['conn_max_age']}"
+        self.stdout.write(
+            f"🐘 {report['requests']} simulated requests, "
+            f"{report['queries_per_request']} queries each ({mode}, "
+            f"health checks {'on' if report['health_checks'] else 'off'})"
+        )
+        for name, result in report["scenarios"].items():
+            self.stdout.write(
+                f"   {name:<12} mean {result['mean_ms']:>8} ms  "
+                f"p50 {result['p50_ms']:>8} ms  max {result['max_ms']:>8} ms"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Connection reuse saves {report['saved_ms_per_request']} ms per request"
+            )
+        )
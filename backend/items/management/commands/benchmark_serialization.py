@@ -0,0 +1,170 @@
+"""
+Django management command to benchmark serialization of GET /items payloads.
+
+Builds unsaved OwnedItem instances (no database needed) and times each
+pipeline from model instances to response body, the way Ninja handles a
+List[OwnedItemSchema] response: build the schemas in the view, validate and
+dump them against the response model, then render JSON. The "dict" pipeline
+is the fast path GET /items uses, which skips pydantic entirely. Reports time
+per payload and per item and peak traced memory (tracemalloc).
+"""
+
+import json
+import statistics
+import time
+import tracemalloc
+import uuid
+from datetime import timedelta
+from typing import List
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from ninja.renderers import JSONRenderer
+from pydantic import TypeAdapter
+
+from minNow.renderers import ORJSONRenderer
+
+
+def build_items(count):
+    from items.models import ItemStatus, ItemType, OwnedItem
+
+    # Whole seconds: pydantic's JSON (used by the parity tests) keeps microseconds,
+    # the renderers truncate to milliseconds
+    now = timezone.now().replace(microsecond=0)
+    types = [choice for choice, _ in ItemType.choices]
+    statuses = [choice for choice, _ in ItemStatus.choices]
+    return [
+        OwnedItem(
+            id=uuid.uuid4(),
+            user_id=1,
+            name=f"Benchmark item {i}",
+            picture_url="📦",
+            item_type=types[i % len(types)],
+            status=statuses[i % len(statuses)],
+            item_received_date=now - timedelta(days=37 * i + 11),
+            last_used=now - timedelta(days=3 * i),
+            ownership_duration_goal_months=12 + i % 24,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def schema_pipeline(renderer):
+    """The current GET /items path with the given renderer."""
+    from items.api import OwnedItemSchema
+
+    adapter = TypeAdapter(List[OwnedItemSchema])
+
+    def serialize(items):
+        result = [OwnedItemSchema.from_orm(item) for item in items]
+        data = adapter.dump_python(adapter.validate_python(result))
+        return renderer.render(None, data, response_status=200)
+
+    return serialize
+
+
+def dict_pipeline(renderer):
+    """The GET /items fast path: plain dicts, no response validation."""
+    from items.api import OwnedItemSchema
+
+    def serialize(items):
+        data = OwnedItemSchema.dicts_from_orm(items)
+        return renderer.render(None, data, response_status=200)
+
+    return serialize
+
+
+def get_pipelines():
+    return {
+        "schema + json": schema_pipeline(JSONRenderer()),
+        "schema + orjson": schema_pipeline(ORJSONRenderer()),
+        "dict + orjson": dict_pipeline(ORJSONRenderer()),
+    }
+
+
+class Command(BaseCommand):
+    help = "Benchmark GET /items response serialization (schemas, JSON renderers)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--items",
+            type=int,
+            default=50,
+            help="Items per payload (default: 50)",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=200,
+            help="Payloads serialized per pipeline (default: 200)",
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Print the results as JSON"
+        )
+
+    def handle(self, *args, **options):
+        if options["items"] < 1 or options["iterations"] < 1:
+            raise CommandError("--items and --iterations must be at least 1")
+
+        items = build_items(options["items"])
+        pipelines = get_pipelines()
+        baseline_name = next(iter(pipelines))
+        reference = json.loads(pipelines[baseline_name](items))
+
+        results = []
+        for name, serialize in pipelines.items():
+            body = serialize(items)  # warm up
+
+            tracemalloc.start()
+            serialize(items)
+            _, peak_bytes = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            timings = []
+            for _ in range(options["iterations"]):
+                start = time.perf_counter()
+                serialize(items)
+                timings.append(time.perf_counter() - start)
+            results.append(
+                {
+                    "pipeline": name,
+                    "mean_ms": round(statistics.mean(timings) * 1000, 3),
+                    "min_ms": round(min(timings) * 1000, 3),
+                    "us_per_item": round(
+                        statistics.mean(timings) * 1e6 / options["items"], 2
+                    ),
+                    "peak_kb": round(peak_bytes / 1024, 1),
+                    "bytes": len(body.encode() if isinstance(body, str) else body),
+                    "matches_baseline": json.loads(body) == reference,
+                }
+            )
+
+        baseline_ms = results[0]["mean_ms"]
+        for result in results:
+            result["speedup"] = round(baseline_ms / result["mean_ms"], 2)
+
+        report = {
+            "items": options["items"],
+            "iterations": options["iterations"],
+            "baseline": baseline_name,
+            "pipelines": results,
+        }
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(
+            f"📦 Serializing {report['items']} items x {report['iterations']} iterations"
+        )
+        self.stdout.write(
+            f"{'pipeline':<20}{'mean ms':>10}{'min ms':>10}{'us/item':>10}"
+            f"{'peak KB':>10}{'bytes':>9}{'speedup':>9}  parity"
+        )
+        for r in results:
+            self.stdout.write(
+                f"{r['pipeline']:<20}{r['mean_ms']:>10}{r['min_ms']:>10}{r['us_per_item']:>10}"
+                f"{r['peak_kb']:>10}{r['bytes']:>9}{r['speedup']:>8}x  "
+                f"{'✅' if r['matches_baseline'] else '❌'}"
+            )
+        self.stdout.write(self.style.SUCCESS("✅ Benchmark complete"))
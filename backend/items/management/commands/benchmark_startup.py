@@ -0,0 +1,130 @@
+"""
+Django management command to measure web worker startup cost.
+
+Each scenario boots Django in a fresh interpreter under `python -X importtime`,
+loads the URLconf (which imports every API module, as a worker does on its
+first request) and reports wall time, peak resident memory and the slowest
+imports. The "agent" scenario also imports the add-item agent, showing what
+every worker paid before the agent was loaded lazily.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+BOOT_SCRIPT = """
+import json, resource, sys, time
+start = time.perf_counter()
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+{extra}
+print(json.dumps({{
+    "seconds": time.perf_counter() - start,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "agent_loaded": "items.addItemAgent" in sys.modules,
+    "langchain_loaded": any(m.startswith(("langchain", "langgraph")) for m in sys.modules),
+}}))
+"""
+
+SCENARIOS = {
+    "api": "",
+    "agent": "import items.addItemAgent",
+}
+
+
+def parse_importtime(stderr: str):
+    """Return [(cumulative_us, module)] from `-X importtime` output."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:") :].split("|")
+        try:
+            cumulative = int(parts[1].strip())
+        except ValueError:
+            continue  # header line
+        imports.append((cumulative, parts[2].rstrip()))
+    return imports
+
+
+class Command(BaseCommand):
+    help = "Measure Django worker boot time and memory with and without the add-item agent"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=3,
+            help="Boots per scenario; the fastest is reported (default: 3)",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=10,
+            help="Number of slowest top-level imports to list (default: 10)",
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Print the results as JSON"
+        )
+
+    def handle(self, *args, **options):
+        if options["runs"] < 1:
+            raise CommandError("--runs must be at least 1")
+
+        report = {
+            name: self._measure(extra, options["runs"], options["top"])
+            for name, extra in SCENARIOS.items()
+        }
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        for name, result in report.items():
+            self.stdout.write(
+                f"🚀 {name}: {result['seconds'] * 1000:.0f} ms, "
+                f"{result['max_rss_kb'] / 1024:.1f} MB peak RSS, "
+                f"agent loaded: {'yes' if result['agent_loaded'] else 'no'}, "
+                f"LangChain loaded: {'yes' if result['langchain_loaded'] else 'no'}"
+            )
+            for cumulative_us, module in result["slowest_imports"]:
+                self.stdout.write(f"   {cumulative_us / 1000:8.1f} ms  {module.strip()}")
+
+        api, agent = report["api"], report["agent"]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ Lazy agent import saves {(agent['seconds'] - api['seconds']) * 1000:.0f} ms "
+                f"and {(agent['max_rss_kb'] - api['max_rss_kb']) / 1024:.1f} MB per worker"
+            )
+        )
+
+    def _measure(self, extra, runs, top):
+        env = dict(os.environ)
+        env.setdefault("DJANGO_SETTINGS_MODULE", "minNow.settings")
+
+        best = None
+        for _ in range(runs):
+            completed = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT.format(extra=extra)],
+                cwd=settings.BASE_DIR,
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+            if completed.returncode != 0:
+                raise CommandError(f"Boot failed:\n{completed.stderr[-2000:]}")
+
+            result = json.loads(completed.stdout.strip().splitlines()[-1])
+            if best is None or result["seconds"] < best["seconds"]:
+                imports = parse_importtime(completed.stderr)
+                # Top-level imports are the ones without leading indentation
+                top_level = [(us, m) for us, m in imports if not m.startswith("  ")]
+                result["slowest_imports"] = sorted(top_level, reverse=True)[:top]
+                best = result
+        return best
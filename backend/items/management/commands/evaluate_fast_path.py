@@ -0,0 +1,106 @@
+"""
+Django management command to measure the add-item fast path against a labeled
+corpus: how many prompts it answers without the LLM (hit rate) and how often
+its items agree with the LLM's.
+
+The corpus records the reference date its labels were made against. With
+--live-llm the model is told that date too, so relative dates ("2 years ago")
+are compared like for like. --record rebuilds the corpus labels from the
+live LLM answers, using today as the new reference date.
+"""
+
+import json
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Report the add-item fast path hit rate and agreement with the LLM"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--corpus",
+            type=str,
+            help="Path of the labeled corpus JSON (default: items/fast_path_corpus.json)",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            help="Minimum confidence for a fast path hit (default: AGENT_FAST_PATH_MIN_CONFIDENCE)",
+        )
+        parser.add_argument(
+            "--live-llm",
+            action="store_true",
+            help="Compare against fresh LLM answers instead of the corpus labels (calls the API)",
+        )
+        parser.add_argument(
+            "--record",
+            action="store_true",
+            help="With --live-llm, write the LLM answers back to the corpus as its labels",
+        )
+
+    def handle(self, *args, **options):
+        from items.fast_path import CORPUS_PATH, evaluate_fast_path
+
+        corpus_path = options.get("corpus") or CORPUS_PATH
+        try:
+            with open(corpus_path, "r", encoding="utf-8") as f:
+                corpus = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise CommandError(f"Could not read corpus {corpus_path}: {e}")
+
+        if options["record"] and not options["live_llm"]:
+            raise CommandError("--record needs --live-llm")
+
+        # Recorded labels are made against today; otherwise keep the corpus date
+        if options["record"] or not corpus.get("today"):
+            today = date.today()
+        else:
+            today = date.fromisoformat(corpus["today"])
+        cases = corpus["cases"]
+
+        if options["live_llm"]:
+            from items.addItemAgent import plan_items_for_prompt
+
+            self.stdout.write(
+                f"🤖 Asking the LLM for {len(cases)} prompts (reference date {today})..."
+            )
+            live_cases = []
+            for case in cases:
+                try:
+                    items = plan_items_for_prompt(
+                        case["prompt"], fast_path=False, today=today
+                    )
+                except Exception as e:
+                    self.stdout.write(
+                        self.style.WARNING(f"⚠️ LLM failed for '{case['prompt']}': {e}")
+                    )
+                    continue
+                live_cases.append({"prompt": case["prompt"], "expected": items[0]})
+            cases = live_cases
+
+            if options["record"]:
+                recorded = {"today": today.isoformat(), "source": "llm", "cases": cases}
+                with open(corpus_path, "w", encoding="utf-8") as f:
+                    json.dump(recorded, f, ensure_ascii=False, indent=2)
+                self.stdout.write(f"💾 Recorded {len(cases)} LLM labels to {corpus_path}")
+
+        report = evaluate_fast_path(cases, today, options.get("threshold"))
+
+        self.stdout.write(f"📋 Prompts evaluated: {report['total']}")
+        self.stdout.write(
+            f"⚡ Fast path hits: {report['hits']} (hit rate {report['hit_rate']:.1%})"
+        )
+        self.stdout.write(f"🤝 Agreement with LLM on hits: {report['agreement']:.1%}")
+        for field_name, share in report["field_agreement"].items():
+            self.stdout.write(f"   - {field_name}: {share:.1%}")
+
+        for disagreement in report["disagreements"]:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"❌ '{disagreement['prompt']}' differs on {', '.join(disagreement['fields'])}"
+                )
+            )
+
+        self.stdout.write(self.style.SUCCESS("✅ Fast path evaluation complete"))
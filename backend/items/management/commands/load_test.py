@@ -0,0 +1,183 @@
+"""
+Django management command to load test a running API server.
+
+Fires requests at a fixed concurrency and reports throughput, latency
+percentiles and, given the server's worker PIDs, their combined resident
+memory. Comparing requests per second per GB of RSS between a WSGI (sync
+workers) and an ASGI (uvicorn workers) deployment shows how much concurrency
+each serves for the same memory budget.
+"""
+
+import asyncio
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def resident_memory_kb(pids):
+    """Sum VmRSS of the given processes from /proc (Linux only)."""
+    total = 0
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/status", "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+                        break
+        except OSError as e:
+            raise CommandError(f"Could not read memory of process {pid}: {e}")
+    return total
+
+
+class Command(BaseCommand):
+    help = "Load test an API endpoint at fixed concurrency and report throughput per GB of RSS"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--url",
+            type=str,
+            default="http://localhost:8000/api/items",
+            help="Endpoint to request (default: http://localhost:8000/api/items)",
+        )
+        parser.add_argument(
+            "--method", type=str, default="GET", help="HTTP method (default: GET)"
+        )
+        parser.add_argument(
+            "--body", type=str, help="JSON request body, e.g. for POST endpoints"
+        )
+        parser.add_argument(
+            "--token", type=str, help="Bearer token sent in the Authorization header"
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=50,
+            help="Requests in flight at once (default: 50)",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=500,
+            help="Total number of requests (default: 500)",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=30.0,
+            help="Per-request timeout in seconds (default: 30)",
+        )
+        parser.add_argument(
+            "--pids",
+            type=str,
+            help="Comma-separated server worker PIDs whose RSS is summed after the run",
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Print the results as JSON"
+        )
+
+    def handle(self, *args, **options):
+        if options["concurrency"] < 1 or options["requests"] < 1:
+            raise CommandError("--concurrency and --requests must be at least 1")
+        body = None
+        if options.get("body"):
+            try:
+                body = json.loads(options["body"])
+            except json.JSONDecodeError as e:
+                raise CommandError(f"--body is not valid JSON: {e}")
+        pids = []
+        if options.get("pids"):
+            try:
+                pids = [int(p) for p in options["pids"].split(",") if p.strip()]
+            except ValueError:
+                raise CommandError("--pids must be a comma-separated list of integers")
+
+        latencies, statuses, elapsed = asyncio.run(self._run(options, body))
+
+        latencies.sort()
+        report = {
+            "url": options["url"],
+            "concurrency": options["concurrency"],
+            "requests": options["requests"],
+            "seconds": round(elapsed, 3),
+            "requests_per_second": round(len(latencies) / elapsed, 2),
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+            "statuses": {str(k): v for k, v in sorted(statuses.items(), key=str)},
+        }
+        if pids:
+            rss_kb = resident_memory_kb(pids)
+            report["rss_mb"] = round(rss_kb / 1024, 1)
+            report["requests_per_second_per_gb"] = round(
+                report["requests_per_second"] / (rss_kb / 1024 / 1024), 2
+            )
+
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+        self._print_report(report)
+
+    async def _run(self, options, body):
+        import httpx
+
+        headers = {}
+        if options.get("token"):
+            headers["Authorization"] = f"Bearer {options['token']}"
+
+        latencies = []
+        statuses = {}
+        remaining = iter(range(options["requests"]))
+        limits = httpx.Limits(max_connections=options["concurrency"])
+
+        async with httpx.AsyncClient(
+            headers=headers, timeout=options["timeout"], limits=limits
+        ) as client:
+
+            async def worker():
+                # Each worker keeps one request in flight until the budget is spent
+                for _ in remaining:
+                    start = time.perf_counter()
+                    try:
+                        response = await client.request(
+                            options["method"], options["url"], json=body
+                        )
+                        status = response.status_code
+                    except httpx.HTTPError as e:
+                        status = type(e).__name__
+                    latencies.append(time.perf_counter() - start)
+                    statuses[status] = statuses.get(status, 0) + 1
+
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(options["concurrency"])))
+            elapsed = time.perf_counter() - start
+
+        return latencies, statuses, elapsed
+
+    def _print_report(self, report):
+        self.stdout.write(
+            f"🔥 {report['requests']} requests to {report['url']} "
+            f"at concurrency {report['concurrency']}"
+        )
+        self.stdout.write(
+            f"⏱️ {report['seconds']} s, {report['requests_per_second']} req/s, "
+            f"p50 {report['p50_ms']} ms, p95 {report['p95_ms']} ms, p99 {report['p99_ms']} ms"
+        )
+        self.stdout.write(
+            "📊 Status codes: "
+            + ", ".join(f"{k}: {v}" for k, v in report["statuses"].items())
+        )
+        if "rss_mb" in report:
+            self.stdout.write(
+                f"🧠 Worker RSS: {report['rss_mb']} MB, "
+                f"{report['requests_per_second_per_gb']} req/s per GB"
+            )
+        self.stdout.write(self.style.SUCCESS("✅ Load test complete"))
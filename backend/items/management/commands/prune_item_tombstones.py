@@ -0,0 +1,18 @@
+"""
+Management command to delete old item tombstones.
+
+Tombstones let GET /items/changes report deleted items. Clients whose cursor
+is older than ITEM_TOMBSTONE_RETENTION_DAYS get a full resync instead, so
+older tombstones are no longer needed. Schedule alongside the daily tasks.
+"""
+
+from django.core.management.base import BaseCommand
+from items.services import ItemService
+
+
+class Command(BaseCommand):
+    help = "Delete item tombstones older than ITEM_TOMBSTONE_RETENTION_DAYS"
+
+    def handle(self, *args, **options):
+        deleted = ItemService.prune_item_tombstones()
+        self.stdout.write(self.style.SUCCESS(f"🧹 Deleted {deleted} old item tombstone(s)"))
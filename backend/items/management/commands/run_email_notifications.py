@@ -3,11 +3,15 @@ Django management command to send checkup emails to users with email notificatio
 This replaces the Celery periodic task with a Windows Task Scheduler approach.
 """
 
+import argparse
 import logging
 import os
+import subprocess
+import sys
 from datetime import datetime
 from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
+from django.db.models import F
 from clerk_backend_api import Clerk
 from items.services import CheckupService
 from users.models import User
@@ -15,6 +19,12 @@ from users.models import User
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Clerk's users.list endpoint accepts at most 500 users per page
+CLERK_USERS_PAGE_SIZE = 500
+
+# users.list accepts at most 100 user_id filters per request
+CLERK_USER_ID_FILTER_SIZE = 100
+
 
 def has_email_notifications_enabled(user) -> bool:
     """
@@ -39,6 +49,79 @@ def has_email_notifications_enabled(user) -> bool:
         return False
 
 
+def fetch_email_notification_preferences(page_size=CLERK_USERS_PAGE_SIZE, clerk_ids=None):
+    """
+    Fetch the Clerk ids of every user with emailNotifications enabled.
+    Walks Clerk's paginated users.list instead of calling users.get per user,
+    so the eligibility pass costs O(users / page_size) round trips.
+    With clerk_ids, only those users are requested (CLERK_USER_ID_FILTER_SIZE
+    ids per call), so a shard never downloads users outside it.
+    """
+    enabled_clerk_ids = set()
+
+    with Clerk(bearer_auth=os.getenv("CLERK_SECRET_KEY")) as clerk:
+        if clerk_ids is not None:
+            clerk_ids = list(clerk_ids)
+            for start in range(0, len(clerk_ids), CLERK_USER_ID_FILTER_SIZE):
+                chunk = clerk_ids[start : start + CLERK_USER_ID_FILTER_SIZE]
+                page = clerk.users.list(request={"user_id": chunk, "limit": len(chunk)})
+                enabled_clerk_ids.update(_enabled_clerk_ids(page or []))
+            return enabled_clerk_ids
+
+        offset = 0
+        while True:
+            page = clerk.users.list(request={"limit": page_size, "offset": offset})
+            if not page:
+                break
+
+            enabled_clerk_ids.update(_enabled_clerk_ids(page))
+
+            if len(page) < page_size:
+                break
+            offset += page_size
+
+    return enabled_clerk_ids
+
+
+def _enabled_clerk_ids(clerk_users):
+    for user_obj in clerk_users:
+        unsafe_metadata = getattr(user_obj, "unsafe_metadata", None) or {}
+        if unsafe_metadata.get("emailNotifications") == True:
+            yield user_obj.id
+
+
+def parse_shard(value):
+    """
+    Parse a ``--shard`` value of the form ``i/N`` into ``(index, count)``.
+    Shard indexes are zero-based, so ``0/4`` through ``3/4`` cover every user.
+    """
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Invalid shard '{value}': expected the form i/N, e.g. 0/4"
+        )
+
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(
+            f"Invalid shard '{value}': index must be between 0 and N-1"
+        )
+    return index, count
+
+
+def filter_users_for_shard(users, shard_index, shard_count):
+    """
+    Restrict a user queryset to a deterministic slice by primary key.
+    Every user lands in exactly one shard (id mod N), so separate processes
+    running different shards of the same N never email the same user twice.
+    """
+    if shard_count <= 1:
+        return users
+    return users.annotate(shard_bucket=F("id") % shard_count).filter(
+        shard_bucket=shard_index
+    )
+
+
 class Command(BaseCommand):
     help = "Send checkup emails to users with email notifications enabled"
 
@@ -59,6 +142,17 @@ class Command(BaseCommand):
             action="store_true",
             help="Test mode: simulate first day of month behavior for testing the monthly email system",
         )
+        parser.add_argument(
+            "--shard",
+            type=parse_shard,
+            help="Only process the i-th of N user shards (zero-based, e.g. 0/4)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Split the run across N worker processes, one shard each (default: 1)",
+        )
 
     def handle(self, *args, **options):
         """Execute the email notification task."""
@@ -66,6 +160,17 @@ class Command(BaseCommand):
         log_file = options.get("log_file")
         dry_run = options.get("dry_run", False)
         test_monthly = options.get("test_monthly", False)
+        shard = options.get("shard")
+        workers = options.get("workers") or 1
+
+        if workers < 1:
+            raise CommandError("--workers must be at least 1")
+        if workers > 1:
+            if shard:
+                raise CommandError("--workers and --shard cannot be combined")
+            return self._run_workers(workers, options)
+
+        shard_index, shard_count = shard or (0, 1)
 
         # Set up file logging if specified
         if log_file:
@@ -94,6 +199,14 @@ class Command(BaseCommand):
             users_with_clerk_id = User.objects.filter(clerk_id__isnull=False).exclude(
                 clerk_id=""
             )
+            users_with_clerk_id = filter_users_for_shard(
+                users_with_clerk_id, shard_index, shard_count
+            )
+
+            if shard_count > 1:
+                if verbose:
+                    self.stdout.write(f"🧩 Processing shard {shard_index}/{shard_count}")
+                logger.info(f"🧩 Processing shard {shard_index}/{shard_count}")
 
             if verbose:
                 self.stdout.write(
@@ -105,10 +218,56 @@ class Command(BaseCommand):
             notification_results = []
             eligible_users = []
 
+            # Users who opted out via /sync-preferences are filtered in SQL
+            opted_out_count = users_with_clerk_id.filter(
+                email_notifications=False
+            ).count()
+            candidate_users = users_with_clerk_id.exclude(email_notifications=False)
+            unsynced_users = candidate_users.filter(email_notifications__isnull=True)
+
+            if verbose:
+                self.stdout.write(
+                    f"⏭️  Skipping {opted_out_count} users with email notifications disabled"
+                )
+            logger.info(
+                f"⏭️  Skipping {opted_out_count} users with email notifications disabled"
+            )
+
+            # Only users who never synced their preference need a Clerk lookup
+            enabled_clerk_ids = None
+            if unsynced_users.exists():
+                try:
+                    # A shard asks Clerk only for its own users; a full run
+                    # lists every Clerk user in pages of 500
+                    clerk_ids = (
+                        list(unsynced_users.values_list("clerk_id", flat=True))
+                        if shard_count > 1
+                        else None
+                    )
+                    enabled_clerk_ids = fetch_email_notification_preferences(
+                        clerk_ids=clerk_ids
+                    )
+                    # A dry run reports what would happen without writing
+                    if not dry_run:
+                        self._store_synced_preferences(
+                            unsynced_users, enabled_clerk_ids
+                        )
+                except Exception as e:
+                    logger.warning(
+                        f"⚠️  Batch Clerk preference fetch failed, checking users individually: {str(e)}"
+                    )
+
             # Check each user for email notification preference
-            for user in users_with_clerk_id:
+            for user in candidate_users:
                 try:
-                    if has_email_notifications_enabled(user):
+                    if user.email_notifications is not None:
+                        notifications_enabled = user.email_notifications
+                    elif enabled_clerk_ids is not None:
+                        notifications_enabled = user.clerk_id in enabled_clerk_ids
+                    else:
+                        notifications_enabled = has_email_notifications_enabled(user)
+
+                    if notifications_enabled:
                         eligible_users.append(user)
                         if verbose:
                             self.stdout.write(
@@ -243,6 +402,7 @@ class Command(BaseCommand):
                 "emails_sent": len(notification_results) if not dry_run else 0,
                 "dry_run": dry_run,
                 "test_monthly": test_monthly,
+                "shard": f"{shard_index}/{shard_count}",
                 "status": "success",
             }
 
@@ -289,3 +449,62 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.ERROR(error_msg))
 
             raise CommandError(error_msg)
+
+    def _store_synced_preferences(self, unsynced_users, enabled_clerk_ids):
+        """
+        Save the preferences fetched from Clerk for users that never synced,
+        so the next run can decide eligibility without calling Clerk.
+        """
+        unsynced_ids = list(unsynced_users.values_list("id", flat=True))
+        User.objects.filter(
+            id__in=unsynced_ids, clerk_id__in=enabled_clerk_ids
+        ).update(email_notifications=True)
+        User.objects.filter(id__in=unsynced_ids).exclude(
+            clerk_id__in=enabled_clerk_ids
+        ).update(email_notifications=False)
+
+    def _run_workers(self, workers, options):
+        """
+        Launch one child process per shard and wait for all of them.
+        Each child runs this command with --shard k/N, so the user set is
+        split without overlap and the wall time drops roughly by N.
+        """
+        manage_py = os.path.join(settings.BASE_DIR, "manage.py")
+        base_command = [sys.executable, manage_py, "run_email_notifications"]
+        for flag in ("verbose", "dry_run", "test_monthly"):
+            if options.get(flag):
+                base_command.append(f"--{flag.replace('_', '-')}")
+        if options.get("log_file"):
+            base_command.extend(["--log-file", options["log_file"]])
+
+        logger.info(f"🧩 Starting {workers} email notification workers")
+        if options["verbose"]:
+            self.stdout.write(f"🧩 Starting {workers} email notification workers")
+
+        processes = [
+            (
+                index,
+                subprocess.Popen(
+                    base_command + ["--shard", f"{index}/{workers}"],
+                    cwd=settings.BASE_DIR,
+                ),
+            )
+            for index in range(workers)
+        ]
+
+        failed_shards = []
+        for index, process in processes:
+            process.wait()
+            if process.returncode != 0:
+                failed_shards.append(f"{index}/{workers}")
+                logger.error(
+                    f"❌ Worker for shard {index}/{workers} exited with code {process.returncode}"
+                )
+
+        if failed_shards:
+            raise CommandError(
+                f"❌ EMAIL NOTIFICATION TASK failed for shards: {', '.join(failed_shards)}"
+            )
+
+        logger.info(f"✅ All {workers} email notification workers completed")
+        return f"Email notification task completed across {workers} workers"
@@ -1,6 +1,8 @@
 from django.db import models
 from django.utils import timezone
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import NamedTuple
 import uuid
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -64,26 +66,72 @@ class ItemStatus(models.TextChoices):
     DONATE = "Donate", "Donate"
 
 
-class TimeSpan:
-    def __init__(self, years=0, months=0, days=0):
-        self.years = years
-        self.months = months
-        self.days = days
+@lru_cache(maxsize=1024)
+def _describe_span(years, months):
+    year_text = f"{years}y " if years > 0 else "0y "
+    month_text = f"{months}m " if months > 0 else "0m "
+    return f"{year_text}{month_text}".strip()
+
+
+class TimeSpan(NamedTuple):
+    """
+    Immutable years/months/days span. Two are built per item per request, so
+    it is a tuple (no per-instance __dict__), spans are shared per day count
+    and descriptions are memoized.
+    """
+
+    years: int = 0
+    months: int = 0
+    days: int = 0
 
     @property
     def description(self):
-        year_text = f"{self.years}y " if self.years > 0 else "0y "
-        month_text = f"{self.months}m " if self.months > 0 else "0m "
-        return f"{year_text}{month_text}".strip()
+        return _describe_span(self.years, self.months)
 
     @classmethod
     def from_dates(cls, start_date, end_date):
-        delta = end_date - start_date
-        years = delta.days // 365
-        remaining_days = delta.days % 365
-        months = remaining_days // 30
-        days = remaining_days % 30
-        return cls(years=years, months=months, days=days)
+        return _span_from_days((end_date - start_date).days)
+
+
+@lru_cache(maxsize=8192)
+def _span_from_days(total_days):
+    years, remaining_days = divmod(total_days, 365)
+    months, days = divmod(remaining_days, 30)
+    return TimeSpan(years=years, months=months, days=days)
+
+
+class AgentJobStatus(models.TextChoices):
+    QUEUED = "queued", "Queued"
+    RUNNING = "running", "Running"
+    SUCCEEDED = "succeeded", "Succeeded"
+    FAILED = "failed", "Failed"
+
+
+class AgentJob(models.Model):
+    """A background add-item agent run, polled or streamed by the client."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="agent_jobs",
+    )
+    status = models.CharField(
+        max_length=10, choices=AgentJobStatus.choices, default=AgentJobStatus.QUEUED
+    )
+    total_prompts = models.IntegerField(default=0)
+    completed_prompts = models.IntegerField(default=0)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def is_finished(self):
+        return self.status in (AgentJobStatus.SUCCEEDED, AgentJobStatus.FAILED)
+
+    def __str__(self):
+        return f"AgentJob {self.id} ({self.status})"
 
 
 class CheckupType(models.TextChoices):
@@ -219,6 +267,13 @@ class OwnedItem(models.Model):
         max_length=30, choices=ItemType.choices, default=ItemType.OTHER
     )
     ownership_duration_goal_months = models.IntegerField(default=12)  # Default 1 year
+    # Change cursor for GET /items/changes; bulk_create sets it too
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "updated_at"], name="items_owned_user_updated_idx")
+        ]
 
     def save(self, *args, **kwargs):
         """Override save to validate item limits on creation."""
@@ -376,3 +431,23 @@ class OwnedItem(models.Model):
                     )
                 result[item_type] = badges
         return result
+
+
+class OwnedItemTombstone(models.Model):
+    """Records a deleted item so delta sync clients can drop it too."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="item_tombstones",
+    )
+    item_id = models.UUIDField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "deleted_at"], name="items_tomb_user_deleted_idx")
+        ]
+
+    def __str__(self):
+        return f"Deleted item {self.item_id}"
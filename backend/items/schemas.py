@@ -0,0 +1,19 @@
+"""
+Schemas shared by the API and the add-item agent.
+"""
+
+from datetime import datetime
+
+from ninja import Schema
+
+from .models import ItemStatus, ItemType
+
+
+class OwnedItemCreateSchema(Schema):
+    name: str
+    picture_url: str
+    item_type: ItemType
+    status: ItemStatus = ItemStatus.KEEP
+    item_received_date: datetime
+    last_used: datetime
+    ownership_duration_goal_months: int = 12
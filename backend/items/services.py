@@ -1,11 +1,21 @@
 from django.utils import timezone
-from .models import OwnedItem, Checkup, ItemStatus, ItemType, is_user_admin
-from datetime import timedelta
+from django.db import connection, transaction
+from .models import (
+    OwnedItem,
+    OwnedItemTombstone,
+    Checkup,
+    ItemStatus,
+    ItemType,
+    is_user_admin,
+)
+from datetime import timedelta, timezone as dt_timezone
 from django.core.mail import send_mail
 from django.conf import settings
 from django.core.exceptions import ValidationError
 import logging
 from mailersend import emails as mailersend_emails
+from .email_templates import get_sender_config, render_checkup_email
+from . import item_cache
 import os
 
 
@@ -14,10 +24,23 @@ class ItemService:
     def create_item(user, **kwargs):
         """Create an item with validation for user item limits."""
         try:
-            return OwnedItem.objects.create(user=user, **kwargs)
+            item = OwnedItem.objects.create(user=user, **kwargs)
         except ValidationError as e:
             # Re-raise validation errors to be handled by the API
             raise e
+        item_cache.bump_version(user.id)
+        return item
+
+    @staticmethod
+    def bulk_create_items(user, items):
+        """
+        Insert several unsaved OwnedItem instances for a user in one query.
+        The item limit is validated once for the whole batch.
+        """
+        OwnedItem.validate_item_limit(user, count=len(items))
+        created = OwnedItem.objects.bulk_create(items)
+        item_cache.bump_version(user.id)
+        return created
 
     @staticmethod
     def get_item(item_id):
@@ -33,6 +56,7 @@ class ItemService:
             for key, value in kwargs.items():
                 setattr(item, key, value)
             item.save()
+            item_cache.bump_version(item.user_id)
             return item
         except OwnedItem.DoesNotExist:
             return None
@@ -41,7 +65,10 @@ class ItemService:
     def delete_item(item_id):
         try:
             item = OwnedItem.objects.get(id=item_id)
-            item.delete()
+            with transaction.atomic():
+                OwnedItemTombstone.objects.create(user_id=item.user_id, item_id=item.id)
+                item.delete()
+            item_cache.bump_version(item.user_id)
             return True
         except OwnedItem.DoesNotExist:
             return False
@@ -63,6 +90,62 @@ class ItemService:
             qs = qs.filter(item_type=item_type)
         return qs
 
+    @staticmethod
+    def get_cached_items_for_user(user, status=None, item_type=None):
+        """
+        Like get_items_for_user, but served from the per-user item cache.
+        Returns unsaved OwnedItem instances, fine for reading and serializing.
+        """
+        rows = item_cache.get_item_rows(user)
+        if status:
+            rows = [row for row in rows if row["status"] == status]
+        if item_type:
+            rows = [row for row in rows if row["item_type"] == item_type]
+        return item_cache.items_from_rows(rows)
+
+    @staticmethod
+    def get_item_changes(user, since=None):
+        """
+        Items created or updated, and ids of items deleted, at or after `since`.
+        Returns (updated_items, deleted_ids, cursor, reset). Pass the cursor as
+        the next `since`. Without `since`, or when `since` is older than the
+        tombstones kept, every item is returned with reset=True and the client
+        should replace its local copy.
+        """
+        now = timezone.now()
+        # The cursor trails the clock a little, so rows written by transactions
+        # that commit just after this read are picked up by the next one
+        overlap = timedelta(
+            seconds=getattr(settings, "ITEM_CHANGES_CURSOR_OVERLAP_SECONDS", 5)
+        )
+        horizon = now - timedelta(
+            days=getattr(settings, "ITEM_TOMBSTONE_RETENTION_DAYS", 30)
+        )
+
+        if since is not None and timezone.is_naive(since):
+            since = timezone.make_aware(since, dt_timezone.utc)
+
+        items = OwnedItem.objects.filter(user=user)
+        if since is None or since < horizon:
+            return list(items), [], now - overlap, True
+
+        updated = list(items.filter(updated_at__gte=since))
+        deleted = list(
+            OwnedItemTombstone.objects.filter(user=user, deleted_at__gte=since)
+            .values_list("item_id", flat=True)
+            .distinct()
+        )
+        return updated, deleted, now - overlap, False
+
+    @staticmethod
+    def prune_item_tombstones():
+        """Delete tombstones older than the retention window; returns the count."""
+        horizon = timezone.now() - timedelta(
+            days=getattr(settings, "ITEM_TOMBSTONE_RETENTION_DAYS", 30)
+        )
+        deleted, _ = OwnedItemTombstone.objects.filter(deleted_at__lt=horizon).delete()
+        return deleted
+
     @staticmethod
     def get_user_item_stats(user):
         """Get item statistics for a user including limits."""
@@ -98,11 +181,13 @@ class CheckupService:
             return existing_checkup
 
         # Create new checkup only if none exists
-        return Checkup.objects.create(
+        checkup = Checkup.objects.create(
             user=user,
             checkup_interval_months=interval_months,
             checkup_type=checkup_type,
         )
+        item_cache.bump_version(user.id, item_cache.CHECKUPS)
+        return checkup
 
     @staticmethod
     def get_checkups_by_type(user, checkup_type):
@@ -124,6 +209,7 @@ class CheckupService:
         try:
             checkup = Checkup.objects.get(id=checkup_id)
             checkup.complete_checkup()
+            item_cache.bump_version(checkup.user_id, item_cache.CHECKUPS)
             return checkup
         except Checkup.DoesNotExist:
             return None
@@ -133,17 +219,60 @@ class CheckupService:
         try:
             checkup = Checkup.objects.get(id=checkup_id)
             checkup.change_checkup_interval(months)
+            item_cache.bump_version(checkup.user_id, item_cache.CHECKUPS)
             return checkup
         except Checkup.DoesNotExist:
             return None
 
+    @staticmethod
+    def update_user_checkup_intervals(user, months):
+        """
+        Set the interval of every checkup for a user in a single UPDATE.
+        On PostgreSQL the updated rows come back via RETURNING in the same
+        round trip; other databases re-read them with one extra query.
+        Due state is derived from last_checkup_date and the interval, so
+        there is no stored due date to recompute.
+        """
+        if connection.vendor != "postgresql":
+            Checkup.objects.filter(user=user).update(checkup_interval_months=months)
+            item_cache.bump_version(user.id, item_cache.CHECKUPS)
+            return list(Checkup.objects.filter(user=user).order_by("id"))
+
+        table = Checkup._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} SET checkup_interval_months = %s "
+                "WHERE user_id = %s "
+                "RETURNING id, checkup_type, last_checkup_date, checkup_interval_months",
+                [months, user.pk],
+            )
+            rows = cursor.fetchall()
+        item_cache.bump_version(user.id, item_cache.CHECKUPS)
+
+        checkups = []
+        for row in sorted(rows):
+            checkup = Checkup.from_db(
+                connection.alias,
+                [
+                    "id",
+                    "checkup_type",
+                    "last_checkup_date",
+                    "checkup_interval_months",
+                ],
+                row,
+            )
+            checkup.user = user
+            checkups.append(checkup)
+        return checkups
+
     @staticmethod
     def send_checkup_due_email(user, checkup_type, due=True, time_left=None):
         """
         Sends a checkup reminder email using the MailerSend Python SDK directly.
         Returns a tuple (status_code, message_id, error) for debugging.
         """
-        api_key = os.getenv("MAILERSEND_API_TOKEN")
+        sender = get_sender_config()
+        api_key = sender.api_key
 
         # Validate API key exists
         if not api_key:
@@ -161,8 +290,8 @@ class CheckupService:
         mail_body = {}
 
         mail_from = {
-            "name": os.getenv("DEFAULT_FROM_NAME", "Min-Now"),
-            "email": os.getenv("MAILERSEND_SMTP_USERNAME", "MS_cGIzxA@min-now.store"),
+            "name": sender.from_name,
+            "email": sender.from_email,
         }
 
         # Validate sender email
@@ -178,13 +307,10 @@ class CheckupService:
             }
         ]
 
-        subject = f"Your {checkup_type.capitalize()} Checkup Reminder"
-        if due:
-            text_content = f"Hi, your {checkup_type} checkup is due!"
-            html_content = f"<p>{text_content}</p><br><br><p><a href='https://min-now.store' style='color: #007bff; text-decoration: underline;'>Log in to complete your checkup</a></p>"
-        else:
-            text_content = f"Hi, your {checkup_type} checkup is not due yet. Time left: {time_left} months."
-            html_content = f"<p>{text_content}</p><br><br><p><a href='https://min-now.store' style='color: #007bff; text-decoration: underline;'>Visit Min-Now</a></p>"
+        email = render_checkup_email(checkup_type, due=due, time_left=time_left)
+        subject = email.subject
+        text_content = email.text
+        html_content = email.html
 
         try:
             mailer.set_mail_from(mail_from, mail_body)
@@ -3,6 +3,7 @@ from django.utils import timezone
 from datetime import datetime, timedelta
 from .models import OwnedItem, Checkup, ItemType, ItemStatus, TimeSpan
 from .services import ItemService, CheckupService
+from .email_templates import render_checkup_email
 
 
 class TimeSpanTests(TestCase):
@@ -17,6 +18,18 @@ class TimeSpanTests(TestCase):
         self.assertEqual(time_span.years, 1)
         self.assertEqual(time_span.months, 1)
 
+    def test_time_span_from_dates_shares_spans_per_day_count(self):
+        now = timezone.now()
+        span = TimeSpan.from_dates(now - timedelta(days=400), now)
+        self.assertEqual(span, TimeSpan(years=1, months=1, days=5))
+        self.assertIs(span, TimeSpan.from_dates(now - timedelta(days=400, hours=3), now))
+
+    def test_time_span_is_immutable(self):
+        time_span = TimeSpan(years=1)
+        with self.assertRaises(AttributeError):
+            time_span.years = 2
+        self.assertFalse(hasattr(time_span, "__dict__"))
+
 
 class CheckupTests(TestCase):
     def setUp(self):
@@ -119,3 +132,20 @@ class CheckupServiceTests(TestCase):
         old_date = checkup.last_checkup_date
         completed_checkup = CheckupService.complete_checkup(checkup.id)
         self.assertNotEqual(completed_checkup.last_checkup_date, old_date)
+
+
+class CheckupEmailTemplateTests(TestCase):
+    def test_render_due_email(self):
+        email = render_checkup_email("keep", due=True)
+        self.assertEqual(email.subject, "Your Keep Checkup Reminder")
+        self.assertEqual(email.text, "Hi, your keep checkup is due!")
+        self.assertIn("<p>Hi, your keep checkup is due!</p>", email.html)
+        self.assertIn("Log in to complete your checkup", email.html)
+
+    def test_render_not_due_email_fills_time_left(self):
+        email = render_checkup_email("give", due=False, time_left=2)
+        self.assertEqual(email.subject, "Your Give Checkup Reminder")
+        self.assertEqual(
+            email.text, "Hi, your give checkup is not due yet. Time left: 2 months."
+        )
+        self.assertIn("Visit Min-Now", email.html)
@@ -5,6 +5,8 @@ from clerk_backend_api.jwks_helpers import (
 )
 from ninja.security import HttpBearer
 from django.contrib.auth import get_user_model
+from asgiref.sync import sync_to_async
+from minNow.middleware import timed_phase
 
 import httpx
 import logging
@@ -13,6 +15,14 @@ from django.conf import settings
 
 logger = logging.getLogger("minNow")
 
+# Origins allowed to present Clerk session tokens
+AUTHORIZED_PARTIES = [
+    "http://localhost:3000",
+    "https://min-now.store",
+    "https://www.min-now.store",
+    "https://min-now-web-app.vercel.app",
+]
+
 
 class ClerkAuth(HttpBearer):
     def __init__(self):
@@ -20,6 +30,10 @@ class ClerkAuth(HttpBearer):
         self.clerk_user_id = None  # Store the authenticated Clerk user id
 
     def authenticate(self, request: httpx.Request, token):
+        with timed_phase("auth"):
+            return self._authenticate(request, token)
+
+    def _authenticate(self, request: httpx.Request, token):
         # print("Token:", token)
 
         # Verify the token with Clerk
@@ -28,14 +42,7 @@ class ClerkAuth(HttpBearer):
             # authenticate request from frontend
             request_state = sdk.authenticate_request(
                 request,
-                AuthenticateRequestOptions(
-                    authorized_parties=[
-                        "http://localhost:3000",
-                        "https://min-now.store",
-                        "https://www.min-now.store",
-                        "https://min-now-web-app.vercel.app",
-                    ]
-                ),
+                AuthenticateRequestOptions(authorized_parties=AUTHORIZED_PARTIES),
             )
 
             # logger.debug(f"Request state payload: {request_state.payload}")
@@ -94,6 +101,56 @@ class ClerkAuth(HttpBearer):
         return None
 
 
+class AsyncClerkAuth(HttpBearer):
+    """
+    ClerkAuth for async views. Clerk and database calls are awaited instead of
+    blocking the event loop, and Clerk is only asked for the user's email when
+    a new Django user has to be created.
+    """
+
+    async def authenticate(self, request: httpx.Request, token):
+        with timed_phase("auth"):
+            return await self._authenticate(request, token)
+
+    async def _authenticate(self, request: httpx.Request, token):
+        sdk = Clerk(bearer_auth=os.getenv("CLERK_SECRET_KEY"))
+        try:
+            # The SDK only verifies tokens synchronously, so run it off the event loop
+            request_state = await sync_to_async(
+                sdk.authenticate_request, thread_sensitive=False
+            )(
+                request,
+                AuthenticateRequestOptions(authorized_parties=AUTHORIZED_PARTIES),
+            )
+            if not request_state.is_signed_in:
+                logger.debug(f"token verification failed:  {request_state.reason}")
+                return None
+
+            clerk_user_id = request_state.payload.get("sub")
+            if not clerk_user_id:
+                return None
+
+            User = get_user_model()
+            user = await User.objects.filter(clerk_id=clerk_user_id).afirst()
+            if user is None:
+                user_obj = await sdk.users.get_async(user_id=clerk_user_id)
+                if not user_obj.email_addresses:
+                    return None
+                user = await sync_to_async(User.objects.create_user)(
+                    username=clerk_user_id,
+                    clerk_id=clerk_user_id,
+                    email=user_obj.email_addresses[0].email_address,
+                )
+
+            # Set the user on the request
+            request.user = user
+            return token
+
+        except Exception as e:
+            logger.debug(f"Authentication error: {str(e)}", exc_info=True)
+            return None
+
+
 # Development-only authentication class for testing
 class DevClerkAuth(HttpBearer):
     def __init__(self):
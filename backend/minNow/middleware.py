@@ -0,0 +1,225 @@
+"""
+Per-request timing and profiling.
+
+ServerTimingMiddleware binds a RequestTimings object to each request with a
+context variable (copied into sync_to_async worker threads). Code paths record
+phases into it with `timed_phase("auth")` etc., and every database query is
+timed and counted by an execute wrapper installed on each new connection.
+When the response is ready the middleware:
+
+  - adds a `Server-Timing` header (REQUEST_TIMING_HEADER), which browser dev
+    tools show per request
+  - logs one structured `request_timing {...}` JSON line
+  - for sampled requests (REQUEST_PROFILE_SAMPLE_RATE) slower than
+    REQUEST_PROFILE_THRESHOLD_MS, writes a cProfile or pyinstrument dump to
+    REQUEST_PROFILE_DIR
+
+The middleware is skipped entirely unless REQUEST_TIMING_ENABLED is set.
+"""
+
+import cProfile
+import json
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+log = logging.getLogger("minNow.timing")
+
+_current_timings: ContextVar[Optional["RequestTimings"]] = ContextVar(
+    "request_timings", default=None
+)
+
+
+class RequestTimings:
+    """Phase durations (seconds) and query count of one request."""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.queries = 0
+        self._lock = threading.Lock()
+
+    def add(self, phase: str, seconds: float, queries: int = 0):
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+            self.queries += queries
+
+    def server_timing(self, total_seconds: float) -> str:
+        entries = []
+        for phase, seconds in self.phases.items():
+            entry = f"{phase};dur={seconds * 1000:.1f}"
+            if phase == "db":
+                entry += f';desc="{self.queries} queries"'
+            entries.append(entry)
+        entries.append(f"total;dur={total_seconds * 1000:.1f}")
+        return ", ".join(entries)
+
+
+@contextmanager
+def timed_phase(phase: str):
+    """Add the time spent in the block to the current request's phase."""
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - start)
+
+
+def _time_query(execute, sql, params, many, context):
+    timings = _current_timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.add("db", time.perf_counter() - start, queries=1)
+
+
+def install_query_timer(sender, connection, **kwargs):
+    # Installed once per connection, on every thread's connection
+    if _time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_time_query)
+
+
+class RequestProfiler:
+    """Optional cProfile/pyinstrument run around a sampled request."""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self._profiler = None
+
+    def start(self) -> bool:
+        try:
+            if self.kind == "pyinstrument":
+                from pyinstrument import Profiler
+
+                self._profiler = Profiler()
+                self._profiler.start()
+            else:
+                self._profiler = cProfile.Profile()
+                self._profiler.enable()
+            return True
+        except (ImportError, ValueError, RuntimeError) as e:
+            # Not installed, or another profiler is already active
+            log.debug(f"Request profiling skipped: {e}")
+            self._profiler = None
+            return False
+
+    def stop(self):
+        if self._profiler is None:
+            return
+        if self.kind == "pyinstrument":
+            self._profiler.stop()
+        else:
+            self._profiler.disable()
+
+    def dump(self, directory: str, name: str) -> str:
+        os.makedirs(directory, exist_ok=True)
+        if self.kind == "pyinstrument":
+            path = os.path.join(directory, f"{name}.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self._profiler.output_html())
+        else:
+            path = os.path.join(directory, f"{name}.prof")
+            self._profiler.dump_stats(path)
+        return path
+
+
+class ServerTimingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, "REQUEST_TIMING_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.send_header = getattr(settings, "REQUEST_TIMING_HEADER", False)
+        self.profile_rate = getattr(settings, "REQUEST_PROFILE_SAMPLE_RATE", 0.0)
+        self.profile_threshold = (
+            getattr(settings, "REQUEST_PROFILE_THRESHOLD_MS", 1000) / 1000
+        )
+        self.profiler_kind = getattr(settings, "REQUEST_PROFILER", "cprofile")
+        self.profile_dir = getattr(
+            settings, "REQUEST_PROFILE_DIR", os.path.join(settings.BASE_DIR, "profiles")
+        )
+        connection_created.connect(install_query_timer, dispatch_uid="request_query_timer")
+        for connection in connections.all(initialized_only=True):
+            install_query_timer(None, connection)
+
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        timings, token, profiler, start = self._begin()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_timings.reset(token)
+            if profiler:
+                profiler.stop()
+        return self._finish(request, response, timings, profiler, start)
+
+    async def __acall__(self, request):
+        timings, token, profiler, start = self._begin()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_timings.reset(token)
+            if profiler:
+                profiler.stop()
+        return self._finish(request, response, timings, profiler, start)
+
+    def _begin(self):
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        profiler = None
+        if self.profile_rate > 0 and random.random() < self.profile_rate:
+            profiler = RequestProfiler(self.profiler_kind)
+            if not profiler.start():
+                profiler = None
+        return timings, token, profiler, time.perf_counter()
+
+    def _finish(self, request, response, timings, profiler, start):
+        total = time.perf_counter() - start
+        if self.send_header:
+            response["Server-Timing"] = timings.server_timing(total)
+
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "total_ms": round(total * 1000, 1),
+            "phases_ms": {
+                phase: round(seconds * 1000, 1)
+                for phase, seconds in timings.phases.items()
+            },
+            "db_queries": timings.queries,
+        }
+        if profiler and total >= self.profile_threshold:
+            path_slug = request.path.strip("/").replace("/", "_") or "root"
+            name = f"{int(time.time())}-{request.method}-{path_slug}"
+            try:
+                record["profile"] = profiler.dump(self.profile_dir, name)
+            except OSError as e:
+                log.warning(f"Could not write request profile: {e}")
+
+        log.info(f"request_timing {json.dumps(record, sort_keys=True)}")
+        return response
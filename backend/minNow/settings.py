@@ -17,6 +17,7 @@ from dotenv import load_dotenv
 import sys
 import logging
 import logging.config
+import importlib.util
 
 # Configure logging first, before creating the logger
 LOGGING = {
@@ -210,12 +211,12 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "minNow.middleware.ServerTimingMiddleware",  # first, so it times everything
     "django.middleware.security.SecurityMiddleware",
     "django_permissions_policy.PermissionsPolicyMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -250,6 +251,51 @@ WSGI_APPLICATION = "minNow.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Connection reuse. By default connections persist for DB_CONN_MAX_AGE seconds
+# and are health checked before reuse, instead of a new TLS handshake per
+# request. DB_POOL=True uses psycopg 3's connection pool instead (recommended
+# for ASGI workers; requires `pip install "psycopg[binary,pool]"`).
+# Django's OPTIONS["pool"] needs psycopg 3 itself, not only psycopg_pool
+POOL_PACKAGES = ("psycopg", "psycopg_pool")
+
+
+def configure_connection_reuse(database, use_pool):
+    """
+    Set CONN_MAX_AGE (and OPTIONS["pool"]) on a DATABASES entry. Falls back to
+    persistent connections when pooling is requested but unavailable, e.g.
+    with psycopg2. Returns whether the pool is used.
+    """
+    if use_pool and "postgresql" not in database["ENGINE"]:
+        log.warning("DB_POOL is only supported on PostgreSQL; using persistent connections")
+        use_pool = False
+    missing = [name for name in POOL_PACKAGES if importlib.util.find_spec(name) is None]
+    if use_pool and missing:
+        log.warning(
+            f"DB_POOL is set but {', '.join(missing)} is not installed; "
+            "using persistent connections"
+        )
+        use_pool = False
+
+    if use_pool:
+        # Django manages pooled connections itself and requires CONN_MAX_AGE = 0
+        database["CONN_MAX_AGE"] = 0
+        database.setdefault("OPTIONS", {})["pool"] = {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+        }
+    else:
+        database["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", "60"))
+    return use_pool
+
+
+DB_POOL = configure_connection_reuse(
+    DATABASES["default"], os.getenv("DB_POOL", "false").lower() == "true"
+)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = (
+    os.getenv("DB_CONN_HEALTH_CHECKS", "true").lower() == "true"
+)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -310,8 +356,71 @@ CSRF_TRUSTED_ORIGINS = [
     "https://www.min-now.store",
     "https://min-now-web-app.vercel.app",
 ]
-# Add this line to ensure WhiteNoise works in production
-MIDDLEWARE.insert(1, "whitenoise.middleware.WhiteNoiseMiddleware")
+# WhiteNoise must come right after SecurityMiddleware, so static responses
+# still get the security headers and HTTPS redirect
+MIDDLEWARE.insert(
+    MIDDLEWARE.index("django.middleware.security.SecurityMiddleware") + 1,
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+)
 
 
 AUTH_USER_MODEL = "users.User"
+
+# Cache: shared Redis when REDIS_URL is set, otherwise per-process memory
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "minnow",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "minnow",
+            "OPTIONS": {"MAX_ENTRIES": 5000},
+        }
+    }
+
+# Per-user GET /items cache (items/item_cache.py). A locmem cache is not shared
+# between gunicorn workers, so production only enables it by default with Redis
+ITEM_CACHE_ENABLED = (
+    os.getenv("ITEM_CACHE_ENABLED", "true" if REDIS_URL or not prod else "false").lower()
+    == "true"
+)
+ITEM_CACHE_TTL_SECONDS = int(os.getenv("ITEM_CACHE_TTL_SECONDS", "300"))
+# GET /items/changes: how long deleted item ids are kept for delta sync clients,
+# and how far the returned cursor trails the clock to cover in-flight writes
+ITEM_TOMBSTONE_RETENTION_DAYS = int(os.getenv("ITEM_TOMBSTONE_RETENTION_DAYS", "30"))
+ITEM_CHANGES_CURSOR_OVERLAP_SECONDS = int(
+    os.getenv("ITEM_CHANGES_CURSOR_OVERLAP_SECONDS", "5")
+)
+# Weak ETags / 304s for GET /items, /checkups and /badges/donated. They rely on
+# the same per-user version counters, so the same shared-cache caveat applies
+ETAGS_ENABLED = (
+    os.getenv("ETAGS_ENABLED", "true" if REDIS_URL or not prod else "false").lower()
+    == "true"
+)
+
+# Add-item agent metrics: export sink (dotted path to a MetricsSink class) and
+# whether to attach per-run X-Agent-* timing headers to agent responses
+AGENT_METRICS_SINK = os.getenv(
+    "AGENT_METRICS_SINK", "items.agent_metrics.LoggingMetricsSink"
+)
+AGENT_DEBUG_HEADERS = os.getenv("AGENT_DEBUG_HEADERS", "false").lower() == "true"
+
+# Per-request timing (minNow/middleware.py): a structured log line per request
+# and, with REQUEST_TIMING_HEADER, a Server-Timing header. A sampled share of
+# requests is profiled (cprofile or pyinstrument) and dumped when slower than
+# the threshold; a sample rate of 0 disables profiling
+REQUEST_TIMING_ENABLED = os.getenv("REQUEST_TIMING_ENABLED", "true").lower() == "true"
+REQUEST_TIMING_HEADER = (
+    os.getenv("REQUEST_TIMING_HEADER", "false" if prod else "true").lower() == "true"
+)
+REQUEST_PROFILE_SAMPLE_RATE = float(os.getenv("REQUEST_PROFILE_SAMPLE_RATE", "0"))
+REQUEST_PROFILE_THRESHOLD_MS = int(os.getenv("REQUEST_PROFILE_THRESHOLD_MS", "1000"))
+REQUEST_PROFILER = os.getenv("REQUEST_PROFILER", "cprofile").lower()
+REQUEST_PROFILE_DIR = os.getenv("REQUEST_PROFILE_DIR", os.path.join(BASE_DIR, "profiles"))
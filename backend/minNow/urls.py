@@ -6,6 +6,7 @@ from ninja import NinjaAPI
 from django.http import HttpResponse
 
 from minNow.auth import ClerkAuth
+from minNow.renderers import ORJSONRenderer
 from items.api import router as items_router
 
 from dotenv import load_dotenv
@@ -26,6 +27,7 @@ api = NinjaAPI(
     docs_url="/docs" if debug else None,
     openapi_url="/openapi.json" if debug else None,
     auth=ClerkAuth(),  # Use ClerkAuth for Ninja API (shows auth in Swagger docs)
+    renderer=ORJSONRenderer(),  # orjson: faster JSON, native datetime/UUID
 )
 
 # Add the main items router to the API
@@ -0,0 +1,208 @@
+"""
+Tests for batch processing in the add-item agent, using a fake chat model
+so no OpenAI calls are made.
+"""
+
+import jwt
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from unittest.mock import patch
+from items.addItemAgent import run_agent, validate_item_json
+from items.agent_cache import prompt_cache
+from items.fake_chat_model import FakeItemChatModel
+from items.models import OwnedItem, ItemType
+
+User = get_user_model()
+
+
+@patch("items.models.is_user_admin", return_value=False)
+class ConcurrentBatchTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="agent_user", clerk_id="agent_user", email="agent@example.com"
+        )
+        self.jwt_token = jwt.encode({"sub": "agent_user"}, "test", algorithm="HS256")
+        prompt_cache.clear()
+
+    def test_concurrent_batch_creates_all_items(self, _):
+        prompts = {f"item{i}": f"thing {i}, got it last year" for i in range(5)}
+        llm = FakeItemChatModel(
+            responses={
+                "thing 0, got it last year": {
+                    "name": "Thing Zero",
+                    "picture_url": "💻",
+                    "item_type": "Technology",
+                    "status": "Keep",
+                    "item_received_date": "2024-01-01T00:00:00Z",
+                    "last_used": "2024-06-01T00:00:00Z",
+                }
+            }
+        )
+
+        result = run_agent(
+            prompts, self.jwt_token, strategy="concurrent", max_concurrency=3, llm=llm
+        )
+
+        self.assertEqual(result["processed_keys"], list(prompts))
+        self.assertTrue(
+            all(r["status"] == "created" for r in result["results"].values())
+        )
+        self.assertEqual(OwnedItem.objects.filter(user=self.user).count(), 5)
+        self.assertEqual(
+            OwnedItem.objects.get(name="Thing Zero").item_type, ItemType.TECHNOLOGY
+        )
+
+    def test_concurrent_batch_reports_failures_per_key(self, _):
+        prompts = {"good": "blue jacket", "no_tool": "hello", "bad": "broken"}
+        llm = FakeItemChatModel(
+            responses={
+                "hello": None,
+                "broken": {
+                    "name": "Broken",
+                    "item_type": "NotAType",
+                    "item_received_date": "not a date",
+                    "last_used": "2024-06-01T00:00:00Z",
+                },
+            }
+        )
+
+        result = run_agent(prompts, self.jwt_token, strategy="concurrent", llm=llm)
+
+        self.assertEqual(result["results"]["good"]["status"], "created")
+        self.assertEqual(result["results"]["no_tool"]["status"], "failed")
+        self.assertEqual(result["results"]["bad"]["status"], "failed")
+        self.assertEqual(OwnedItem.objects.filter(user=self.user).count(), 1)
+
+    def test_concurrent_batch_respects_item_limit(self, _):
+        prompts = {f"item{i}": f"thing {i}" for i in range(11)}
+
+        result = run_agent(
+            prompts, self.jwt_token, strategy="concurrent", llm=FakeItemChatModel()
+        )
+
+        self.assertTrue(
+            all(r["status"] == "failed" for r in result["results"].values())
+        )
+        self.assertEqual(OwnedItem.objects.filter(user=self.user).count(), 0)
+
+
+@patch("items.models.is_user_admin", return_value=False)
+class CombinedBatchTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="combined_user", clerk_id="combined_user", email="c@example.com"
+        )
+        self.jwt_token = jwt.encode({"sub": "combined_user"}, "test", algorithm="HS256")
+        prompt_cache.clear()
+
+    def test_combined_batch_creates_items_in_one_request(self, _):
+        prompts = {"a": "red scarf", "b": "old laptop", "c": "desk lamp"}
+        llm = FakeItemChatModel()
+
+        with patch("items.addItemAgent.plan_concurrent") as mock_fallback:
+            result = run_agent(prompts, self.jwt_token, strategy="combined", llm=llm)
+
+        mock_fallback.assert_not_called()
+        self.assertTrue(
+            all(r["status"] == "created" for r in result["results"].values())
+        )
+        self.assertEqual(
+            set(OwnedItem.objects.filter(user=self.user).values_list("name", flat=True)),
+            {"red scarf", "old laptop", "desk lamp"},
+        )
+
+    def test_combined_batch_falls_back_per_prompt_on_invalid_response(self, _):
+        prompts = {"a": "red scarf", "b": "old laptop"}
+        llm = FakeItemChatModel(combined_response={"items": [{"key": "a"}]})
+
+        result = run_agent(prompts, self.jwt_token, strategy="combined", llm=llm)
+
+        self.assertTrue(
+            all(r["status"] == "created" for r in result["results"].values())
+        )
+        self.assertEqual(OwnedItem.objects.filter(user=self.user).count(), 2)
+
+    def test_combined_batch_falls_back_for_missing_keys_only(self, _):
+        prompts = {"a": "red scarf", "b": "old laptop"}
+        llm = FakeItemChatModel(
+            combined_response={
+                "items": [
+                    {
+                        "key": "a",
+                        "name": "Red Scarf",
+                        "item_type": "Clothing_Accessories",
+                        "item_received_date": "2024-01-01T00:00:00Z",
+                        "last_used": "2024-06-01T00:00:00Z",
+                    }
+                ]
+            }
+        )
+
+        result = run_agent(prompts, self.jwt_token, strategy="combined", llm=llm)
+
+        self.assertEqual(result["results"]["a"]["status"], "created")
+        self.assertEqual(result["results"]["b"]["status"], "created")
+        self.assertTrue(OwnedItem.objects.filter(name="Red Scarf").exists())
+        self.assertTrue(OwnedItem.objects.filter(name="old laptop").exists())
+
+
+@patch("items.models.is_user_admin", return_value=False)
+class AgentItemValidationTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="validate_user", clerk_id="validate_user", email="v@example.com"
+        )
+        prompt_cache.clear()
+
+    def test_validate_item_json_reports_invalid_fields(self, _):
+        with self.assertRaises(ValueError) as ctx:
+            validate_item_json(
+                {
+                    "name": "Broken",
+                    "item_type": "NotAType",
+                    "item_received_date": "not a date",
+                    "last_used": "2024-06-01T00:00:00Z",
+                }
+            )
+
+        self.assertIn("item_type", str(ctx.exception))
+        self.assertIn("item_received_date", str(ctx.exception))
+
+    def test_invalid_item_never_reaches_the_service(self, _):
+        llm = FakeItemChatModel(
+            responses={"broken": {"name": "Broken", "item_type": "Technology"}}
+        )
+
+        with patch("items.addItemAgent.ItemService.create_item") as create_item:
+            try:
+                run_agent({"a": "broken"}, user=self.user, llm=llm)
+            except ValueError:
+                pass
+
+        create_item.assert_not_called()
+        self.assertFalse(OwnedItem.objects.filter(user=self.user).exists())
+
+    def test_authenticated_user_is_used_without_a_token(self, _):
+        result = run_agent({"a": "blue jacket"}, user=self.user, llm=FakeItemChatModel())
+
+        self.assertEqual(result["results"]["a"]["status"], "created")
+        self.assertEqual(OwnedItem.objects.get(user=self.user).name, "blue jacket")
+
+    def test_sequential_run_reports_failures_per_key(self, _):
+        llm = FakeItemChatModel(
+            responses={
+                "hello": None,
+                "broken": {"name": "Broken", "item_type": "NotAType"},
+            }
+        )
+
+        result = run_agent(
+            {"good": "blue jacket", "no_tool": "hello", "bad": "broken"},
+            user=self.user,
+            llm=llm,
+        )
+
+        self.assertEqual(result["results"]["good"]["status"], "created")
+        self.assertEqual(result["results"]["no_tool"]["status"], "failed")
+        self.assertEqual(result["results"]["bad"]["status"], "failed")
+        self.assertEqual(OwnedItem.objects.filter(user=self.user).count(), 1)
@@ -0,0 +1,38 @@
+"""
+Tests for the offline add-item agent benchmark command.
+"""
+
+import json
+from io import StringIO
+
+from django.test import TestCase
+from django.core.management import call_command
+from django.contrib.auth import get_user_model
+from items.models import OwnedItem
+
+User = get_user_model()
+
+
+class BenchmarkAgentCommandTest(TestCase):
+    def test_benchmark_reports_every_scenario_and_rolls_back(self):
+        out = StringIO()
+        call_command(
+            "benchmark_agent",
+            prompts=3,
+            latency=0,
+            strategies="sequential,concurrent,combined",
+            concurrency="1,2",
+            json=True,
+            stdout=out,
+        )
+
+        report = json.loads(out.getvalue())
+        self.assertEqual(
+            [(s["strategy"], s["max_concurrency"]) for s in report["scenarios"]],
+            [("sequential", None), ("concurrent", 1), ("concurrent", 2), ("combined", None)],
+        )
+        self.assertTrue(all(s["items_created"] == 3 for s in report["scenarios"]))
+        self.assertTrue(all(s["prompts_failed"] == 0 for s in report["scenarios"]))
+        self.assertTrue(all(s["db_queries"] > 0 for s in report["scenarios"]))
+        self.assertFalse(OwnedItem.objects.exists())
+        self.assertFalse(User.objects.filter(username__startswith="benchmark_").exists())
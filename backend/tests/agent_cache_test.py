@@ -0,0 +1,102 @@
+"""
+Tests for the add-item agent prompt result cache.
+"""
+
+from datetime import date
+
+import jwt
+from django.test import SimpleTestCase, TestCase
+from django.contrib.auth import get_user_model
+from unittest.mock import patch
+from items.agent_cache import PromptResultCache, normalize_prompt, prompt_cache
+from items.addItemAgent import run_agent
+from items.fake_chat_model import FakeItemChatModel
+from items.models import OwnedItem
+
+User = get_user_model()
+
+ITEM = {"name": "Red Scarf", "item_type": "Clothing_Accessories"}
+
+
+class PromptResultCacheTest(SimpleTestCase):
+    def test_normalized_prompts_share_an_entry(self):
+        cache = PromptResultCache(max_entries=10, ttl_seconds=60, scope="user")
+        cache.set("Red scarf,  clothing.", [ITEM], user_id="u1")
+
+        self.assertEqual(normalize_prompt("  red SCARF , clothing "), "red scarf, clothing")
+        self.assertEqual(cache.get("red scarf, clothing", user_id="u1"), [ITEM])
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_user_scope_isolates_users(self):
+        cache = PromptResultCache(max_entries=10, ttl_seconds=60, scope="user")
+        cache.set("red scarf", [ITEM], user_id="u1")
+
+        self.assertIsNone(cache.get("red scarf", user_id="u2"))
+        self.assertIsNone(cache.get("red scarf"))
+
+    def test_global_scope_is_shared(self):
+        cache = PromptResultCache(max_entries=10, ttl_seconds=60, scope="global")
+        cache.set("red scarf", [ITEM], user_id="u1")
+
+        self.assertEqual(cache.get("red scarf", user_id="u2"), [ITEM])
+
+    def test_entries_are_keyed_by_day(self):
+        cache = PromptResultCache(max_entries=10, ttl_seconds=60, scope="global")
+        cache.set("red scarf", [ITEM], today=date(2025, 6, 15))
+
+        self.assertIsNone(cache.get("red scarf", today=date(2025, 6, 16)))
+
+    def test_entries_expire(self):
+        cache = PromptResultCache(max_entries=10, ttl_seconds=60, scope="global")
+        with patch("items.agent_cache.time.monotonic", return_value=1000.0):
+            cache.set("red scarf", [ITEM])
+        with patch("items.agent_cache.time.monotonic", return_value=1061.0):
+            self.assertIsNone(cache.get("red scarf"))
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = PromptResultCache(max_entries=2, ttl_seconds=60, scope="global")
+        cache.set("a", [ITEM])
+        cache.set("b", [ITEM])
+        cache.get("a")
+        cache.set("c", [ITEM])
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_cached_items_are_copies(self):
+        cache = PromptResultCache(max_entries=10, ttl_seconds=60, scope="global")
+        cache.set("red scarf", [dict(ITEM)])
+        cache.get("red scarf")[0]["name"] = "Changed"
+
+        self.assertEqual(cache.get("red scarf")[0]["name"], "Red Scarf")
+
+
+@patch("items.models.is_user_admin", return_value=False)
+class AgentPromptCacheTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="cache_user", clerk_id="cache_user", email="cache@example.com"
+        )
+        self.jwt_token = jwt.encode({"sub": "cache_user"}, "test", algorithm="HS256")
+        prompt_cache.clear()
+
+    def test_repeated_prompt_skips_the_model(self, _):
+        prompts = {"a": "red scarf"}
+        run_agent(prompts, self.jwt_token, strategy="concurrent", llm=FakeItemChatModel())
+
+        # A model that refuses every prompt: the second run must come from the cache
+        refusing_llm = FakeItemChatModel(responses={"red scarf": None})
+        result = run_agent(prompts, self.jwt_token, strategy="concurrent", llm=refusing_llm)
+
+        self.assertEqual(result["results"]["a"]["status"], "created")
+        self.assertEqual(OwnedItem.objects.filter(user=self.user).count(), 2)
+        self.assertEqual(prompt_cache.stats()["hits"], 1)
+
+    def test_failed_prompts_are_not_cached(self, _):
+        prompts = {"a": "hello"}
+        llm = FakeItemChatModel(responses={"hello": None})
+        run_agent(prompts, self.jwt_token, strategy="concurrent", llm=llm)
+
+        self.assertEqual(prompt_cache.stats()["size"], 0)
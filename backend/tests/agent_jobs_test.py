@@ -0,0 +1,100 @@
+"""
+Tests for background add-item agent jobs.
+"""
+
+import jwt
+from asgiref.sync import async_to_sync
+from django.test import AsyncRequestFactory, RequestFactory, TestCase, override_settings
+from django.contrib.auth import get_user_model
+from unittest.mock import patch
+from items import api
+from items.agent_jobs import submit_agent_job
+from items.agent_cache import prompt_cache
+from items.fake_chat_model import FakeItemChatModel
+from items.models import AgentJob, AgentJobStatus, OwnedItem
+
+User = get_user_model()
+
+
+@override_settings(AGENT_JOBS_EAGER=True)
+@patch("items.models.is_user_admin", return_value=False)
+class AgentJobTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="job_user", clerk_id="job_user", email="job@example.com"
+        )
+        self.jwt_token = jwt.encode({"sub": "job_user"}, "test", algorithm="HS256")
+        prompt_cache.clear()
+
+    def test_job_records_result_and_progress(self, _):
+        prompts = {"a": "red scarf", "b": "old laptop"}
+
+        with patch(
+            "items.addItemAgent.get_llm_with_tools", return_value=FakeItemChatModel()
+        ):
+            job = submit_agent_job(
+                self.user, prompts, self.jwt_token, strategy="concurrent"
+            )
+
+        self.assertEqual(job.status, AgentJobStatus.SUCCEEDED)
+        self.assertEqual(job.total_prompts, 2)
+        self.assertEqual(job.completed_prompts, 2)
+        self.assertEqual(set(job.result["results"]), {"a", "b"})
+        self.assertEqual(OwnedItem.objects.filter(user=self.user).count(), 2)
+
+    def test_job_records_failure(self, _):
+        job = submit_agent_job(
+            self.user, {"a": "red scarf"}, self.jwt_token, strategy="unknown"
+        )
+
+        self.assertEqual(job.status, AgentJobStatus.FAILED)
+        self.assertIn("Unknown batch strategy", job.error)
+
+
+@patch.object(api, "rate_limiter", None)
+class AgentJobEventsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="events_user", clerk_id="events_user", email="ev@example.com"
+        )
+
+    def get_events(self, factory, job_id):
+        request = factory.get(f"/api/agent-jobs/{job_id}/events")
+        request.user = self.user
+        return async_to_sync(api.stream_agent_job)(request, job_id)
+
+    def test_wsgi_request_gets_one_event_and_a_retry_hint(self):
+        job = AgentJob.objects.create(
+            user=self.user, status=AgentJobStatus.RUNNING, total_prompts=2
+        )
+
+        response = self.get_events(RequestFactory(), job.id)
+
+        body = response.content.decode()
+        self.assertFalse(response.streaming)
+        self.assertTrue(body.startswith(f"retry: {api.AGENT_JOB_STREAM_RETRY_MS}\n"))
+        self.assertIn("event: progress", body)
+
+    def test_asgi_request_streams_until_done(self):
+        job = AgentJob.objects.create(
+            user=self.user, status=AgentJobStatus.SUCCEEDED, total_prompts=1
+        )
+
+        response = self.get_events(AsyncRequestFactory(), job.id)
+
+        async def read(stream):
+            return [chunk async for chunk in stream]
+
+        chunks = async_to_sync(read)(response.streaming_content)
+        self.assertTrue(response.streaming)
+        self.assertEqual(len(chunks), 1)
+        self.assertTrue(chunks[0].startswith(b"event: done"))
+
+    def test_other_users_jobs_are_not_found(self):
+        other = User.objects.create_user(
+            username="other_user", clerk_id="other_user", email="o@example.com"
+        )
+        job = AgentJob.objects.create(user=other, total_prompts=1)
+
+        with self.assertRaises(api.HttpError):
+            self.get_events(RequestFactory(), job.id)
@@ -0,0 +1,107 @@
+"""
+Tests for add-item agent run metrics.
+"""
+
+import jwt
+from django.http import HttpResponse
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.contrib.auth import get_user_model
+from unittest.mock import patch
+from items import agent_metrics
+from items.agent_cache import prompt_cache
+from items.agent_metrics import AgentRunMetrics, attach_debug_headers, track_agent_run
+from items.addItemAgent import run_agent
+from items.fake_chat_model import FakeItemChatModel
+
+User = get_user_model()
+
+
+class RecordingSink(agent_metrics.MetricsSink):
+    emitted = []
+
+    def emit(self, metrics):
+        RecordingSink.emitted.append(metrics.as_dict())
+
+
+class AgentRunMetricsTest(SimpleTestCase):
+    def test_extra_http_attempts_count_as_retries(self):
+        metrics = AgentRunMetrics()
+        with track_agent_run(metrics):
+            for _ in range(3):
+                agent_metrics.count_http_request(None)
+            agent_metrics.record_llm_call(0.5, None)
+
+        self.assertEqual(metrics.retries, 2)
+        self.assertEqual(metrics.llm_calls, 1)
+
+    def test_recording_outside_a_run_is_a_no_op(self):
+        agent_metrics.record(cache_hits=1)
+        agent_metrics.record_llm_call(0.1, None)
+
+    @override_settings(AGENT_METRICS_SINK="tests.agent_metrics_test.RecordingSink")
+    def test_metrics_are_exported_to_the_configured_sink(self):
+        agent_metrics.get_metrics_sink.cache_clear()
+        RecordingSink.emitted = []
+        try:
+            with track_agent_run(AgentRunMetrics(strategy="combined")):
+                agent_metrics.record(fast_path_hits=2)
+        finally:
+            agent_metrics.get_metrics_sink.cache_clear()
+
+        self.assertEqual(len(RecordingSink.emitted), 1)
+        self.assertEqual(RecordingSink.emitted[0]["strategy"], "combined")
+        self.assertEqual(RecordingSink.emitted[0]["fast_path_hits"], 2)
+
+    def test_debug_headers_are_opt_in(self):
+        metrics = AgentRunMetrics(llm_calls=2, prompt_tokens=40)
+
+        response = HttpResponse()
+        attach_debug_headers(response, metrics)
+        self.assertFalse(response.has_header("X-Agent-LLM-Calls"))
+
+        with override_settings(AGENT_DEBUG_HEADERS=True):
+            attach_debug_headers(response, metrics)
+        self.assertEqual(response["X-Agent-LLM-Calls"], "2")
+        self.assertEqual(response["X-Agent-Prompt-Tokens"], "40")
+
+
+@patch("items.models.is_user_admin", return_value=False)
+class AgentRunInstrumentationTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="metrics_user", clerk_id="metrics_user", email="m@example.com"
+        )
+        self.jwt_token = jwt.encode({"sub": "metrics_user"}, "test", algorithm="HS256")
+        prompt_cache.clear()
+
+    def test_concurrent_run_records_llm_tokens_and_db_time(self, _):
+        metrics = AgentRunMetrics()
+        run_agent(
+            {"a": "red scarf", "b": "old laptop"},
+            self.jwt_token,
+            strategy="concurrent",
+            llm=FakeItemChatModel(),
+            metrics=metrics,
+        )
+
+        self.assertEqual(metrics.strategy, "concurrent")
+        self.assertEqual(metrics.prompts, 2)
+        self.assertEqual(metrics.llm_calls, 2)
+        self.assertEqual(metrics.tool_calls, 2)
+        self.assertGreater(metrics.prompt_tokens, 0)
+        self.assertGreater(metrics.completion_tokens, 0)
+        self.assertGreater(metrics.db_seconds, 0)
+        self.assertGreater(metrics.total_seconds, 0)
+
+    def test_combined_run_makes_one_llm_call(self, _):
+        metrics = AgentRunMetrics()
+        run_agent(
+            {"a": "red scarf", "b": "old laptop"},
+            self.jwt_token,
+            strategy="combined",
+            llm=FakeItemChatModel(),
+            metrics=metrics,
+        )
+
+        self.assertEqual(metrics.llm_calls, 1)
+        self.assertGreater(metrics.prompt_tokens, 0)
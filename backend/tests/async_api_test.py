@@ -0,0 +1,69 @@
+"""
+Tests for the async API helpers and the load test command.
+"""
+
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase
+from unittest.mock import MagicMock, patch
+from items import api
+from items.management.commands.load_test import percentile
+
+
+class AsyncRateLimitTest(SimpleTestCase):
+    def setUp(self):
+        self.request = MagicMock()
+        self.request.user.id = 7
+
+    def test_allows_requests_without_a_limiter(self):
+        with patch.object(api, "rate_limiter", None):
+            allowed, error = async_to_sync(api.acheck_rate_limit)(self.request)
+
+        self.assertTrue(allowed)
+        self.assertIsNone(error)
+
+    def test_blocks_when_the_limit_is_exceeded(self):
+        limiter = MagicMock()
+        limiter.limit.return_value = MagicMock(allowed=False, reset=30)
+        with patch.object(api, "rate_limiter", limiter):
+            allowed, error = async_to_sync(api.acheck_rate_limit)(self.request)
+
+        limiter.limit.assert_called_once_with("7")
+        self.assertFalse(allowed)
+        self.assertIn("Rate limit exceeded", error["detail"])
+
+    def test_limiter_errors_do_not_block_requests(self):
+        limiter = MagicMock()
+        limiter.limit.side_effect = ConnectionError("redis down")
+        with patch.object(api, "rate_limiter", limiter):
+            allowed, _ = async_to_sync(api.acheck_rate_limit)(self.request)
+
+        self.assertTrue(allowed)
+
+    def test_works_across_event_loops(self):
+        # Under WSGI every async view runs in a new event loop
+        limiter = MagicMock()
+        limiter.limit.return_value = MagicMock(allowed=True)
+        with patch.object(api, "rate_limiter", limiter):
+            for _ in range(2):
+                allowed, _ = async_to_sync(api.acheck_rate_limit)(self.request)
+                self.assertTrue(allowed)
+
+        self.assertEqual(limiter.limit.call_count, 2)
+
+
+class RunInThreadTest(SimpleTestCase):
+    def test_returns_the_result_and_releases_the_connection(self):
+        with patch.object(api, "connections") as connections:
+            result = async_to_sync(api.run_in_thread)(sorted, [3, 1, 2], reverse=True)
+
+        self.assertEqual(result, [3, 2, 1])
+        connections.close_all.assert_called_once()
+
+
+class PercentileTest(SimpleTestCase):
+    def test_nearest_rank(self):
+        values = [0.1 * i for i in range(1, 101)]
+
+        self.assertAlmostEqual(percentile(values, 0.5), 5.0)
+        self.assertAlmostEqual(percentile(values, 0.99), 9.9)
+        self.assertEqual(percentile([], 0.5), 0.0)
@@ -629,4 +629,42 @@ class CheckupEdgeCaseTest(TestCase):
         next_due_zero = get_next_checkup_due_date(any_date, 0)
         self.assertEqual(next_due_zero.year, 2024)
         self.assertEqual(next_due_zero.month, 6)
-        self.assertEqual(next_due_zero.day, 1)
\ No newline at end of file
+        self.assertEqual(next_due_zero.day, 1)
+
+
+class CheckupIntervalBulkUpdateTest(TestCase):
+    """Test updating every checkup interval for a user at once."""
+
+    def test_update_user_checkup_intervals(self):
+        from items.services import CheckupService
+
+        user = User.objects.create_user(
+            username="bulkuser", email="bulk@example.com", password="testpass123"
+        )
+        other_user = User.objects.create_user(
+            username="otheruser", email="other@example.com", password="testpass123"
+        )
+
+        checkups = CheckupService.update_user_checkup_intervals(user, 6)
+
+        self.assertEqual(
+            sorted(c.checkup_type for c in checkups),
+            [CheckupType.GIVE, CheckupType.KEEP],
+        )
+        for checkup in checkups:
+            self.assertEqual(checkup.checkup_interval_months, 6)
+            self.assertEqual(checkup.user, user)
+            self.assertFalse(checkup.is_checkup_due)
+
+        self.assertTrue(
+            all(
+                c.checkup_interval_months == 6
+                for c in Checkup.objects.filter(user=user)
+            )
+        )
+        self.assertTrue(
+            all(
+                c.checkup_interval_months == 1
+                for c in Checkup.objects.filter(user=other_user)
+            )
+        )
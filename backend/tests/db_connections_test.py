@@ -0,0 +1,83 @@
+"""
+Tests for the database connection reuse benchmark.
+"""
+
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from unittest.mock import patch
+from items.management.commands.benchmark_db_connections import per_request_settings
+from minNow.settings import configure_connection_reuse
+
+
+class PerRequestSettingsTest(SimpleTestCase):
+    def test_disables_reuse_without_touching_the_original(self):
+        settings_dict = {
+            "ENGINE": "django.db.backends.postgresql",
+            "CONN_MAX_AGE": 60,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {"sslmode": "require", "pool": {"max_size": 10}},
+        }
+
+        baseline = per_request_settings(settings_dict)
+
+        self.assertEqual(baseline["CONN_MAX_AGE"], 0)
+        self.assertFalse(baseline["CONN_HEALTH_CHECKS"])
+        self.assertEqual(baseline["OPTIONS"], {"sslmode": "require"})
+        self.assertIn("pool", settings_dict["OPTIONS"])
+
+
+class BenchmarkDbConnectionsCommandTest(TestCase):
+    def test_reports_both_scenarios(self):
+        out = StringIO()
+        call_command(
+            "benchmark_db_connections", requests=3, queries=1, json=True, stdout=out
+        )
+
+        report = json.loads(out.getvalue())
+        self.assertEqual(set(report["scenarios"]), {"per-request", "configured"})
+        self.assertIn("saved_ms_per_request", report)
+
+
+class ConfigureConnectionReuseTest(SimpleTestCase):
+    def database(self):
+        return {"ENGINE": "django.db.backends.postgresql", "OPTIONS": {}}
+
+    def installed(self, *names):
+        return lambda name: object() if name in names else None
+
+    def test_uses_the_pool_with_psycopg_3(self):
+        database = self.database()
+        with patch(
+            "minNow.settings.importlib.util.find_spec",
+            side_effect=self.installed("psycopg", "psycopg_pool"),
+        ):
+            use_pool = configure_connection_reuse(database, True)
+
+        self.assertTrue(use_pool)
+        self.assertEqual(database["CONN_MAX_AGE"], 0)
+        self.assertIn("pool", database["OPTIONS"])
+
+    def test_falls_back_with_psycopg2(self):
+        database = self.database()
+        with patch(
+            "minNow.settings.importlib.util.find_spec",
+            side_effect=self.installed("psycopg2", "psycopg_pool"),
+        ), self.assertLogs("minNow", level="WARNING") as logs:
+            use_pool = configure_connection_reuse(database, True)
+
+        self.assertFalse(use_pool)
+        self.assertIn("CONN_MAX_AGE", database)
+        self.assertNotIn("pool", database["OPTIONS"])
+        self.assertIn("psycopg", logs.output[0])
+
+    def test_falls_back_off_postgresql(self):
+        database = {"ENGINE": "django.db.backends.sqlite3"}
+
+        with self.assertLogs("minNow", level="WARNING"):
+            use_pool = configure_connection_reuse(database, True)
+
+        self.assertFalse(use_pool)
+        self.assertNotIn("OPTIONS", database)
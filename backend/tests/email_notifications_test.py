@@ -0,0 +1,297 @@
+"""
+Tests for sharding and Clerk preference lookups in the
+run_email_notifications management command.
+"""
+
+import argparse
+from types import SimpleNamespace
+from unittest.mock import MagicMock, call, patch
+from django.core.management import call_command
+from django.test import Client, TestCase
+from django.contrib.auth import get_user_model
+from items import api
+from minNow.auth import ClerkAuth
+from items.management.commands.run_email_notifications import (
+    fetch_email_notification_preferences,
+    filter_users_for_shard,
+    parse_shard,
+)
+
+User = get_user_model()
+
+
+class ParseShardTest(TestCase):
+    def test_parse_valid_shard(self):
+        self.assertEqual(parse_shard("0/4"), (0, 4))
+        self.assertEqual(parse_shard("3/4"), (3, 4))
+
+    def test_parse_invalid_shard(self):
+        for value in ["4/4", "-1/4", "1/0", "abc", "1/2/3"]:
+            with self.assertRaises(argparse.ArgumentTypeError):
+                parse_shard(value)
+
+
+class FilterUsersForShardTest(TestCase):
+    def setUp(self):
+        for i in range(10):
+            User.objects.create_user(
+                username=f"user{i}", clerk_id=f"clerk_{i}", email=f"u{i}@example.com"
+            )
+        self.users = User.objects.filter(clerk_id__isnull=False)
+
+    def test_shards_partition_users(self):
+        """Every user is in exactly one shard, so no email is sent twice."""
+        shard_count = 3
+        seen = []
+        for index in range(shard_count):
+            shard_users = filter_users_for_shard(self.users, index, shard_count)
+            seen.extend(shard_users.values_list("id", flat=True))
+
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(set(seen), set(self.users.values_list("id", flat=True)))
+
+    def test_single_shard_returns_all_users(self):
+        self.assertEqual(
+            filter_users_for_shard(self.users, 0, 1).count(), self.users.count()
+        )
+
+
+class StoredPreferenceEligibilityTest(TestCase):
+    def setUp(self):
+        self.enabled = User.objects.create_user(
+            username="enabled", clerk_id="clerk_enabled", email="on@example.com"
+        )
+        self.enabled.email_notifications = True
+        self.enabled.save()
+
+        self.disabled = User.objects.create_user(
+            username="disabled", clerk_id="clerk_disabled", email="off@example.com"
+        )
+        self.disabled.email_notifications = False
+        self.disabled.save()
+
+        self.unsynced = User.objects.create_user(
+            username="unsynced", clerk_id="clerk_unsynced", email="new@example.com"
+        )
+
+    def test_only_unsynced_users_are_looked_up_in_clerk(self):
+        with patch(
+            "items.management.commands.run_email_notifications.fetch_email_notification_preferences",
+            return_value={"clerk_unsynced"},
+        ) as mock_fetch, patch(
+            "items.management.commands.run_email_notifications.has_email_notifications_enabled"
+        ) as mock_per_user, patch(
+            "items.management.commands.run_email_notifications.CheckupService.check_and_send_only_due_emails",
+            return_value=[],
+        ):
+            summary = call_command("run_email_notifications")
+
+        mock_fetch.assert_called_once()
+        mock_per_user.assert_not_called()
+        self.assertIn("2 eligible users", summary)
+
+        # The Clerk preference is stored so the next run needs no lookup
+        self.unsynced.refresh_from_db()
+        self.assertTrue(self.unsynced.email_notifications)
+
+    def test_dry_run_does_not_store_clerk_preferences(self):
+        with patch(
+            "items.management.commands.run_email_notifications.fetch_email_notification_preferences",
+            return_value={"clerk_unsynced"},
+        ):
+            summary = call_command("run_email_notifications", dry_run=True)
+
+        self.assertIn("2 eligible users", summary)
+        self.unsynced.refresh_from_db()
+        self.assertIsNone(self.unsynced.email_notifications)
+
+    def test_no_clerk_calls_when_all_preferences_synced(self):
+        self.unsynced.email_notifications = False
+        self.unsynced.save()
+
+        with patch(
+            "items.management.commands.run_email_notifications.fetch_email_notification_preferences"
+        ) as mock_fetch:
+            summary = call_command("run_email_notifications", dry_run=True)
+
+        mock_fetch.assert_not_called()
+        self.assertIn("1 eligible users", summary)
+
+    def test_shard_only_looks_up_its_own_users_in_clerk(self):
+        other = User.objects.create_user(
+            username="unsynced2", clerk_id="clerk_unsynced2", email="n2@example.com"
+        )
+        shard_index = self.unsynced.id % 2
+
+        with patch(
+            "items.management.commands.run_email_notifications.fetch_email_notification_preferences",
+            return_value=set(),
+        ) as mock_fetch:
+            call_command("run_email_notifications", dry_run=True, shard=(shard_index, 2))
+
+        unsynced_in_shard = [
+            user.clerk_id
+            for user in (self.unsynced, other)
+            if user.id % 2 == shard_index
+        ]
+        mock_fetch.assert_called_once()
+        self.assertCountEqual(mock_fetch.call_args.kwargs["clerk_ids"], unsynced_in_shard)
+
+
+def clerk_user(clerk_id, enabled):
+    return SimpleNamespace(id=clerk_id, unsafe_metadata={"emailNotifications": enabled})
+
+
+class FetchEmailNotificationPreferencesTest(TestCase):
+    def mock_clerk(self, pages):
+        clerk = MagicMock()
+        clerk.users.list.side_effect = pages
+        patcher = patch(
+            "items.management.commands.run_email_notifications.Clerk"
+        )
+        mock_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_class.return_value.__enter__.return_value = clerk
+        return clerk
+
+    def test_walks_every_page_until_a_short_one(self):
+        clerk = self.mock_clerk(
+            [
+                [clerk_user("a", True), clerk_user("b", False)],
+                [clerk_user("c", True), clerk_user("d", None)],
+                [clerk_user("e", True)],
+            ]
+        )
+
+        enabled = fetch_email_notification_preferences(page_size=2)
+
+        self.assertEqual(enabled, {"a", "c", "e"})
+        self.assertEqual(
+            clerk.users.list.call_args_list,
+            [
+                call(request={"limit": 2, "offset": 0}),
+                call(request={"limit": 2, "offset": 2}),
+                call(request={"limit": 2, "offset": 4}),
+            ],
+        )
+
+    def test_stops_on_an_empty_page_after_a_full_one(self):
+        clerk = self.mock_clerk([[clerk_user("a", True), clerk_user("b", True)], []])
+
+        enabled = fetch_email_notification_preferences(page_size=2)
+
+        self.assertEqual(enabled, {"a", "b"})
+        self.assertEqual(clerk.users.list.call_count, 2)
+
+    def test_filters_by_user_id_in_chunks(self):
+        clerk_ids = [f"user_{i}" for i in range(150)]
+        clerk = self.mock_clerk([[clerk_user("user_3", True)], []])
+
+        enabled = fetch_email_notification_preferences(clerk_ids=clerk_ids)
+
+        self.assertEqual(enabled, {"user_3"})
+        self.assertEqual(
+            clerk.users.list.call_args_list,
+            [
+                call(request={"user_id": clerk_ids[:100], "limit": 100}),
+                call(request={"user_id": clerk_ids[100:], "limit": 50}),
+            ],
+        )
+
+
+class ClerkBatchFallbackTest(TestCase):
+    def test_checks_users_individually_when_the_batch_call_fails(self):
+        users = [
+            User.objects.create_user(
+                username=f"fallback{i}", clerk_id=f"clerk_fb{i}", email=f"fb{i}@example.com"
+            )
+            for i in range(2)
+        ]
+
+        with patch(
+            "items.management.commands.run_email_notifications.Clerk"
+        ) as mock_class, patch(
+            "items.management.commands.run_email_notifications.has_email_notifications_enabled",
+            side_effect=lambda user: user.clerk_id == "clerk_fb0",
+        ) as mock_per_user:
+            clerk = mock_class.return_value.__enter__.return_value
+            clerk.users.list.side_effect = ConnectionError("Clerk unavailable")
+            summary = call_command("run_email_notifications", dry_run=True)
+
+        self.assertEqual(mock_per_user.call_count, 2)
+        self.assertIn("1 eligible users", summary)
+        # Nothing is stored from a failed batch, so the next run retries Clerk
+        for user in users:
+            user.refresh_from_db()
+            self.assertIsNone(user.email_notifications)
+
+
+class OptedOutUsersTest(TestCase):
+    def test_opted_out_users_are_skipped_without_clerk(self):
+        for i in range(3):
+            user = User.objects.create_user(
+                username=f"optout{i}", clerk_id=f"clerk_optout{i}", email=f"o{i}@example.com"
+            )
+            user.email_notifications = False
+            user.save()
+
+        with patch(
+            "items.management.commands.run_email_notifications.Clerk"
+        ) as mock_clerk, patch(
+            "items.management.commands.run_email_notifications.has_email_notifications_enabled"
+        ) as mock_per_user:
+            summary = call_command("run_email_notifications", dry_run=True)
+
+        mock_clerk.assert_not_called()
+        mock_per_user.assert_not_called()
+        self.assertIn("0 eligible users", summary)
+
+
+@patch.object(api, "rate_limiter", None)
+@patch("items.models.is_user_admin", return_value=False)
+class SyncPreferencesApiTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="prefs_user", clerk_id="prefs_user", email="p@example.com"
+        )
+        self.client = Client()
+
+        def authenticate(auth, request, token):
+            request.user = self.user
+            return token
+
+        patcher = patch.object(
+            ClerkAuth, "_authenticate", autospec=True, side_effect=authenticate
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def sync(self, email_notifications, interval=3):
+        return self.client.post(
+            "/api/sync-preferences",
+            data={"checkupInterval": interval, "emailNotifications": email_notifications},
+            content_type="application/json",
+            HTTP_AUTHORIZATION="Bearer test-token",
+        )
+
+    def test_email_preference_is_stored_on_the_user(self, _):
+        response = self.sync(False)
+
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.email_notifications)
+
+        self.sync(True)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.email_notifications)
+
+    def test_opted_out_user_is_skipped_by_the_notification_command(self, _):
+        self.sync(False)
+
+        with patch(
+            "items.management.commands.run_email_notifications.Clerk"
+        ) as mock_clerk:
+            summary = call_command("run_email_notifications", dry_run=True)
+
+        mock_clerk.assert_not_called()
+        self.assertIn("0 eligible users", summary)
@@ -0,0 +1,101 @@
+"""
+Tests for ETag / conditional GET support on the polled list endpoints.
+"""
+
+import json
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from unittest.mock import patch
+from items import api, item_cache
+from items.models import ItemType
+from items.services import CheckupService, ItemService
+
+User = get_user_model()
+
+
+@override_settings(ETAGS_ENABLED=True)
+@patch("items.models.is_user_admin", return_value=False)
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(
+            username="etag_user", clerk_id="etag_user", email="e@example.com"
+        )
+
+    def get(self, path, etag=None):
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        request = self.factory.get(path, **headers)
+        request.user = self.user
+        return request, HttpResponse()
+
+    def test_unchanged_items_return_304_without_queries(self, _):
+        request, response = self.get("/api/items")
+        api.list_items(request, response)
+        etag = response["ETag"]
+        self.assertTrue(etag.startswith('W/"items-'))
+
+        request, response = self.get("/api/items", etag=etag)
+        with self.assertNumQueries(0):
+            result = api.list_items(request, response)
+
+        self.assertEqual(result.status_code, 304)
+        self.assertEqual(result["ETag"], etag)
+
+    def test_item_writes_change_the_items_and_badges_etag(self, _):
+        request, response = self.get("/api/badges/donated")
+        api.get_donated_badges(request, response)
+        etag = response["ETag"]
+
+        ItemService.create_item(
+            user=self.user, name="Lamp", picture_url="💡", item_type=ItemType.DECOR_ART
+        )
+
+        request, response = self.get("/api/badges/donated", etag=etag)
+        result = api.get_donated_badges(request, response)
+        self.assertNotIsInstance(result, HttpResponse)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_checkup_writes_change_the_checkups_etag(self, _):
+        request, response = self.get("/api/checkups")
+        api.list_checkups(request, response)
+        etag = response["ETag"]
+
+        CheckupService.update_user_checkup_intervals(self.user, 3)
+
+        request, response = self.get("/api/checkups", etag=etag)
+        result = api.list_checkups(request, response)
+        self.assertEqual(len(result), 2)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_checkup_version_is_bumped_after_the_update(self, _):
+        intervals_at_bump = []
+
+        def record_intervals(user_id, scope):
+            intervals_at_bump.extend(
+                self.user.checkups.values_list("checkup_interval_months", flat=True)
+            )
+
+        with patch.object(item_cache, "bump_version", side_effect=record_intervals):
+            CheckupService.update_user_checkup_intervals(self.user, 3)
+
+        self.assertEqual(intervals_at_bump, [3, 3])
+
+    def test_etag_changes_with_the_date(self, _):
+        self.assertNotEqual(
+            item_cache.user_etag(self.user.id, item_cache.ITEMS, today=date(2025, 6, 15)),
+            item_cache.user_etag(self.user.id, item_cache.ITEMS, today=date(2025, 6, 16)),
+        )
+
+    @override_settings(ETAGS_ENABLED=False)
+    def test_disabled_etags_are_not_sent(self, _):
+        request, response = self.get("/api/items", etag="*")
+        result = api.list_items(request, response)
+
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(json.loads(result.content), [])
+        self.assertFalse(result.has_header("ETag"))
@@ -0,0 +1,127 @@
+"""
+Tests for the rule-based fast path of the add-item agent.
+"""
+
+import json
+from datetime import date
+
+import jwt
+from django.test import SimpleTestCase, TestCase
+from django.contrib.auth import get_user_model
+from unittest.mock import patch
+from items.agent_cache import prompt_cache
+from items.addItemAgent import run_agent
+from items.fast_path import (
+    CORPUS_PATH,
+    evaluate_fast_path,
+    parse_item_prompt,
+    try_fast_path,
+)
+from items.models import ItemStatus, ItemType, OwnedItem
+
+User = get_user_model()
+
+TODAY = date(2025, 6, 15)
+
+
+class ParseItemPromptTest(SimpleTestCase):
+    def test_simple_prompt_is_confident(self):
+        result = parse_item_prompt("blue jacket, clothing, got it 2 years ago", TODAY)
+
+        self.assertGreaterEqual(result.confidence, 0.8)
+        self.assertEqual(result.item_json["name"], "Blue Jacket")
+        self.assertEqual(result.item_json["item_type"], ItemType.CLOTHING_ACCESSORIES)
+        self.assertEqual(result.item_json["status"], ItemStatus.KEEP)
+        self.assertTrue(result.item_json["item_received_date"].startswith("2023-06-15"))
+
+    def test_status_month_year_and_goal(self):
+        result = parse_item_prompt(
+            "desk lamp, furniture, bought in March 2023, donate, keep for 2 years",
+            TODAY,
+        )
+
+        self.assertEqual(result.item_json["item_type"], ItemType.FURNITURE_APPLIANCES)
+        self.assertEqual(result.item_json["status"], ItemStatus.DONATE)
+        self.assertTrue(result.item_json["item_received_date"].startswith("2023-03-01"))
+        self.assertEqual(result.item_json["ownership_duration_goal_months"], 24)
+
+    def test_prompt_without_date_is_not_confident(self):
+        result = parse_item_prompt("red scarf", TODAY)
+
+        self.assertLess(result.confidence, 0.8)
+
+    def test_multiple_items_are_left_to_the_llm(self):
+        result = parse_item_prompt("a jacket and a laptop, got them last year", TODAY)
+
+        self.assertIsNone(result.item_json)
+        self.assertEqual(result.confidence, 0.0)
+
+    def test_unparsed_details_lower_confidence(self):
+        result = parse_item_prompt("sofa, got it a year ago, too big for the flat", TODAY)
+
+        self.assertLess(result.confidence, 0.8)
+
+    def test_negations_and_gifts_are_left_to_the_llm(self):
+        for prompt in [
+            "I don't want to donate my bike, got it in 2020",
+            "headphones my sister gave me 2 years ago",
+            "headphones from my sister, got them 2 years ago",
+        ]:
+            result = parse_item_prompt(prompt, TODAY)
+
+            self.assertIsNone(result.item_json, prompt)
+
+    def test_sentence_leftovers_are_not_accepted_as_a_name(self):
+        result = parse_item_prompt("I have a red drill bought a year ago", TODAY)
+
+        self.assertIsNone(result.item_json)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(try_fast_path("blue jacket, clothing, got it 2 years ago", TODAY))
+
+    def test_corpus_hit_rate_and_agreement(self):
+        with open(CORPUS_PATH, "r", encoding="utf-8") as f:
+            corpus = json.load(f)
+
+        report = evaluate_fast_path(
+            corpus["cases"], date.fromisoformat(corpus["today"]), threshold=0.8
+        )
+
+        self.assertGreaterEqual(report["hit_rate"], 0.6)
+        self.assertGreaterEqual(report["agreement"], 0.9)
+
+
+@patch("items.fast_path.FAST_PATH_ENABLED", True)
+@patch("items.models.is_user_admin", return_value=False)
+class FastPathAgentTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="fast_user", clerk_id="fast_user", email="fast@example.com"
+        )
+        self.jwt_token = jwt.encode({"sub": "fast_user"}, "test", algorithm="HS256")
+        prompt_cache.clear()
+
+    def test_sequential_run_skips_llm_on_fast_path_hit(self, _):
+        with patch(
+            "items.addItemAgent.get_llm_with_tools",
+            side_effect=AssertionError("LLM should not be called"),
+        ):
+            run_agent({"a": "blue jacket, clothing, got it 2 years ago"}, self.jwt_token)
+
+        item = OwnedItem.objects.get(user=self.user)
+        self.assertEqual(item.name, "Blue Jacket")
+        self.assertEqual(item.item_type, ItemType.CLOTHING_ACCESSORIES)
+
+    def test_concurrent_run_skips_llm_on_fast_path_hit(self, _):
+        with patch(
+            "items.addItemAgent.get_llm_with_tools",
+            side_effect=AssertionError("LLM should not be called"),
+        ):
+            result = run_agent(
+                {"a": "road bike, bought last year"},
+                self.jwt_token,
+                strategy="concurrent",
+            )
+
+        self.assertEqual(result["results"]["a"]["status"], "created")
+        self.assertEqual(OwnedItem.objects.get(user=self.user).item_type, ItemType.VEHICLES)
@@ -0,0 +1,85 @@
+"""
+Tests for the per-user item list cache.
+"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from unittest.mock import patch
+from items import item_cache
+from items.models import ItemStatus, ItemType, OwnedItem
+from items.services import ItemService
+
+User = get_user_model()
+
+
+@override_settings(ITEM_CACHE_ENABLED=True)
+@patch("items.models.is_user_admin", return_value=False)
+class ItemCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="cache_user", clerk_id="cache_user", email="c@example.com"
+        )
+        self.item = ItemService.create_item(
+            user=self.user,
+            name="Wool Coat",
+            picture_url="🧥",
+            item_type=ItemType.CLOTHING_ACCESSORIES,
+            item_received_date=timezone.now() - timedelta(days=400),
+        )
+
+    def test_second_read_is_served_from_the_cache(self, _):
+        ItemService.get_cached_items_for_user(self.user)
+
+        with self.assertNumQueries(0):
+            items = ItemService.get_cached_items_for_user(self.user)
+
+        self.assertEqual([item.id for item in items], [self.item.id])
+
+    def test_cached_items_match_database_items(self, _):
+        ItemService.get_cached_items_for_user(self.user)
+        cached = ItemService.get_cached_items_for_user(self.user)[0]
+        stored = OwnedItem.objects.get(id=self.item.id)
+
+        self.assertEqual(cached.ownership_duration.description, stored.ownership_duration.description)
+        self.assertEqual(cached.keep_badge_progress, stored.keep_badge_progress)
+        self.assertEqual(
+            cached.ownership_duration_goal_progress, stored.ownership_duration_goal_progress
+        )
+
+    def test_writes_invalidate_the_cache(self, _):
+        ItemService.get_cached_items_for_user(self.user)
+
+        ItemService.update_item(self.item.id, status=ItemStatus.DONATE)
+        items = ItemService.get_cached_items_for_user(self.user)
+        self.assertEqual(items[0].status, ItemStatus.DONATE)
+
+        second = ItemService.create_item(
+            user=self.user, name="Novel", picture_url="📚", item_type=ItemType.BOOKS_MEDIA
+        )
+        self.assertEqual(len(ItemService.get_cached_items_for_user(self.user)), 2)
+
+        ItemService.delete_item(second.id)
+        self.assertEqual(len(ItemService.get_cached_items_for_user(self.user)), 1)
+
+    def test_filters_apply_to_cached_rows(self, _):
+        self.assertEqual(
+            ItemService.get_cached_items_for_user(self.user, status=ItemStatus.GIVE), []
+        )
+        clothing = ItemService.get_cached_items_for_user(
+            self.user, item_type=ItemType.CLOTHING_ACCESSORIES
+        )
+        self.assertEqual(len(clothing), 1)
+
+    def test_bumping_a_missing_version_starts_a_new_one(self, _):
+        version = item_cache.get_version(self.user.id)
+        cache.delete(f"user:{self.user.id}:items:version")
+
+        with patch("items.item_cache.time.time", return_value=version / 1000 + 1):
+            item_cache.bump_version(self.user.id)
+
+        self.assertNotEqual(item_cache.get_version(self.user.id), version)
@@ -0,0 +1,85 @@
+"""
+Tests for delta sync of items (GET /items/changes).
+"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from unittest.mock import patch
+from items.models import ItemStatus, ItemType, OwnedItemTombstone
+from items.services import ItemService
+
+User = get_user_model()
+
+
+@override_settings(ITEM_CHANGES_CURSOR_OVERLAP_SECONDS=0)
+@patch("items.models.is_user_admin", return_value=False)
+class ItemChangesTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="sync_user", clerk_id="sync_user", email="s@example.com"
+        )
+        self.coat = self.create("Coat")
+        self.lamp = self.create("Lamp")
+
+    def create(self, name):
+        return ItemService.create_item(
+            user=self.user, name=name, picture_url="📦", item_type=ItemType.OTHER
+        )
+
+    def test_first_sync_returns_everything(self, _):
+        updated, deleted, cursor, reset = ItemService.get_item_changes(self.user)
+
+        self.assertTrue(reset)
+        self.assertEqual({item.id for item in updated}, {self.coat.id, self.lamp.id})
+        self.assertEqual(deleted, [])
+        self.assertLessEqual(cursor, timezone.now())
+
+    def test_returns_only_changes_since_the_cursor(self, _):
+        *_, cursor, _ = ItemService.get_item_changes(self.user)
+
+        ItemService.update_item(self.coat.id, status=ItemStatus.GIVE)
+        ItemService.delete_item(self.lamp.id)
+        scarf = self.create("Scarf")
+
+        updated, deleted, _, reset = ItemService.get_item_changes(self.user, since=cursor)
+
+        self.assertFalse(reset)
+        self.assertEqual({item.id for item in updated}, {self.coat.id, scarf.id})
+        self.assertEqual(deleted, [self.lamp.id])
+
+    def test_other_users_changes_are_not_returned(self, _):
+        *_, cursor, _ = ItemService.get_item_changes(self.user)
+        other = User.objects.create_user(
+            username="other_user", clerk_id="other_user", email="o@example.com"
+        )
+        ItemService.create_item(
+            user=other, name="Bike", picture_url="🚲", item_type=ItemType.VEHICLES
+        )
+
+        updated, deleted, _, _ = ItemService.get_item_changes(self.user, since=cursor)
+
+        self.assertEqual((updated, deleted), ([], []))
+
+    @override_settings(ITEM_TOMBSTONE_RETENTION_DAYS=30)
+    def test_cursor_older_than_tombstones_forces_a_reset(self, _):
+        since = timezone.now() - timedelta(days=31)
+
+        updated, _, _, reset = ItemService.get_item_changes(self.user, since=since)
+
+        self.assertTrue(reset)
+        self.assertEqual(len(updated), 2)
+
+    @override_settings(ITEM_TOMBSTONE_RETENTION_DAYS=30)
+    def test_old_tombstones_are_pruned(self, _):
+        ItemService.delete_item(self.lamp.id)
+        OwnedItemTombstone.objects.create(
+            user=self.user,
+            item_id=self.coat.id,
+            deleted_at=timezone.now() - timedelta(days=40),
+        )
+
+        self.assertEqual(ItemService.prune_item_tombstones(), 1)
+        self.assertEqual(OwnedItemTombstone.objects.count(), 1)
@@ -0,0 +1,103 @@
+"""
+Tests for the Server-Timing / request profiling middleware.
+"""
+
+import json
+import os
+import tempfile
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from unittest.mock import patch
+from minNow.middleware import ServerTimingMiddleware, timed_phase
+
+User = get_user_model()
+
+
+def view(request):
+    with timed_phase("auth"):
+        User.objects.filter(username="nobody").exists()
+    return HttpResponse("ok")
+
+
+@override_settings(REQUEST_TIMING_ENABLED=True, REQUEST_TIMING_HEADER=True)
+class ServerTimingMiddlewareTest(TestCase):
+    def setUp(self):
+        self.request = RequestFactory().get("/api/items")
+
+    def test_sets_server_timing_with_phases_and_queries(self):
+        response = ServerTimingMiddleware(view)(self.request)
+
+        header = response["Server-Timing"]
+        self.assertIn("auth;dur=", header)
+        self.assertIn('db;dur=', header)
+        self.assertIn('desc="1 queries"', header)
+        self.assertIn("total;dur=", header)
+
+    def test_logs_one_structured_line(self):
+        with self.assertLogs("minNow.timing", level="INFO") as logs:
+            ServerTimingMiddleware(view)(self.request)
+
+        line = logs.records[0].getMessage()
+        self.assertTrue(line.startswith("request_timing "))
+        record = json.loads(line[len("request_timing ") :])
+        self.assertEqual(record["path"], "/api/items")
+        self.assertEqual(record["status"], 200)
+        self.assertEqual(record["db_queries"], 1)
+        self.assertIn("auth", record["phases_ms"])
+
+    def test_async_requests_are_timed(self):
+        async def async_view(request):
+            with timed_phase("ratelimit"):
+                pass
+            return HttpResponse("ok")
+
+        middleware = ServerTimingMiddleware(async_view)
+        response = async_to_sync(middleware)(self.request)
+
+        self.assertIn("ratelimit;dur=", response["Server-Timing"])
+
+    @override_settings(REQUEST_TIMING_HEADER=False)
+    def test_header_is_optional(self):
+        response = ServerTimingMiddleware(view)(self.request)
+
+        self.assertFalse(response.has_header("Server-Timing"))
+
+    @override_settings(REQUEST_TIMING_ENABLED=False)
+    def test_disabled_middleware_is_not_used(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            ServerTimingMiddleware(view)
+
+    def test_slow_sampled_requests_are_profiled(self):
+        with tempfile.TemporaryDirectory() as profile_dir, override_settings(
+            REQUEST_PROFILE_SAMPLE_RATE=1.0,
+            REQUEST_PROFILE_THRESHOLD_MS=0,
+            REQUEST_PROFILE_DIR=profile_dir,
+        ), patch("minNow.middleware.cProfile.Profile") as profile:
+            profile.return_value.dump_stats.side_effect = lambda path: open(
+                path, "w"
+            ).close()
+            with self.assertLogs("minNow.timing", level="INFO") as logs:
+                ServerTimingMiddleware(view)(self.request)
+
+            record = json.loads(logs.records[0].getMessage()[len("request_timing ") :])
+            self.assertTrue(record["profile"].endswith("-GET-api_items.prof"))
+            self.assertTrue(os.path.exists(record["profile"]))
+            profile.return_value.enable.assert_called_once()
+            profile.return_value.disable.assert_called_once()
+
+
+class MiddlewareOrderTest(SimpleTestCase):
+    def test_whitenoise_follows_security_middleware_once(self):
+        middleware = settings.MIDDLEWARE
+
+        self.assertEqual(middleware[0], "minNow.middleware.ServerTimingMiddleware")
+        self.assertEqual(middleware.count("whitenoise.middleware.WhiteNoiseMiddleware"), 1)
+        self.assertEqual(
+            middleware.index("whitenoise.middleware.WhiteNoiseMiddleware"),
+            middleware.index("django.middleware.security.SecurityMiddleware") + 1,
+        )
@@ -0,0 +1,100 @@
+"""
+Tests for the orjson API renderer and the serialization benchmark.
+"""
+
+import json
+import uuid
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from ninja import Schema
+from ninja.renderers import JSONRenderer
+from minNow.renderers import ORJSONRenderer, dumps
+from items.api import OwnedItemSchema
+from items.management.commands.benchmark_serialization import build_items
+
+
+class Badge(Schema):
+    tier: str
+    progress: float
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    def render(self, renderer, data):
+        return renderer.render(None, data, response_status=200)
+
+    def test_matches_the_default_renderer(self):
+        data = {
+            "id": uuid.uuid4(),
+            "received": datetime(2025, 6, 15, 10, 30, tzinfo=dt_timezone.utc),
+            "price": Decimal("9.99"),
+            "badge": Badge(tier="gold", progress=0.5),
+            "emoji": "🧥",
+        }
+
+        self.assertEqual(
+            json.loads(self.render(ORJSONRenderer(), data)),
+            json.loads(self.render(JSONRenderer(), data)),
+        )
+
+    def test_utc_datetimes_use_z_suffix(self):
+        body = self.render(
+            ORJSONRenderer(), [datetime(2025, 6, 15, 10, 30, tzinfo=dt_timezone.utc)]
+        )
+
+        self.assertEqual(body, b'["2025-06-15T10:30:00Z"]')
+
+    def test_datetimes_are_truncated_to_milliseconds(self):
+        data = {
+            "updated_at": datetime(
+                2025, 6, 15, 10, 30, 0, 123456, tzinfo=dt_timezone.utc
+            )
+        }
+
+        body = self.render(ORJSONRenderer(), data)
+
+        self.assertEqual(body, b'{"updated_at":"2025-06-15T10:30:00.123Z"}')
+        self.assertEqual(json.loads(body), json.loads(self.render(JSONRenderer(), data)))
+
+
+class OwnedItemFastPathParityTest(SimpleTestCase):
+    def assert_parity(self, item):
+        fast = OwnedItemSchema.dict_from_orm(item)
+        schema = OwnedItemSchema.from_orm(item)
+
+        self.assertEqual(list(fast), list(OwnedItemSchema.model_fields))
+        self.assertEqual(json.loads(dumps(fast)), json.loads(schema.model_dump_json()))
+
+    def test_matches_schema_output(self):
+        for item in build_items(20):
+            self.assert_parity(item)
+
+    def test_matches_schema_output_for_edge_cases(self):
+        item = build_items(1)[0]
+        # No goal (progress is 1.0) and an item received in the future
+        item.ownership_duration_goal_months = 0
+        self.assert_parity(item)
+        item.item_received_date = datetime(2999, 1, 1, tzinfo=dt_timezone.utc)
+        self.assert_parity(item)
+
+    def test_list_path_matches_per_item_path(self):
+        items = build_items(10)
+
+        self.assertEqual(
+            dumps(OwnedItemSchema.dicts_from_orm(items)),
+            dumps([OwnedItemSchema.dict_from_orm(item) for item in items]),
+        )
+
+
+class BenchmarkSerializationCommandTest(SimpleTestCase):
+    def test_all_pipelines_match_the_baseline(self):
+        out = StringIO()
+        call_command("benchmark_serialization", items=5, iterations=2, json=True, stdout=out)
+
+        report = json.loads(out.getvalue())
+        self.assertGreaterEqual(len(report["pipelines"]), 2)
+        for pipeline in report["pipelines"]:
+            self.assertTrue(pipeline["matches_baseline"], pipeline["pipeline"])
@@ -0,0 +1,31 @@
+"""
+Tests for lazy loading of the add-item agent and the startup benchmark.
+"""
+
+from django.test import SimpleTestCase
+import items.api
+from items.management.commands.benchmark_startup import parse_importtime
+
+
+class LazyAgentImportTest(SimpleTestCase):
+    def test_api_module_does_not_bind_the_agent(self):
+        self.assertNotIn("run_agent", vars(items.api))
+
+
+class ParseImporttimeTest(SimpleTestCase):
+    def test_parses_cumulative_times_and_nesting(self):
+        stderr = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       295 |        295 |       _json",
+                "import time:       472 |       9975 |   json.decoder",
+                "import time:       271 |      10872 | json",
+            ]
+        )
+
+        imports = parse_importtime(stderr)
+
+        self.assertEqual(
+            imports,
+            [(295, "       _json"), (9975, "   json.decoder"), (10872, " json")],
+        )
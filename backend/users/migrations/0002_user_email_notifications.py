@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='email_notifications',
+            field=models.BooleanField(blank=True, default=None, null=True),
+        ),
+    ]
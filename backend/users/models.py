@@ -10,6 +10,8 @@ from django.db import models
 # Do I really need a users table when using clerk
 class User(AbstractUser):
     clerk_id = models.CharField(max_length=255, unique=True, null=True, blank=True)
+    # Mirrors Clerk unsafe_metadata.emailNotifications; null until first synced
+    email_notifications = models.BooleanField(null=True, blank=True, default=None)
 
     # Add related_name to avoid clashes with auth.User
     groups = models.ManyToManyField(